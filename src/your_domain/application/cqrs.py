@@ -1,5 +1,6 @@
+import inspect
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Sequence, TypeVar
 
 C = TypeVar("C")
 R = TypeVar("R")
@@ -38,3 +39,120 @@ class GetUserQueryHandler(QueryHandler[Any]):
     def handle(self, query: GetUserQuery) -> Any:
         # Implement the logic to get a user
         pass
+
+# A middleware receives the message and the next step of the pipeline, and returns its result.
+Middleware = Callable[[Any, Callable[[Any], Any]], Any]
+AsyncMiddleware = Callable[[Any, Callable[[Any], Awaitable[Any]]], Awaitable[Any]]
+
+class HandlerNotFoundError(LookupError):
+    """Raised when a message is dispatched that has no registered handler."""
+
+class _MessageBus:
+    """
+    Registry of one handler per message type, each behind a middleware pipeline.
+
+    The pipeline for a type is compiled into a single callable when the handler is
+    registered (and recompiled when middleware is added), so dispatch is one dict
+    lookup and one call regardless of how many types are registered.
+    """
+    def __init__(self, middlewares: Sequence[Any] = ()) -> None:
+        """
+        Args:
+            middlewares (Sequence): Outermost first; each wraps the ones after it and the handler.
+        """
+        self._middlewares: List[Any] = list(middlewares)
+        self._handlers: Dict[type, Any] = {}
+        self._pipelines: Dict[type, Callable[[Any], Any]] = {}
+
+    def register(self, message_type: type, handler: Any) -> None:
+        """
+        Registers the handler for a message type.
+
+        Raises:
+            ValueError: If the type already has a handler.
+        """
+        if message_type in self._handlers:
+            raise ValueError(f"{message_type.__name__} already has a handler")
+        self._handlers[message_type] = handler
+        self._pipelines[message_type] = self._compile(handler)
+
+    def add_middleware(self, middleware: Any) -> None:
+        """Appends a middleware innermost (closest to the handlers) and recompiles every pipeline."""
+        self._middlewares.append(middleware)
+        self._pipelines = {message_type: self._compile(handler) for message_type, handler in self._handlers.items()}
+
+    def _compile(self, handler: Any) -> Callable[[Any], Any]:
+        pipeline = self._terminal(handler)
+        for middleware in reversed(self._middlewares):
+            pipeline = _bind(middleware, pipeline)
+        return pipeline
+
+    def _terminal(self, handler: Any) -> Callable[[Any], Any]:
+        return handler.handle
+
+    def _pipeline_for(self, message: Any) -> Callable[[Any], Any]:
+        try:
+            return self._pipelines[type(message)]
+        except KeyError:
+            raise HandlerNotFoundError(f"No handler registered for {type(message).__name__}") from None
+
+def _bind(middleware: Any, next_step: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def step(message: Any) -> Any:
+        return middleware(message, next_step)
+    return step
+
+class CommandBus(_MessageBus):
+    """Dispatches each command to its single CommandHandler through the middleware pipeline."""
+    def dispatch(self, command: Command) -> Any:
+        """
+        Handles a command.
+
+        Raises:
+            HandlerNotFoundError: If no handler is registered for the command's type.
+        """
+        return self._pipeline_for(command)(command)
+
+class QueryBus(_MessageBus):
+    """Dispatches each query to its single QueryHandler through the middleware pipeline."""
+    def ask(self, query: Query) -> Any:
+        """
+        Handles a query and returns its result.
+
+        Raises:
+            HandlerNotFoundError: If no handler is registered for the query's type.
+        """
+        return self._pipeline_for(query)(query)
+
+class _AsyncMessageBus(_MessageBus):
+    """
+    asyncio variant of _MessageBus. Middlewares are coroutines taking
+    ``(message, next)``; handlers may have a sync or an ``async def handle``.
+    """
+    def _terminal(self, handler: Any) -> Callable[[Any], Awaitable[Any]]:
+        handle = handler.handle
+        if inspect.iscoroutinefunction(handle):
+            return handle
+
+        async def call_sync(message: Any) -> Any:
+            return handle(message)
+        return call_sync
+
+class AsyncCommandBus(_AsyncMessageBus):
+    async def dispatch(self, command: Command) -> Any:
+        """
+        Handles a command.
+
+        Raises:
+            HandlerNotFoundError: If no handler is registered for the command's type.
+        """
+        return await self._pipeline_for(command)(command)
+
+class AsyncQueryBus(_AsyncMessageBus):
+    async def ask(self, query: Query) -> Any:
+        """
+        Handles a query and returns its result.
+
+        Raises:
+            HandlerNotFoundError: If no handler is registered for the query's type.
+        """
+        return await self._pipeline_for(query)(query)
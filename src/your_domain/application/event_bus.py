@@ -1,5 +1,6 @@
+import inspect
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, List, Type
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type
 
 class Event:
     pass
@@ -9,6 +10,29 @@ class EventHandler(ABC):
     def handle(self, event: Event):
         pass
 
+    def handle_batch(self, events: List[Event]):
+        """
+        Handles several events of the same type at once. Override to do the work
+        in one round trip (one statement, one SMTP session); by default each event
+        goes to ``handle``.
+        """
+        for event in events:
+            self.handle(event)
+
+class AsyncEventHandler(ABC):
+    """Handler for an AbstractAsyncEventBus whose work is a coroutine."""
+    @abstractmethod
+    async def handle(self, event: Event):
+        pass
+
+    async def handle_batch(self, events: List[Event]):
+        """
+        Handles several events of the same type at once. Override to do the work
+        in one round trip; by default each event is awaited in turn.
+        """
+        for event in events:
+            await self.handle(event)
+
 class EventBus(ABC):
     @abstractmethod
     def publish(self, event: Event):
@@ -18,17 +42,105 @@ class EventBus(ABC):
     def subscribe(self, event_type: Type[Event], handler: EventHandler):
         pass
 
-class SimpleEventBus(EventBus):
+    def publish_many(self, events: Iterable[Event]):
+        for event in events:
+            self.publish(event)
+
+class AbstractAsyncEventBus(ABC):
+    """
+    Event bus whose ``publish`` is a coroutine. Deliberately not an EventBus, so
+    it cannot be handed to callers that publish synchronously.
+    """
+    @abstractmethod
+    async def publish(self, event: Event):
+        pass
+
+    @abstractmethod
+    def subscribe(self, event_type: Type[Event], handler: Any):
+        pass
+
+    async def publish_many(self, events: Iterable[Event]):
+        for event in events:
+            await self.publish(event)
+
+def group_by_type(events: Iterable[Event]) -> Dict[type, List[Event]]:
+    """Groups events by concrete type, keeping first-seen type order and event order within a type."""
+    groups: Dict[type, List[Event]] = {}
+    for event in events:
+        groups.setdefault(type(event), []).append(event)
+    return groups
+
+def deliver_batch(handler: EventHandler, events: List[Event]):
+    # Handlers that do not derive from EventHandler may lack handle_batch
+    handle_batch = getattr(handler, "handle_batch", None)
+    if handle_batch is not None:
+        return handle_batch(events)
+    for event in events:
+        handler.handle(event)
+
+async def deliver_batch_async(handler: Any, events: List[Event]):
+    """
+    Awaits a handler on a batch of events of one type. Accepts AsyncEventHandler
+    and EventHandler subclasses alike; an ``async def handle`` that kept the
+    synchronous ``EventHandler.handle_batch`` default is awaited per event.
+    """
+    handle_batch = getattr(type(handler), "handle_batch", None)
+    sync_default = handle_batch is EventHandler.handle_batch
+    if handle_batch is None or (sync_default and inspect.iscoroutinefunction(handler.handle)):
+        for event in events:
+            result = handler.handle(event)
+            if inspect.isawaitable(result):
+                await result
+        return
+    result = handler.handle_batch(events)
+    if inspect.isawaitable(result):
+        await result
+
+class HandlerRegistry:
+    """Subscription table shared by the sync and async buses, resolved over each event class's MRO."""
     def __init__(self):
         self._handlers: Dict[Type[Event], List[EventHandler]] = {}
+        # Handlers per concrete event type, resolved over the MRO; reset by subscribe
+        self._dispatch: Dict[type, Tuple[EventHandler, ...]] = {}
 
-    def publish(self, event: Event):
-        event_type = type(event)
-        if event_type in self._handlers:
-            for handler in self._handlers[event_type]:
-                handler.handle(event)
+    def _handlers_for(self, event_type: Type[Event]) -> Tuple[EventHandler, ...]:
+        handlers = self._dispatch.get(event_type)
+        if handlers is None:
+            handlers = self._dispatch[event_type] = self._resolve(event_type)
+        return handlers
 
-    def subscribe(self, event_type: Type[Event], handler: EventHandler):
+    def _resolve(self, event_type: Type[Event]) -> Tuple[EventHandler, ...]:
+        resolved: List[EventHandler] = []
+        seen = set()
+        for cls in event_type.__mro__:
+            for handler in self._handlers.get(cls, ()):
+                # A handler subscribed to both a class and its base runs once
+                if id(handler) not in seen:
+                    seen.add(id(handler))
+                    resolved.append(handler)
+        return tuple(resolved)
+
+    def subscribe(self, event_type: Type[Event], handler: Any):
         if event_type not in self._handlers:
             self._handlers[event_type] = []
         self._handlers[event_type].append(handler)
+        # Replace rather than clear, so a concurrent publish keeps a consistent table
+        self._dispatch = {}
+
+class SimpleEventBus(HandlerRegistry, EventBus):
+    """
+    In-process event bus. Handlers subscribed to a class also receive events of
+    its subclasses, most specific subscription first.
+    """
+    def publish(self, event: Event):
+        for handler in self._handlers_for(type(event)):
+            handler.handle(event)
+
+    def publish_many(self, events: Iterable[Event]):
+        """
+        Publishes events grouped by type: each handler receives every event of a
+        type in one ``handle_batch`` call. Order is kept within a type, not across types.
+        """
+        for event_type, batch in group_by_type(events).items():
+            for handler in self._handlers_for(event_type):
+                deliver_batch(handler, batch)
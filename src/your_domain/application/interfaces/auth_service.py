@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Any, Dict, Iterable, List, Optional, Protocol
 from your_domain.domain.entities.user import User
 
 class AuthServiceInterface(Protocol):
@@ -14,6 +14,30 @@ class AuthServiceInterface(Protocol):
         """
         ...
 
+    def generate_jwt_tokens(self, users: Iterable[User]) -> List[str]:
+        """
+        Generates JWT tokens for many users in one call.
+
+        Args:
+            users (Iterable[User]): The users for which JWTs are generated.
+
+        Returns:
+            List[str]: The generated JWT tokens, in input order.
+        """
+        ...
+
+    def decode_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Validates the provided JWT token and returns its claims.
+
+        Args:
+            token (str): The JWT token string to decode.
+
+        Returns:
+            Optional[Dict[str, Any]]: The decoded claims if the token is valid, None otherwise.
+        """
+        ...
+
     def validate_token(self, token: str) -> bool:
         """
         Validates the provided JWT token.
@@ -1,6 +1,55 @@
-from typing import Protocol
+import smtplib
+from dataclasses import dataclass
+from email.message import Message
+from typing import Protocol, Sequence
 from your_domain.domain.entities.user import User
 
+@dataclass(frozen=True)
+class OutboundEmail:
+    """A plain-text message ready to be sent."""
+    to_email: str
+    subject: str
+    body: str
+
+class EmailBatchError(smtplib.SMTPException):
+    """
+    Raised when a batch fails part way through.
+
+    Attributes:
+        sent (int): Number of messages from the start of the batch that were delivered.
+    """
+    def __init__(self, sent: int, cause: Exception) -> None:
+        super().__init__(f"Email batch failed after {sent} message(s): {cause}")
+        self.sent = sent
+
+class EmailTransportInterface(Protocol):
+    def send(self, message: Message) -> None:
+        """
+        Delivers one message.
+
+        Args:
+            message (Message): The message to deliver.
+
+        Raises:
+            smtplib.SMTPException: If the message could not be sent.
+        """
+        ...
+
+    def send_many(self, messages: Sequence[Message]) -> int:
+        """
+        Delivers messages in order.
+
+        Args:
+            messages (Sequence[Message]): The messages to deliver.
+
+        Returns:
+            int: Number of messages sent.
+
+        Raises:
+            EmailBatchError: If a message fails; ``sent`` tells how many went out before it.
+        """
+        ...
+
 class EmailServiceInterface(Protocol):
     def send_confirmation_email(self, user: User) -> None:
         """
@@ -11,11 +60,12 @@ class EmailServiceInterface(Protocol):
         """
         ...
 
-    def send_password_reset_email(self, user: User) -> None:
+    def send_password_reset_email(self, user: User, reset_token: str) -> None:
         """
         Sends a password reset email to the user.
 
         Args:
             user (User): The user for whom the password reset email is to be sent.
+            reset_token (str): Token the user presents to choose a new password.
         """
         ...
@@ -0,0 +1,21 @@
+from typing import Any, Protocol
+
+class OutboxInterface(Protocol):
+    def add(self, event: Any) -> None:
+        """
+        Records a domain event in the current transaction, to be published after it commits.
+
+        Args:
+            event (Any): The event to publish; a pydantic model.
+        """
+        ...
+
+class AsyncOutboxInterface(Protocol):
+    async def add(self, event: Any) -> None:
+        """
+        Records a domain event in the current transaction, to be published after it commits.
+
+        Args:
+            event (Any): The event to publish; a pydantic model.
+        """
+        ...
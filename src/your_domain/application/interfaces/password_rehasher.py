@@ -0,0 +1,15 @@
+from typing import Protocol
+from your_domain.domain.entities.user import User
+
+class PasswordRehasherInterface(Protocol):
+    def schedule(self, user: User, plain_text_password: str) -> None:
+        """
+        Replaces the user's stored password hash with one at the current cost, off the request path.
+
+        Called only after the password has been verified, so the plain text is known to be correct.
+
+        Args:
+            user (User): The user as loaded for the login.
+            plain_text_password (str): The verified password.
+        """
+        ...
@@ -0,0 +1,17 @@
+from typing import Protocol
+
+class RateLimiterInterface(Protocol):
+    def try_acquire(self, key: str, cost: float = 1.0) -> bool:
+        """
+        Takes ``cost`` tokens from the bucket for ``key`` if it holds enough.
+
+        Implement this over a shared store (e.g. Redis) to apply one limit across processes.
+
+        Args:
+            key (str): What is being limited, e.g. an email address or a client IP.
+            cost (float): Tokens the attempt consumes.
+
+        Returns:
+            bool: True if the attempt is allowed, False if it is over the limit.
+        """
+        ...
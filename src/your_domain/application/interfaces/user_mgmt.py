@@ -1,8 +1,11 @@
-from typing import Protocol, Optional
+from typing import Dict, Iterable, Protocol, Optional
 from uuid import UUID
 from your_domain.domain.entities.user import User
 from your_domain.domain.value_objects.email import Email
 
+class DuplicateUserError(ValueError):
+    """Raised when a write would give two users the same id or email, like the unique constraints on the users table."""
+
 class UserMgmtInterface(Protocol):
     def add(self, user: User) -> None:
         ...
@@ -15,3 +18,37 @@ class UserMgmtInterface(Protocol):
 
     def find_by_id(self, user_id: UUID) -> Optional[User]:
         ...
+
+    def add_many(self, users: Iterable[User]) -> None:
+        ...
+
+    def find_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        ...
+
+    def find_by_emails(self, emails: Iterable[Email]) -> Dict[Email, User]:
+        ...
+
+class AsyncUserMgmtInterface(Protocol):
+    async def add(self, user: User) -> None:
+        ...
+
+    async def update(self, user: User) -> None:
+        ...
+
+    async def hard_delete(self, user: User) -> None:
+        ...
+
+    async def find_by_email(self, email: Email) -> Optional[User]:
+        ...
+
+    async def find_by_id(self, user_id: UUID) -> Optional[User]:
+        ...
+
+    async def add_many(self, users: Iterable[User]) -> None:
+        ...
+
+    async def find_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        ...
+
+    async def find_by_emails(self, emails: Iterable[Email]) -> Dict[Email, User]:
+        ...
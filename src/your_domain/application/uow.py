@@ -1,7 +1,15 @@
 from abc import ABC, abstractmethod
-from sqlalchemy.orm import Session
+
+from your_domain.application.interfaces.outbox import AsyncOutboxInterface, OutboxInterface
+from your_domain.application.interfaces.user_mgmt import AsyncUserMgmtInterface, UserMgmtInterface
+
+# Use cases depend only on these abstractions; the implementations live in infrastructure
+# (infrastructure/uow.py for SQLAlchemy, InMemoryUnitOfWork next to its repository).
 
 class AbstractUnitOfWork(ABC):
+    users: UserMgmtInterface
+    outbox: OutboxInterface
+
     @abstractmethod
     def __enter__(self):
         pass
@@ -18,23 +26,22 @@ class AbstractUnitOfWork(ABC):
     def rollback(self):
         pass
 
-class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
-    def __init__(self, session_factory):
-        self.session_factory = session_factory
+class AbstractAsyncUnitOfWork(ABC):
+    users: AsyncUserMgmtInterface
+    outbox: AsyncOutboxInterface
 
-    def __enter__(self):
-        self.session = self.session_factory()
-        return self
+    @abstractmethod
+    async def __aenter__(self) -> "AbstractAsyncUnitOfWork":
+        pass
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_tb is None:
-            self.commit()
-        else:
-            self.rollback()
-        self.session.close()
+    @abstractmethod
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
 
-    def commit(self):
-        self.session.commit()
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
 
-    def rollback(self):
-        self.session.rollback()
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
@@ -1,7 +1,11 @@
+import threading
+from dataclasses import dataclass
 from pydantic import BaseModel, EmailStr, constr
 from typing import Optional
-from your_domain.application.interfaces.user_mgmt_interface import UserMgmtInterface
-from your_domain.application.interfaces.auth_service_interface import AuthServiceInterface
+from your_domain.application.interfaces.auth_service import AuthServiceInterface
+from your_domain.application.interfaces.password_rehasher import PasswordRehasherInterface
+from your_domain.application.interfaces.rate_limiter import RateLimiterInterface
+from your_domain.application.uow import AbstractAsyncUnitOfWork, AbstractUnitOfWork
 from your_domain.domain.entities.user import User
 from your_domain.domain.value_objects.email import Email
 
@@ -19,18 +23,26 @@ class AuthenticateUser:
     """
     def __init__(
         self,
-        user_mgmt: UserMgmtInterface,
-        auth_service: AuthServiceInterface
+        uow: AbstractUnitOfWork,
+        auth_service: AuthServiceInterface,
+        rehasher: Optional[PasswordRehasherInterface] = None
     ) -> None:
         """
         Initialize the AuthenticateUser use case with required dependencies.
 
         Args:
-            user_mgmt (UserMgmtInterface): Interface for user management operations.
+            uow (AbstractUnitOfWork): Unit of work providing the user repository.
             auth_service (AuthServiceInterface): Service for providing JWT token generation.
+            rehasher (Optional[PasswordRehasherInterface]): Moves hashes created with another
+                BCrypt cost to the configured one after a successful login.
         """
-        self.user_mgmt = user_mgmt
+        self.uow = uow
         self.auth_service = auth_service
+        self.rehasher = rehasher
+
+    def _after_verify(self, user: User, plain_text_password: str) -> None:
+        if self.rehasher is not None and user.needs_password_rehash():
+            self.rehasher.schedule(user, plain_text_password)
 
     def execute(self, input_data: AuthenticateUserInput) -> str:
         """
@@ -46,16 +58,190 @@ class AuthenticateUser:
             ValueError: If authentication fails due to invalid credentials.
         """
         # Construct the Email value object
-        email_vo = Email(address=input_data.email)
-        # Retrieve the user based on email
-        user: Optional[User] = self.user_mgmt.find_by_email(email_vo)
+        email_vo = Email.from_string(input_data.email)
+        # Retrieve the user based on email; the transaction ends before the password check
+        with self.uow:
+            user: Optional[User] = self.uow.users.find_by_email(email_vo)
         if user is None:
             raise ValueError("Invalid credentials")
 
         # Validate the provided password against the stored password hash
         if not user.verify_password(input_data.plain_text_password):
             raise ValueError("Invalid credentials")
+        self._after_verify(user, input_data.plain_text_password)
 
         # If credentials are valid, generate and return a JWT token
         jwt_token = self.auth_service.generate_jwt_token(user)
         return jwt_token
+
+    async def execute_async(self, input_data: AuthenticateUserInput) -> str:
+        """
+        Execute the authentication process without blocking the event loop on BCrypt.
+
+        Password verification runs on the shared password hashing pool.
+
+        Args:
+            input_data (AuthenticateUserInput): Input data containing email and plain text password.
+
+        Returns:
+            str: A JWT token string if authentication is successful.
+
+        Raises:
+            ValueError: If authentication fails due to invalid credentials.
+            HashingPoolSaturatedError: If the hashing pool has no free slot in time.
+        """
+        email_vo = Email.from_string(input_data.email)
+        with self.uow:
+            user: Optional[User] = self.uow.users.find_by_email(email_vo)
+        if user is None:
+            raise ValueError("Invalid credentials")
+
+        if not await user.verify_password_async(input_data.plain_text_password):
+            raise ValueError("Invalid credentials")
+        self._after_verify(user, input_data.plain_text_password)
+
+        return self.auth_service.generate_jwt_token(user)
+
+class AsyncAuthenticateUser:
+    """
+    asyncio variant of AuthenticateUser. The user is loaded through an async unit of work
+    and the password is verified on the shared hashing pool.
+    """
+    def __init__(
+        self,
+        uow: AbstractAsyncUnitOfWork,
+        auth_service: AuthServiceInterface,
+        rehasher: Optional[PasswordRehasherInterface] = None
+    ) -> None:
+        """
+        Initialize the AsyncAuthenticateUser use case with required dependencies.
+
+        Args:
+            uow (AbstractAsyncUnitOfWork): Unit of work providing the user repository.
+            auth_service (AuthServiceInterface): Service for providing JWT token generation.
+            rehasher (Optional[PasswordRehasherInterface]): Moves hashes created with another
+                BCrypt cost to the configured one after a successful login, e.g. an
+                AsyncBackgroundPasswordRehasher.
+        """
+        self.uow = uow
+        self.auth_service = auth_service
+        self.rehasher = rehasher
+
+    async def execute(self, input_data: AuthenticateUserInput) -> str:
+        """
+        Execute the authentication process.
+
+        Args:
+            input_data (AuthenticateUserInput): Input data containing email and plain text password.
+
+        Returns:
+            str: A JWT token string if authentication is successful.
+
+        Raises:
+            ValueError: If authentication fails due to invalid credentials.
+        """
+        email_vo = Email.from_string(input_data.email)
+        async with self.uow:
+            user: Optional[User] = await self.uow.users.find_by_email(email_vo)
+        if user is None:
+            raise ValueError("Invalid credentials")
+
+        # Verify after the unit of work is closed so no connection is held while hashing
+        if not await user.verify_password_async(input_data.plain_text_password):
+            raise ValueError("Invalid credentials")
+        if self.rehasher is not None and user.needs_password_rehash():
+            self.rehasher.schedule(user, input_data.plain_text_password)
+
+        return self.auth_service.generate_jwt_token(user)
+
+class LoginThrottledError(ValueError):
+    """Raised when a login attempt is rejected by the throttle before any password hashing."""
+
+@dataclass
+class ThrottleStats:
+    """
+    Counters reported by ThrottledAuthenticateUser. Every rejected attempt is a
+    BCrypt verification that was not run.
+    """
+    allowed: int = 0
+    rejected_by_client: int = 0
+    rejected_by_email: int = 0
+
+    @property
+    def rejected(self) -> int:
+        return self.rejected_by_client + self.rejected_by_email
+
+class ThrottledAuthenticateUser:
+    """
+    Login throttle in front of AuthenticateUser.
+
+    Each attempt takes a token from the bucket of the client (e.g. its IP) and
+    from the bucket of the target email; an attempt over either limit is rejected
+    before the user is loaded or any password is hashed, so a credential-stuffing
+    burst costs a dict lookup per attempt instead of a BCrypt verification.
+    """
+    def __init__(
+        self,
+        inner: AuthenticateUser,
+        email_limiter: RateLimiterInterface,
+        client_limiter: Optional[RateLimiterInterface] = None
+    ) -> None:
+        """
+        Initialize the throttle.
+
+        Args:
+            inner (AuthenticateUser): The use case being protected.
+            email_limiter (RateLimiterInterface): Limits attempts per target email.
+            client_limiter (Optional[RateLimiterInterface]): Limits attempts per client key.
+        """
+        self.inner = inner
+        self.email_limiter = email_limiter
+        self.client_limiter = client_limiter
+        self.stats = ThrottleStats()
+        # Attempts are admitted from many request threads at once
+        self._stats_lock = threading.Lock()
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    def _admit(self, input_data: AuthenticateUserInput, client_key: Optional[str]) -> None:
+        # Client first: a client spraying many emails should not drain every email's bucket
+        if self.client_limiter is not None and client_key is not None:
+            if not self.client_limiter.try_acquire(f"client:{client_key}"):
+                self._count("rejected_by_client")
+                raise LoginThrottledError("Too many login attempts")
+        if not self.email_limiter.try_acquire(f"email:{str(input_data.email).casefold()}"):
+            self._count("rejected_by_email")
+            raise LoginThrottledError("Too many login attempts")
+        self._count("allowed")
+
+    def execute(self, input_data: AuthenticateUserInput, client_key: Optional[str] = None) -> str:
+        """
+        Authenticate unless the client or the email is over its attempt limit.
+
+        Args:
+            input_data (AuthenticateUserInput): Input data containing email and plain text password.
+            client_key (Optional[str]): Identifies the caller, e.g. its IP address.
+
+        Returns:
+            str: A JWT token string if authentication is successful.
+
+        Raises:
+            LoginThrottledError: If the attempt is over a limit.
+            ValueError: If authentication fails due to invalid credentials.
+        """
+        self._admit(input_data, client_key)
+        return self.inner.execute(input_data)
+
+    async def execute_async(self, input_data: AuthenticateUserInput, client_key: Optional[str] = None) -> str:
+        """
+        Same as execute(), verifying the password on the shared hashing pool.
+
+        Raises:
+            LoginThrottledError: If the attempt is over a limit.
+            ValueError: If authentication fails due to invalid credentials.
+            HashingPoolSaturatedError: If the hashing pool has no free slot in time.
+        """
+        self._admit(input_data, client_key)
+        return await self.inner.execute_async(input_data)
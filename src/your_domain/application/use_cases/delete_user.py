@@ -2,7 +2,7 @@ from uuid import UUID
 from typing import Optional
 from pydantic import BaseModel
 
-from your_domain.application.interfaces.user_mgmt_interface import UserMgmtInterface
+from your_domain.application.uow import AbstractAsyncUnitOfWork, AbstractUnitOfWork
 from your_domain.domain.entities.user import User
 
 class DeleteUserInput(BaseModel):
@@ -28,14 +28,14 @@ class DeleteUser:
     Note: The User entity and the repository must be extended to support soft deletion
     (e.g., adding a 'is_deleted' flag) and hard deletion (e.g., a dedicated delete method).
     """
-    def __init__(self, user_mgmt: UserMgmtInterface) -> None:
+    def __init__(self, uow: AbstractUnitOfWork) -> None:
         """
-        Initialize the DeleteUser use case with the user management interface.
+        Initialize the DeleteUser use case with a unit of work.
 
         Args:
-            user_mgmt (UserMgmtInterface): Interface for user management operations.
+            uow (AbstractUnitOfWork): Unit of work providing the user repository.
         """
-        self.user_mgmt = user_mgmt
+        self.uow = uow
 
     def execute(self, input_data: DeleteUserInput) -> None:
         """
@@ -47,22 +47,55 @@ class DeleteUser:
         Raises:
             ValueError: If the user does not exist.
         """
-        user: Optional[User] = self.user_mgmt.find_by_id(input_data.user_id)
-        if user is None:
-            raise ValueError("User not found")
-
-        if input_data.hard_delete:
-            # Hard deletion: permanently remove the user from the database.
-            # NOTE: Ensure that the UserMgmtInterface and its repository implementation
-            # provide a method for hard deletion (e.g., delete(user) or delete_by_id(user_id)).
-            # Here we assume such a method exists as self.user_mgmt.hard_delete(user)
-            if hasattr(self.user_mgmt, "hard_delete"):
-                self.user_mgmt.hard_delete(user)
+        with self.uow:
+            user: Optional[User] = self.uow.users.find_by_id(input_data.user_id)
+            if user is None:
+                raise ValueError("User not found")
+
+            if input_data.hard_delete:
+                # Hard deletion: permanently remove the user from the database.
+                # NOTE: Ensure that the UserMgmtInterface and its repository implementation
+                # provide a method for hard deletion (e.g., delete(user) or delete_by_id(user_id)).
+                # Here we assume such a method exists as self.uow.users.hard_delete(user)
+                if hasattr(self.uow.users, "hard_delete"):
+                    self.uow.users.hard_delete(user)
+                else:
+                    raise NotImplementedError("Hard delete operation is not implemented in the repository")
+            else:
+                # Soft deletion: mark the user as deleted.
+                user.is_deleted = True
+                self.uow.users.update(user)
+
+class AsyncDeleteUser:
+    """
+    asyncio variant of DeleteUser backed by an async unit of work.
+    """
+    def __init__(self, uow: AbstractAsyncUnitOfWork) -> None:
+        """
+        Initialize the AsyncDeleteUser use case with an async unit of work.
+
+        Args:
+            uow (AbstractAsyncUnitOfWork): Unit of work providing the user repository.
+        """
+        self.uow = uow
+
+    async def execute(self, input_data: DeleteUserInput) -> None:
+        """
+        Execute the deletion process.
+
+        Args:
+            input_data (DeleteUserInput): Data required for deletion.
+
+        Raises:
+            ValueError: If the user does not exist.
+        """
+        async with self.uow:
+            user: Optional[User] = await self.uow.users.find_by_id(input_data.user_id)
+            if user is None:
+                raise ValueError("User not found")
+
+            if input_data.hard_delete:
+                await self.uow.users.hard_delete(user)
             else:
-                raise NotImplementedError("Hard delete operation is not implemented in the repository")
-        else:
-            # Soft deletion: mark the user as deleted.
-            # NOTE: The User entity should have an 'is_deleted' attribute or similar.
-            # For demonstration purposes, we set an imaginary 'is_deleted' attribute.
-            user.is_deleted = True  # This requires the User model to include this field.
-            self.user_mgmt.update(user)
+                user.is_deleted = True
+                await self.uow.users.update(user)
@@ -1,10 +1,27 @@
-from typing import Callable
 from pydantic import BaseModel, EmailStr, constr
 from your_domain.domain.entities.user import User
-from src.your_domain.application.interfaces.user_mgmt import UserMgmtInterface
-from src.your_domain.domain.events.user_registered import UserRegisteredEvent
+from your_domain.application.interfaces.user_mgmt import UserMgmtInterface
+from your_domain.application.uow import AbstractAsyncUnitOfWork, AbstractUnitOfWork
+from your_domain.domain.events.user_registered import UserRegisteredEvent
 from your_domain.domain.value_objects.email import Email
 
+def _registered_event(user: User) -> UserRegisteredEvent:
+    # In a real system, 'confirmation_token' should be securely generated.
+    confirmation_token = "dummy-token"
+    return UserRegisteredEvent(
+        user_id=user.id,
+        email=user.email.address,
+        registered_at=user.created_at,
+        confirmation_token=confirmation_token
+    )
+
+def _email_taken(users: UserMgmtInterface, email: Email) -> bool:
+    # Repositories with a cheap pre-check (EmailFilteredUserMgmt) skip the query for definite misses
+    possibly_taken = getattr(users, "is_email_possibly_taken", None)
+    if possibly_taken is not None and not possibly_taken(email):
+        return False
+    return users.find_by_email(email) is not None
+
 class RegisterUserInput(BaseModel):
     """
     Input data for registering a user.
@@ -15,22 +32,16 @@ class RegisterUserInput(BaseModel):
 class RegisterUser:
     """
     Use case that validates input, checks for uniqueness,
-    persists a new user and triggers a UserRegisteredEvent.
+    persists a new user and records a UserRegisteredEvent in the outbox.
     """
-    def __init__(
-        self,
-        user_mgmt: UserMgmtInterface,
-        event_publisher: Callable[[UserRegisteredEvent], None]
-    ) -> None:
+    def __init__(self, uow: AbstractUnitOfWork) -> None:
         """
         Initialize the RegisterUser use case with required dependencies.
 
         Args:
-            user_mgmt (UserMgmtInterface): Interface for user management operations.
-            event_publisher (Callable[[UserRegisteredEvent], None]): Callable to publish events.
+            uow (AbstractUnitOfWork): Unit of work providing the user repository and outbox.
         """
-        self.user_mgmt = user_mgmt
-        self.event_publisher = event_publisher
+        self.uow = uow
 
     def execute(self, input_data: RegisterUserInput) -> User:
         """
@@ -45,26 +56,93 @@ class RegisterUser:
         Raises:
             ValueError: If a user with the provided email already exists.
         """
-        # Validate uniqueness by creating an Email value object
-        email_vo = Email(address=input_data.email)
-        if self.user_mgmt.find_by_email(email_vo) is not None:
-            raise ValueError(f"User with email {input_data.email} already exists")
+        email_vo = Email.from_string(input_data.email)
+
+        # Reject duplicates before paying for a BCrypt hash
+        with self.uow:
+            if _email_taken(self.uow.users, email_vo):
+                raise ValueError(f"User with email {input_data.email} already exists")
 
-        # Create the user entity via the domain factory method
+        # Create the user entity via the domain factory method. Hashing happens between the
+        # transactions so no connection is held while BCrypt runs.
         user = User.create(input_data.email, input_data.plain_text_password)
 
-        # Persist the user using the User Management Interface
-        self.user_mgmt.add(user)
-
-        # Trigger a domain event to allow for email confirmation processing
-        # In a real system, 'confirmation_token' should be securely generated.
-        confirmation_token = "dummy-token"
-        event = UserRegisteredEvent(
-            user_id=user.id,
-            email=user.email.address,
-            registered_at=user.created_at,
-            confirmation_token=confirmation_token
-        )
-        self.event_publisher(event)
+        # Persist the user and record the event in a single transaction. A registration racing
+        # this one is caught by the unique constraint, which the repository raises as
+        # DuplicateUserError (a ValueError). The event reaches the event bus through the
+        # OutboxRelay, outside the request path.
+        with self.uow:
+            self.uow.users.add(user)
+            self.uow.outbox.add(_registered_event(user))
+
+        return user
+
+    async def execute_async(self, input_data: RegisterUserInput) -> User:
+        """
+        Execute the registration process, hashing the password on the shared hashing pool.
+
+        Args:
+            input_data (RegisterUserInput): Input data containing email and password.
+
+        Returns:
+            User: The newly created user.
+
+        Raises:
+            ValueError: If a user with the provided email already exists.
+            HashingPoolSaturatedError: If the hashing pool has no free slot in time.
+        """
+        email_vo = Email.from_string(input_data.email)
+        with self.uow:
+            if _email_taken(self.uow.users, email_vo):
+                raise ValueError(f"User with email {input_data.email} already exists")
+
+        user = await User.create_async(input_data.email, input_data.plain_text_password)
+
+        with self.uow:
+            self.uow.users.add(user)
+            self.uow.outbox.add(_registered_event(user))
+
+        return user
+
+class AsyncRegisterUser:
+    """
+    asyncio variant of RegisterUser backed by an async unit of work.
+    """
+    def __init__(self, uow: AbstractAsyncUnitOfWork) -> None:
+        """
+        Initialize the AsyncRegisterUser use case with required dependencies.
+
+        Args:
+            uow (AbstractAsyncUnitOfWork): Unit of work providing the user repository and outbox.
+        """
+        self.uow = uow
+
+    async def execute(self, input_data: RegisterUserInput) -> User:
+        """
+        Execute the registration process.
+
+        Args:
+            input_data (RegisterUserInput): Input data containing email and password.
+
+        Returns:
+            User: The newly created user.
+
+        Raises:
+            ValueError: If a user with the provided email already exists.
+        """
+        email_vo = Email.from_string(input_data.email)
+
+        # Reject duplicates before paying for a BCrypt hash
+        async with self.uow:
+            if await self.uow.users.find_by_email(email_vo) is not None:
+                raise ValueError(f"User with email {input_data.email} already exists")
+
+        # Hash between the transactions so no connection is held while hashing.
+        # A racing registration is caught by the unique constraint (DuplicateUserError).
+        user = await User.create_async(input_data.email, input_data.plain_text_password)
+
+        async with self.uow:
+            await self.uow.users.add(user)
+            await self.uow.outbox.add(_registered_event(user))
 
         return user
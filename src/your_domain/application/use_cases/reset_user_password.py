@@ -1,8 +1,9 @@
+import asyncio
 import secrets
 from pydantic import BaseModel, EmailStr
 from typing import Optional
-from your_domain.application.interfaces.user_mgmt_interface import UserMgmtInterface
-from your_domain.application.interfaces.email_service_interface import EmailServiceInterface
+from your_domain.application.interfaces.email_service import EmailServiceInterface
+from your_domain.application.uow import AbstractAsyncUnitOfWork, AbstractUnitOfWork
 from your_domain.domain.entities.user import User
 from your_domain.domain.value_objects.email import Email
 
@@ -22,17 +23,17 @@ class ResetPassword:
     """
     def __init__(
         self,
-        user_mgmt: UserMgmtInterface,
+        uow: AbstractUnitOfWork,
         email_service: EmailServiceInterface
     ) -> None:
         """
         Initialize the ResetPassword use case with required dependencies.
 
         Args:
-            user_mgmt (UserMgmtInterface): Interface for user management operations.
+            uow (AbstractUnitOfWork): Unit of work providing the user repository.
             email_service (EmailServiceInterface): Service to send emails.
         """
-        self.user_mgmt = user_mgmt
+        self.uow = uow
         self.email_service = email_service
 
     def execute(self, input_data: ResetPasswordInput) -> str:
@@ -49,10 +50,11 @@ class ResetPassword:
             ValueError: If no user exists with the provided email.
         """
         # Create the Email value object from the provided email string
-        email_vo = Email(address=input_data.email)
+        email_vo = Email.from_string(input_data.email)
 
         # Retrieve the user based on email
-        user: Optional[User] = self.user_mgmt.find_by_email(email_vo)
+        with self.uow:
+            user: Optional[User] = self.uow.users.find_by_email(email_vo)
         if user is None:
             raise ValueError("User with the provided email does not exist.")
 
@@ -60,9 +62,52 @@ class ResetPassword:
         reset_token = secrets.token_urlsafe(32)
 
         # Send password reset email including the reset token.
-        # Note: This assumes that the implementation of send_password_reset_email
-        # has been adapted to accept a reset token parameter.
         self.email_service.send_password_reset_email(user, reset_token)
 
         # In a real application, you would store the reset token for later verification.
         return reset_token
+
+class AsyncResetPassword:
+    """
+    asyncio variant of ResetPassword backed by an async unit of work.
+    """
+    def __init__(
+        self,
+        uow: AbstractAsyncUnitOfWork,
+        email_service: EmailServiceInterface
+    ) -> None:
+        """
+        Initialize the AsyncResetPassword use case with required dependencies.
+
+        Args:
+            uow (AbstractAsyncUnitOfWork): Unit of work providing the user repository.
+            email_service (EmailServiceInterface): Service to send emails.
+        """
+        self.uow = uow
+        self.email_service = email_service
+
+    async def execute(self, input_data: ResetPasswordInput) -> str:
+        """
+        Execute the password reset process.
+
+        Args:
+            input_data (ResetPasswordInput): Input data containing the user's email.
+
+        Returns:
+            str: The generated password reset token.
+
+        Raises:
+            ValueError: If no user exists with the provided email.
+        """
+        email_vo = Email.from_string(input_data.email)
+        async with self.uow:
+            user: Optional[User] = await self.uow.users.find_by_email(email_vo)
+        if user is None:
+            raise ValueError("User with the provided email does not exist.")
+
+        reset_token = secrets.token_urlsafe(32)
+
+        # The email service is blocking, so run it in a worker thread
+        await asyncio.to_thread(self.email_service.send_password_reset_email, user, reset_token)
+
+        return reset_token
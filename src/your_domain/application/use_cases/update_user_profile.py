@@ -2,7 +2,7 @@ from uuid import UUID
 from typing import Optional
 from pydantic import BaseModel, EmailStr, constr
 
-from your_domain.application.interfaces.user_mgmt_interface import UserMgmtInterface
+from your_domain.application.uow import AbstractAsyncUnitOfWork, AbstractUnitOfWork
 from your_domain.domain.entities.user import User
 from your_domain.domain.value_objects.email import Email
 from your_domain.domain.value_objects.password_hash import PasswordHash
@@ -25,14 +25,14 @@ class UpdateUserProfile:
     Use case for updating user details. It retrieves a user, validates new input,
     checks for uniqueness if email is updated, and persists the modified user.
     """
-    def __init__(self, user_mgmt: UserMgmtInterface) -> None:
+    def __init__(self, uow: AbstractUnitOfWork) -> None:
         """
-        Initialize the use case with a user management interface.
+        Initialize the use case with a unit of work.
 
         Args:
-            user_mgmt (UserMgmtInterface): Interface for user management operations.
+            uow (AbstractUnitOfWork): Unit of work providing the user repository.
         """
-        self.user_mgmt = user_mgmt
+        self.uow = uow
 
     def execute(self, input_data: UpdateUserProfileInput) -> User:
         """
@@ -47,25 +47,113 @@ class UpdateUserProfile:
         Raises:
             ValueError: If the user does not exist or the new email is already in use.
         """
-        # Retrieve the user from the repository
-        user = self.user_mgmt.find_by_id(input_data.user_id)
-        if user is None:
-            raise ValueError("User not found")
-
-        # If new email is provided, validate and check for uniqueness
-        if input_data.new_email:
-            new_email_vo = Email(address=input_data.new_email)
-            # Check if any other user is already using this email
-            existing_user = self.user_mgmt.find_by_email(new_email_vo)
-            if existing_user and existing_user.id != user.id:
-                raise ValueError("Email already taken by another user")
-            user.email = new_email_vo
-
-        # If new password is provided, generate a new password hash and update the user
+        # If new password is provided, generate the new password hash between the
+        # transactions so no connection is held while BCrypt runs
+        new_password_hash: Optional[PasswordHash] = None
         if input_data.new_plain_text_password:
+            self._ensure_exists(input_data.user_id)
             new_password_hash = PasswordHash.create(input_data.new_plain_text_password)
-            user.password_hash = new_password_hash
+        return self._apply(input_data, new_password_hash)
 
-        # Persist the updated user details
-        self.user_mgmt.update(user)
+    async def execute_async(self, input_data: UpdateUserProfileInput) -> User:
+        """
+        Execute the update user profile use case, hashing a new password on the shared hashing pool.
+
+        Args:
+            input_data (UpdateUserProfileInput): Input data containing the user ID and new details.
+
+        Returns:
+            User: The updated user.
+
+        Raises:
+            ValueError: If the user does not exist or the new email is already in use.
+            HashingPoolSaturatedError: If the hashing pool has no free slot in time.
+        """
+        new_password_hash: Optional[PasswordHash] = None
+        if input_data.new_plain_text_password:
+            self._ensure_exists(input_data.user_id)
+            new_password_hash = await PasswordHash.create_async(input_data.new_plain_text_password)
+        return self._apply(input_data, new_password_hash)
+
+    def _ensure_exists(self, user_id: UUID) -> None:
+        # Reject unknown users before paying for a BCrypt hash
+        with self.uow:
+            if self.uow.users.find_by_id(user_id) is None:
+                raise ValueError("User not found")
+
+    def _apply(self, input_data: UpdateUserProfileInput, new_password_hash: Optional[PasswordHash]) -> User:
+        # Load, validate and persist the changes in a single transaction
+        with self.uow:
+            # Retrieve the user from the repository
+            user = self.uow.users.find_by_id(input_data.user_id)
+            if user is None:
+                raise ValueError("User not found")
+
+            # If new email is provided, validate and check for uniqueness
+            if input_data.new_email:
+                new_email_vo = Email.from_string(input_data.new_email)
+                # Check if any other user is already using this email
+                existing_user = self.uow.users.find_by_email(new_email_vo)
+                if existing_user and existing_user.id != user.id:
+                    raise ValueError("Email already taken by another user")
+                user.email = new_email_vo
+
+            if new_password_hash is not None:
+                user.password_hash = new_password_hash
+
+            # Persist the updated user details
+            self.uow.users.update(user)
+        return user
+
+class AsyncUpdateUserProfile:
+    """
+    asyncio variant of UpdateUserProfile backed by an async unit of work.
+    """
+    def __init__(self, uow: AbstractAsyncUnitOfWork) -> None:
+        """
+        Initialize the use case with an async unit of work.
+
+        Args:
+            uow (AbstractAsyncUnitOfWork): Unit of work providing the user repository.
+        """
+        self.uow = uow
+
+    async def execute(self, input_data: UpdateUserProfileInput) -> User:
+        """
+        Execute the update user profile use case.
+
+        Args:
+            input_data (UpdateUserProfileInput): Input data containing the user ID and new details.
+
+        Returns:
+            User: The updated user.
+
+        Raises:
+            ValueError: If the user does not exist or the new email is already in use.
+        """
+        # Reject unknown users before paying for a hash, then hash outside the transaction
+        # so no connection is held while hashing
+        new_password_hash: Optional[PasswordHash] = None
+        if input_data.new_plain_text_password:
+            async with self.uow:
+                if await self.uow.users.find_by_id(input_data.user_id) is None:
+                    raise ValueError("User not found")
+            new_password_hash = await PasswordHash.create_async(input_data.new_plain_text_password)
+
+        async with self.uow:
+            user = await self.uow.users.find_by_id(input_data.user_id)
+            if user is None:
+                raise ValueError("User not found")
+
+            if input_data.new_email:
+                new_email_vo = Email.from_string(input_data.new_email)
+                existing_user = await self.uow.users.find_by_email(new_email_vo)
+                if existing_user and existing_user.id != user.id:
+                    raise ValueError("Email already taken by another user")
+                user.email = new_email_vo
+
+            if new_password_hash is not None:
+                user.password_hash = new_password_hash
+
+            await self.uow.users.update(user)
         return user
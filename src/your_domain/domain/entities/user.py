@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import UUID, uuid4
 from pydantic import BaseModel, Field
 from your_domain.domain.value_objects.email import Email
@@ -8,17 +8,32 @@ class User(BaseModel):
     id: UUID = Field(default_factory=uuid4)
     email: Email
     password_hash: PasswordHash
-    created_at: datetime = Field(default_factory=lambda: datetime.now(datetime.timezone.utc))
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    is_deleted: bool = False
 
     @classmethod
     def create(cls, email: str, plain_text_password: str) -> "User":
         # Create value objects from the provided parameters
-        email_obj = Email(address=email)
+        email_obj = Email.from_string(email)
         password_hash_obj = PasswordHash.create(plain_text_password)
         return cls(email=email_obj, password_hash=password_hash_obj)
 
+    @classmethod
+    async def create_async(cls, email: str, plain_text_password: str) -> "User":
+        # Same as create(), but hashes the password on the hashing pool
+        email_obj = Email.from_string(email)
+        password_hash_obj = await PasswordHash.create_async(plain_text_password)
+        return cls(email=email_obj, password_hash=password_hash_obj)
+
     def verify_password(self, plain_text_password: str) -> bool:
         return self.password_hash.verify(plain_text_password)
 
+    async def verify_password_async(self, plain_text_password: str) -> bool:
+        return await self.password_hash.verify_async(plain_text_password)
+
+    def needs_password_rehash(self) -> bool:
+        # True when the stored hash's cost differs from the configured one
+        return self.password_hash.needs_rehash()
+
     class Config:
         arbitrary_types_allowed = True
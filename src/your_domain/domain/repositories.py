@@ -65,6 +65,9 @@ class CommentRepository(ABC):
     def delete(self, comment_id: int) -> None:
         pass
 
+# The SqlAlchemy* repositories only flush their changes. Run them inside a
+# SqlAlchemyUnitOfWork (infrastructure/uow.py), which owns the commit.
+
 class SqlAlchemyUserRepository(UserRepository):
     def __init__(self, session):
         self.session = session
@@ -77,17 +80,17 @@ class SqlAlchemyUserRepository(UserRepository):
 
     def add(self, user: User) -> None:
         self.session.add(user)
-        self.session.commit()
+        self.session.flush()
 
     def update(self, user: User) -> None:
         self.session.merge(user)
-        self.session.commit()
+        self.session.flush()
 
     def delete(self, user_id: int) -> None:
         user = self.get_by_id(user_id)
         if user:
             self.session.delete(user)
-            self.session.commit()
+            self.session.flush()
 
 class SqlAlchemyPostRepository(PostRepository):
     def __init__(self, session):
@@ -101,17 +104,17 @@ class SqlAlchemyPostRepository(PostRepository):
 
     def add(self, post: Post) -> None:
         self.session.add(post)
-        self.session.commit()
+        self.session.flush()
 
     def update(self, post: Post) -> None:
         self.session.merge(post)
-        self.session.commit()
+        self.session.flush()
 
     def delete(self, post_id: int) -> None:
         post = self.get_by_id(post_id)
         if post:
             self.session.delete(post)
-            self.session.commit()
+            self.session.flush()
 
 class SqlAlchemyCommentRepository(CommentRepository):
     def __init__(self, session):
@@ -125,14 +128,14 @@ class SqlAlchemyCommentRepository(CommentRepository):
 
     def add(self, comment: Comment) -> None:
         self.session.add(comment)
-        self.session.commit()
+        self.session.flush()
 
     def update(self, comment: Comment) -> None:
         self.session.merge(comment)
-        self.session.commit()
+        self.session.flush()
 
     def delete(self, comment_id: int) -> None:
         comment = self.get_by_id(comment_id)
         if comment:
             self.session.delete(comment)
-            self.session.commit()
+            self.session.flush()
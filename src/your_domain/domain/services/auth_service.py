@@ -1,7 +1,14 @@
+import base64
 import datetime
-from typing import Any
+import hashlib
+import hmac
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 import jwt  # PyJWT package
-from pydantic import BaseSettings
+from pydantic_settings import BaseSettings
 
 from src.your_domain.application.interfaces.auth_service import AuthServiceInterface
 from your_domain.domain.entities.user import User
@@ -13,10 +20,52 @@ class JWTSettings(BaseSettings):
     jwt_secret: str  # Secret key used for encoding and decoding
     jwt_algorithm: str = "HS256"  # Algorithm used for JWT encoding (default: HS256)
     token_expiration_seconds: int = 3600  # Token expiration time in seconds
+    token_cache_size: int = 4096  # Verified tokens kept in the claims cache (0 disables it)
 
     class Config:
         env_file = ".env"  # Environment file that contains the JWT settings
 
+# Digests for the HMAC algorithms the batch signer handles itself; others go through jwt.encode.
+_HMAC_DIGESTS: Dict[str, Callable[..., Any]] = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+class _ClaimsCache:
+    """
+    Bounded LRU cache of verified token claims keyed by token digest.
+
+    Each entry expires at the token's own ``exp``, so a cached token never outlives
+    the validity jwt.decode would have granted it.
+    """
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def put(self, key: bytes, claims: Dict[str, Any], expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (claims, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
 class AuthService(AuthServiceInterface):
     """
     AuthService implements AuthServiceInterface using JWT (OAuth2 style tokens).
@@ -29,6 +78,27 @@ class AuthService(AuthServiceInterface):
             settings (JWTSettings): JWT configuration settings.
         """
         self.settings = settings
+        self._claims_cache = _ClaimsCache(settings.token_cache_size) if settings.token_cache_size > 0 else None
+        self._signing_state: Optional[Tuple[bytes, "hmac.HMAC"]] = None
+
+    def _get_signing_state(self) -> Optional[Tuple[bytes, "hmac.HMAC"]]:
+        """
+        Return the encoded header segment and a keyed HMAC, built once per service.
+
+        The header is serialized exactly as PyJWT does (sorted keys, compact separators),
+        so tokens are byte-for-byte identical to jwt.encode output. Returns None for
+        algorithms other than HS256/384/512.
+        """
+        if self._signing_state is None:
+            digest = _HMAC_DIGESTS.get(self.settings.jwt_algorithm)
+            if digest is None:
+                return None
+            header = json.dumps(
+                {"alg": self.settings.jwt_algorithm, "typ": "JWT"}, separators=(",", ":"), sort_keys=True
+            ).encode("utf-8")
+            mac = hmac.new(self.settings.jwt_secret.encode("utf-8"), digestmod=digest)
+            self._signing_state = (_b64url(header) + b".", mac)
+        return self._signing_state
 
     def generate_jwt_token(self, user: User) -> str:
         """
@@ -55,23 +125,90 @@ class AuthService(AuthServiceInterface):
             token = token.decode("utf-8")
         return token
 
-    def validate_token(self, token: str) -> bool:
+    def generate_jwt_tokens(self, users: Iterable[User]) -> List[str]:
         """
-        Validate the provided JWT token.
+        Generate JWT tokens for many users at once.
+
+        All tokens in the batch share one issued-at timestamp. For HMAC algorithms the
+        encoded header segment and the keyed HMAC state are reused across tokens, so
+        each token only costs one payload serialization and one HMAC over it.
 
         Args:
-            token (str): The JWT token string to validate.
+            users (Iterable[User]): The users for which to generate tokens.
 
         Returns:
-            bool: True if the token is valid, False otherwise.
+            List[str]: One JWT token per user, in input order.
+        """
+        issued_at = int(time.time())
+        expires_at = issued_at + self.settings.token_expiration_seconds
+        signing_state = self._get_signing_state()
+
+        if signing_state is None:
+            return [
+                jwt.encode(
+                    {"user_id": str(user.id), "exp": expires_at, "iat": issued_at},
+                    self.settings.jwt_secret,
+                    algorithm=self.settings.jwt_algorithm,
+                )
+                for user in users
+            ]
+
+        header_segment, keyed_mac = signing_state
+        tokens = []
+        for user in users:
+            # Same claims, in the same order, as generate_jwt_token.
+            payload = json.dumps(
+                {"user_id": str(user.id), "exp": expires_at, "iat": issued_at}, separators=(",", ":")
+            ).encode("utf-8")
+            signing_input = header_segment + _b64url(payload)
+            mac = keyed_mac.copy()
+            mac.update(signing_input)
+            tokens.append((signing_input + b"." + _b64url(mac.digest())).decode("ascii"))
+        return tokens
+
+    def decode_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Verify the provided JWT token and return its claims.
+
+        Verified claims are cached by token digest until the token's expiration, so a
+        token reused across requests is only decoded and HMAC-verified once.
+
+        Args:
+            token (str): The JWT token string to decode.
+
+        Returns:
+            Optional[Dict[str, Any]]: The token claims if the token is valid, None otherwise.
         """
+        cache = self._claims_cache
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        if cache is not None:
+            claims = cache.get(key)
+            if claims is not None:
+                return dict(claims)
+
         try:
-            # Attempt to decode the token. If successful, token is valid.
-            jwt.decode(token, self.settings.jwt_secret, algorithms=[self.settings.jwt_algorithm])
-            return True
+            claims = jwt.decode(token, self.settings.jwt_secret, algorithms=[self.settings.jwt_algorithm])
         except jwt.ExpiredSignatureError:
             # Token has expired.
-            return False
+            return None
         except jwt.InvalidTokenError:
             # Token is invalid.
-            return False
+            return None
+
+        # Tokens without an expiration are not cached; there is no safe point to evict them.
+        expires_at = claims.get("exp")
+        if cache is not None and isinstance(expires_at, (int, float)):
+            cache.put(key, claims, float(expires_at))
+        return dict(claims)
+
+    def validate_token(self, token: str) -> bool:
+        """
+        Validate the provided JWT token.
+
+        Args:
+            token (str): The JWT token string to validate.
+
+        Returns:
+            bool: True if the token is valid, False otherwise.
+        """
+        return self.decode_token(token) is not None
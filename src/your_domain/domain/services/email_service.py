@@ -1,11 +1,17 @@
 import smtplib
+from email.message import Message
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional
-from pydantic import BaseSettings
+from typing import Iterable, Optional, Sequence
+from pydantic_settings import BaseSettings
 
 # Import the EmailServiceInterface to implement it
-from src.your_domain.application.interfaces.email_service import EmailServiceInterface
+from your_domain.application.interfaces.email_service import (
+    EmailBatchError,
+    EmailServiceInterface,
+    EmailTransportInterface,
+    OutboundEmail,
+)
 from your_domain.domain.entities.user import User
 
 # SMTPSettings holds configuration for the SMTP server.
@@ -16,19 +22,50 @@ class SMTPSettings(BaseSettings):
     smtp_password: str  # SMTP password
     use_tls: bool = True  # Indicates whether to use TLS
     from_email: str  # The email address used in the "From" field
+    smtp_pool_size: int = 4  # Authenticated SMTP sessions kept open for reuse
+    smtp_max_messages_per_connection: int = 100  # Messages sent before a session is replaced
+    smtp_health_check_after_seconds: float = 30.0  # Idle time after which a session is NOOP-checked
+    smtp_timeout_seconds: float = 30.0  # Socket timeout and wait for a free session
 
     class Config:
         env_file = ".env"  # Use a .env file to load environment variables
 
-class EmailService(EmailServiceInterface):
+class _DirectSMTPTransport(EmailTransportInterface):
+    """Opens a new SMTP session per call; used when EmailService is given no transport."""
     def __init__(self, settings: SMTPSettings) -> None:
+        self.settings = settings
+
+    def send(self, message: Message) -> None:
+        self.send_many([message])
+
+    def send_many(self, messages: Sequence[Message]) -> int:
+        sent = 0
+        try:
+            # Set up the SMTP connection
+            with smtplib.SMTP(self.settings.smtp_server, self.settings.smtp_port) as server:
+                if self.settings.use_tls:
+                    server.starttls()
+                if self.settings.smtp_username:
+                    server.login(self.settings.smtp_username, self.settings.smtp_password)
+                for message in messages:
+                    server.send_message(message)
+                    sent += 1
+        except (smtplib.SMTPException, OSError) as e:
+            raise EmailBatchError(sent, e) from e
+        return sent
+
+class EmailService(EmailServiceInterface):
+    def __init__(self, settings: SMTPSettings, pool: Optional[EmailTransportInterface] = None) -> None:
         """
         Initializes the EmailService with the given SMTP settings.
 
         Args:
             settings (SMTPSettings): Configuration for the SMTP server.
+            pool (Optional[EmailTransportInterface]): Delivers the messages, usually an
+                infrastructure SMTPConnectionPool; without one, each call opens its own SMTP session.
         """
         self.settings = settings
+        self.pool = pool if pool is not None else _DirectSMTPTransport(settings)
 
     def send_confirmation_email(self, user: User) -> None:
         """
@@ -37,6 +74,28 @@ class EmailService(EmailServiceInterface):
         Args:
             user (User): The user to send the confirmation email to.
         """
+        self.send(self.compose_confirmation_email(user))
+
+    def send_password_reset_email(self, user: User, reset_token: str) -> None:
+        """
+        Sends a password reset email to the user.
+
+        Args:
+            user (User): The user to send the password reset email to.
+            reset_token (str): Token included in the reset link.
+        """
+        self.send(self.compose_password_reset_email(user, reset_token))
+
+    def compose_confirmation_email(self, user: User) -> OutboundEmail:
+        """
+        Builds the email confirmation message for the user.
+
+        Args:
+            user (User): The user to send the confirmation email to.
+
+        Returns:
+            OutboundEmail: The message, ready for send() or send_many().
+        """
         subject = "Email Confirmation"
         # In a real implementation, include a proper token or link for confirmation.
         body = (
@@ -45,51 +104,82 @@ class EmailService(EmailServiceInterface):
             f"http://example.com/confirm?user_id={user.id}\n\n"
             f"Thank you!"
         )
-        self._send_email(to_email=str(user.email.address), subject=subject, body=body)
+        return OutboundEmail(to_email=str(user.email.address), subject=subject, body=body)
 
-    def send_password_reset_email(self, user: User) -> None:
+    def compose_password_reset_email(self, user: User, reset_token: str) -> OutboundEmail:
         """
-        Sends a password reset email to the user.
+        Builds the password reset message for the user.
 
         Args:
             user (User): The user to send the password reset email to.
+            reset_token (str): Token included in the reset link.
+
+        Returns:
+            OutboundEmail: The message, ready for send() or send_many().
         """
         subject = "Password Reset Request"
-        # In a real-world scenario, include a secure token to reset the password.
         body = (
             f"Hello,\n\n"
             f"You have requested to reset your password. Please click on the link below to proceed:\n"
-            f"http://example.com/reset-password?user_id={user.id}\n\n"
+            f"http://example.com/reset-password?token={reset_token}\n\n"
             f"If you did not request a password reset, please ignore this email."
         )
-        self._send_email(to_email=str(user.email.address), subject=subject, body=body)
+        return OutboundEmail(to_email=str(user.email.address), subject=subject, body=body)
 
-    def _send_email(self, to_email: str, subject: str, body: str) -> None:
+    def send(self, email: OutboundEmail) -> None:
         """
-        Internal helper that sends an email via SMTP.
+        Sends one message over a pooled SMTP session.
 
         Args:
-            to_email (str): Recipient's email address.
-            subject (str): Email subject.
-            body (str): Email body content.
+            email (OutboundEmail): The message to send.
 
         Raises:
             smtplib.SMTPException: If there is an error sending the email.
         """
+        self._send_email(to_email=email.to_email, subject=email.subject, body=email.body)
+
+    def send_many(self, emails: Iterable[OutboundEmail]) -> int:
+        """
+        Sends many messages back to back over as few SMTP sessions as possible.
+
+        Args:
+            emails (Iterable[OutboundEmail]): The messages to send, in order.
+
+        Returns:
+            int: Number of messages sent.
+
+        Raises:
+            EmailBatchError: If a message fails; its ``sent`` attribute tells how many went out before it.
+        """
+        messages = [self._build_message(email.to_email, email.subject, email.body) for email in emails]
+        return self.pool.send_many(messages)
+
+    def _build_message(self, to_email: str, subject: str, body: str) -> MIMEMultipart:
         # Create a MIME message
         msg = MIMEMultipart()
         msg["From"] = self.settings.from_email
         msg["To"] = to_email
         msg["Subject"] = subject
         msg.attach(MIMEText(body, "plain"))
+        return msg
+
+    def _send_email(self, to_email: str, subject: str, body: str) -> None:
+        """
+        Internal helper that sends an email via SMTP.
+
+        Args:
+            to_email (str): Recipient's email address.
+            subject (str): Email subject.
+            body (str): Email body content.
+
+        Raises:
+            smtplib.SMTPException: If there is an error sending the email.
+        """
+        msg = self._build_message(to_email, subject, body)
 
         try:
-            # Set up the SMTP connection
-            with smtplib.SMTP(self.settings.smtp_server, self.settings.smtp_port) as server:
-                if self.settings.use_tls:
-                    server.starttls()
-                server.login(self.settings.smtp_username, self.settings.smtp_password)
-                server.send_message(msg)
+            # A pooled transport reuses an authenticated session instead of connecting per message
+            self.pool.send(msg)
         except smtplib.SMTPException as e:
             # Exception handling and logging should be extended as needed.
             raise e
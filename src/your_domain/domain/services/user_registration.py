@@ -7,7 +7,7 @@ class UserRegistrationService:
         self.user_mgmt = user_mgmt
 
     def register_user(self, email: str, plain_text_password: str) -> User:
-        email_obj = Email(address=email)
+        email_obj = Email.from_string(email)
         if self.user_mgmt.find_by_email(email_obj) is not None:
             raise ValueError(f"User with email {email} already exists")
         user = User.create(email, plain_text_password)
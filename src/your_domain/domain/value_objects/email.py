@@ -1,23 +1,46 @@
+from functools import lru_cache
 from pydantic import BaseModel, EmailStr
 from typing import Any
 
+# Distinct addresses kept by Email.from_string
+INTERN_CACHE_SIZE = 10_000
+
 class Email(BaseModel):
-    _address: EmailStr
+    address: EmailStr
 
     def __init__(self, address: EmailStr) -> None:
-        super().__init__(_address=address)
+        super().__init__(address=address)
+
+    @classmethod
+    def from_string(cls, address: str) -> "Email":
+        """
+        Returns the canonical Email for an address, validating it only the first time
+        it is seen. Addresses differing only in the case of the domain share one
+        instance, so repeated lookups of the same user compare by identity.
 
-    @property
-    def address(self) -> EmailStr:
-        return self._address
+        Raises:
+            ValidationError: If the address is not a valid email.
+        """
+        local, at, domain = address.rpartition("@")
+        return _interned(f"{local}{at}{domain.lower()}" if at else address)
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if isinstance(other, Email):
-            return self._address == other._address
+            return self.address == other.address
         return False
 
     def __hash__(self) -> int:
-        return hash(self._address)
+        return hash(self.address)
 
     def __str__(self) -> str:
-        return str(self._address)
+        return str(self.address)
+
+    class Config:
+        frozen = True  # Makes the value object immutable
+
+@lru_cache(maxsize=INTERN_CACHE_SIZE)
+def _interned(address: str) -> Email:
+    # Invalid addresses raise, and lru_cache does not store exceptions
+    return Email(address=address)
@@ -1,6 +1,155 @@
+import asyncio
+import os
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings
 import bcrypt
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+class PasswordHashingSettings(BaseSettings):
+    """
+    Settings for BCrypt's cost factor and the worker pool that runs it off the event loop.
+    """
+    bcrypt_rounds: int = 12  # Cost factor for new hashes; replaced by the calibrated value when a target is set
+    bcrypt_target_ms: Optional[float] = None  # Calibrate the cost at startup so one hash takes about this long
+    bcrypt_min_rounds: int = 10  # Calibration never goes below this cost
+    bcrypt_max_rounds: int = 16  # Calibration never goes above this cost
+    hashing_max_workers: Optional[int] = None  # Pool size (default: number of CPUs)
+    hashing_max_pending: int = 64  # Jobs allowed in flight (running + queued) before callers wait
+    hashing_queue_timeout_seconds: float = 5.0  # How long a caller waits for a free slot
+    hashing_use_processes: bool = False  # Use a process pool instead of a thread pool
+
+    class Config:
+        env_file = ".env"  # Environment file that contains the hashing settings
+
+class HashingPoolSaturatedError(RuntimeError):
+    """Raised when no hashing slot frees up within the configured queue timeout."""
+
+def _hash_password(password: bytes, rounds: int) -> bytes:
+    # Module-level functions so they can be pickled into a process pool.
+    # The cost is passed explicitly because worker processes do not share the calibrated settings.
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+def _check_password(password: bytes, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed_password)
+
+class PasswordHashingPool:
+    """
+    Bounded executor for BCrypt work.
+
+    Jobs run on a thread or process pool so the event loop stays responsive. At most
+    ``hashing_max_pending`` jobs per event loop are in flight; further callers wait
+    for a slot and fail with HashingPoolSaturatedError once the queue timeout elapses.
+    """
+
+    def __init__(self, settings: PasswordHashingSettings) -> None:
+        self.settings = settings
+        self._executor: Optional[Executor] = None
+        # asyncio primitives belong to one loop, so each loop using the pool gets its own slots
+        self._slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def executor(self) -> Executor:
+        """The underlying executor, created on first use."""
+        if self._executor is None:
+            max_workers = self.settings.hashing_max_workers or os.cpu_count() or 1
+            if self.settings.hashing_use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Runs ``func(*args)`` on the pool once a slot is available."""
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self.settings.hashing_max_pending)
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.settings.hashing_queue_timeout_seconds)
+        except asyncio.TimeoutError as e:
+            raise HashingPoolSaturatedError("Password hashing pool is saturated") from e
+        try:
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            slots.release()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shuts down the underlying executor."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    min_rounds: int = 4,
+    max_rounds: int = 31,
+    sample_rounds: int = 8,
+    samples: int = 3
+) -> int:
+    """
+    Finds the highest BCrypt cost whose hashing time on this machine stays within a budget.
+
+    Each extra round doubles the work, so the time of one cheap sample cost is
+    measured and extrapolated instead of timing the expensive costs themselves.
+
+    Args:
+        target_ms (float): Budget for one hash, in milliseconds.
+        min_rounds (int): Lowest cost returned, even if it exceeds the budget.
+        max_rounds (int): Highest cost returned.
+        sample_rounds (int): Cost that is actually timed.
+        samples (int): Timings taken; the fastest is used, to ignore scheduler noise.
+
+    Returns:
+        int: The cost factor to pass to ``bcrypt.gensalt``.
+    """
+    salt = bcrypt.gensalt(sample_rounds)
+    elapsed_ms = float("inf")
+    for _ in range(samples):
+        started = time.perf_counter()
+        bcrypt.hashpw(b"calibration", salt)
+        elapsed_ms = min(elapsed_ms, (time.perf_counter() - started) * 1000)
+    rounds = sample_rounds
+    while rounds < max_rounds and elapsed_ms * 2 ** (rounds + 1 - sample_rounds) <= target_ms:
+        rounds += 1
+    while rounds > min_rounds and elapsed_ms * 2 ** (rounds - sample_rounds) > target_ms:
+        rounds -= 1
+    return max(min_rounds, min(max_rounds, rounds))
+
+_hashing_pool: Optional[PasswordHashingPool] = None
+
+def configure_hashing_pool(settings: PasswordHashingSettings) -> PasswordHashingPool:
+    """
+    Replaces the process-wide hashing pool; call once at application startup.
+
+    If ``bcrypt_target_ms`` is set, the cost factor is calibrated on this machine
+    and stored in ``settings.bcrypt_rounds``.
+    """
+    global _hashing_pool
+    if settings.bcrypt_target_ms is not None:
+        settings.bcrypt_rounds = calibrate_bcrypt_rounds(
+            settings.bcrypt_target_ms, settings.bcrypt_min_rounds, settings.bcrypt_max_rounds
+        )
+    if _hashing_pool is not None:
+        _hashing_pool.shutdown(wait=False)
+    _hashing_pool = PasswordHashingPool(settings)
+    return _hashing_pool
+
+def get_hashing_pool() -> PasswordHashingPool:
+    """Returns the process-wide hashing pool, creating it from the environment if needed."""
+    if _hashing_pool is None:
+        return configure_hashing_pool(PasswordHashingSettings())
+    return _hashing_pool
+
+def get_bcrypt_rounds() -> int:
+    """Returns the cost factor new hashes are created with."""
+    return get_hashing_pool().settings.bcrypt_rounds
 
 class PasswordHash(BaseModel):
     """Value object that encapsulates password hashing and verification logic using BCrypt."""
@@ -15,10 +164,34 @@ class PasswordHash(BaseModel):
         if not plain_password:
             raise ValueError("Password cannot be empty")
 
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(plain_password.encode('utf-8'), salt)
+        hashed = _hash_password(plain_password.encode('utf-8'), get_bcrypt_rounds())
+        return cls(hashed_password=hashed)
+
+    @classmethod
+    async def create_async(cls, plain_password: str) -> "PasswordHash":
+        """Creates a new PasswordHash without blocking the event loop."""
+        if not plain_password:
+            raise ValueError("Password cannot be empty")
+
+        pool = get_hashing_pool()
+        hashed = await pool.run(_hash_password, plain_password.encode('utf-8'), pool.settings.bcrypt_rounds)
         return cls(hashed_password=hashed)
 
+    @property
+    def rounds(self) -> int:
+        """The cost factor the hash was created with, read from its ``$2b$<cost>$`` prefix."""
+        return int(self.hashed_password.split(b"$")[2])
+
+    def needs_rehash(self, rounds: Optional[int] = None) -> bool:
+        """
+        Whether the hash was created with a different cost than new hashes use,
+        in either direction, and should be replaced at the next successful login.
+
+        Args:
+            rounds (Optional[int]): The current cost; defaults to the configured one.
+        """
+        return self.rounds != (rounds if rounds is not None else get_bcrypt_rounds())
+
     def verify(self, plain_password: str) -> bool:
         """Verifies if the plain text password matches the hash."""
         if not plain_password:
@@ -29,6 +202,17 @@ class PasswordHash(BaseModel):
             self.hashed_password
         )
 
+    async def verify_async(self, plain_password: str) -> bool:
+        """Verifies the plain text password without blocking the event loop."""
+        if not plain_password:
+            return False
+
+        return await get_hashing_pool().run(
+            _check_password,
+            plain_password.encode('utf-8'),
+            self.hashed_password
+        )
+
     class Config:
         frozen = True  # Makes the value object immutable
         arbitrary_types_allowed = True  # Allows bytes type for hashed_password
@@ -0,0 +1,65 @@
+import hashlib
+import math
+import threading
+from typing import Iterable, Iterator
+
+class BloomFilter:
+    """
+    Probabilistic set membership over strings.
+
+    ``might_contain`` never returns False for an item that was added, but may return
+    True for an item that was not (at roughly ``false_positive_rate`` once
+    ``capacity`` items have been added). Items cannot be removed.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01) -> None:
+        """
+        Size the filter for the expected number of items.
+
+        Args:
+            capacity (int): Expected number of distinct items.
+            false_positive_rate (float): Target false positive rate at capacity.
+
+        Raises:
+            ValueError: If capacity is not positive or the rate is outside (0, 1).
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # Kirsch-Mitzenmacher double hashing: derive k positions from one 128-bit digest.
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        """Adds an item to the filter."""
+        positions = list(self._positions(item))
+        with self._lock:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def update(self, items: Iterable[str]) -> None:
+        """Adds every item from an iterable."""
+        for item in items:
+            self.add(item)
+
+    def might_contain(self, item: str) -> bool:
+        """Returns False if the item was definitely never added."""
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __contains__(self, item: str) -> bool:
+        return self.might_contain(item)
@@ -0,0 +1,95 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional, Protocol, Tuple
+
+@dataclass
+class CacheStats:
+    """Counters reported by caches."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+class CacheBackend(Protocol):
+    """
+    Key/value store used by the caching decorators.
+
+    Implement this over a shared store (e.g. Redis or memcached) to share entries
+    between processes; values must then be serializable.
+    """
+    def get(self, key: Hashable) -> Optional[Any]:
+        ...
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ...
+
+    def delete(self, *keys: Hashable) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+class TTLCache(CacheBackend):
+    """
+    Thread-safe in-process LRU cache whose entries also expire after a time to live.
+
+    Expired entries are dropped lazily when read. Once ``max_size`` entries are
+    stored, the least recently used entry is evicted.
+    """
+
+    def __init__(self, max_size: int = 10_000, default_ttl: Optional[float] = 300.0) -> None:
+        """
+        Args:
+            max_size (int): Maximum number of entries kept.
+            default_ttl (Optional[float]): Seconds an entry lives when ``set`` gets no ttl; None never expires.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, *keys: Hashable) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
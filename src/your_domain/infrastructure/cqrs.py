@@ -1,40 +1,182 @@
-from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
-
-C = TypeVar("C")
-R = TypeVar("R")
-
-class Command(ABC):
-    pass
-
-class Query(ABC):
-    pass
-
-class CommandHandler(ABC, Generic[C]):
-    @abstractmethod
-    def handle(self, command: C) -> None:
-        pass
-
-class QueryHandler(ABC, Generic[R]):
-    @abstractmethod
-    def handle(self, query: Query) -> R:
-        pass
-
-class CreateUserCommand(Command):
-    def __init__(self, username: str, email: str):
-        self.username = username
-        self.email = email
-
-class GetUserQuery(Query):
-    def __init__(self, user_id: int):
-        self.user_id = user_id
-
-class CreateUserCommandHandler(CommandHandler[CreateUserCommand]):
-    def handle(self, command: CreateUserCommand) -> None:
-        # Implement the logic to create a user
-        pass
-
-class GetUserQueryHandler(QueryHandler[Any]):
-    def handle(self, query: GetUserQuery) -> Any:
-        # Implement the logic to get a user
-        pass
+import asyncio
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Tuple, Type, Union
+
+from sqlalchemy.exc import OperationalError
+
+# The abstractions and buses live in the application layer; they are re-exported here for existing imports.
+from your_domain.application.cqrs import (
+    AsyncCommandBus,
+    AsyncQueryBus,
+    Command,
+    CommandBus,
+    CommandHandler,
+    CreateUserCommand,
+    CreateUserCommandHandler,
+    GetUserQuery,
+    GetUserQueryHandler,
+    HandlerNotFoundError,
+    Query,
+    QueryBus,
+    QueryHandler,
+)
+from your_domain.application.uow import AbstractAsyncUnitOfWork, AbstractUnitOfWork
+from your_domain.infrastructure.event_bus import HandlerStats
+
+__all__ = [
+    "AsyncCommandBus",
+    "AsyncQueryBus",
+    "Command",
+    "CommandBus",
+    "CommandHandler",
+    "CreateUserCommand",
+    "CreateUserCommandHandler",
+    "GetUserQuery",
+    "GetUserQueryHandler",
+    "HandlerNotFoundError",
+    "Query",
+    "QueryBus",
+    "QueryHandler",
+    "TimingMiddleware",
+    "AsyncTimingMiddleware",
+    "TransactionMiddleware",
+    "AsyncTransactionMiddleware",
+    "current_unit_of_work",
+    "RetryMiddleware",
+    "AsyncRetryMiddleware",
+]
+
+class TimingMiddleware:
+    """Records call count, errors and latency per message type in ``stats``."""
+    def __init__(self) -> None:
+        self.stats: Dict[str, HandlerStats] = {}
+        self._lock = threading.Lock()
+
+    def _record(self, message: Any, seconds: float, error: bool) -> None:
+        name = type(message).__name__
+        with self._lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = HandlerStats()
+            stats.record(seconds)
+            stats.errors += error
+
+    def __call__(self, message: Any, next_step: Callable[[Any], Any]) -> Any:
+        started = time.perf_counter()
+        error = True
+        try:
+            result = next_step(message)
+            error = False
+            return result
+        finally:
+            self._record(message, time.perf_counter() - started, error)
+
+class AsyncTimingMiddleware(TimingMiddleware):
+    async def __call__(self, message: Any, next_step: Callable[[Any], Awaitable[Any]]) -> Any:
+        started = time.perf_counter()
+        error = True
+        try:
+            result = await next_step(message)
+            error = False
+            return result
+        finally:
+            self._record(message, time.perf_counter() - started, error)
+
+# Unit of work of the message being dispatched; set by the transaction middlewares
+_current_uow: ContextVar[Union[AbstractUnitOfWork, AbstractAsyncUnitOfWork]] = ContextVar("current_uow")
+
+def current_unit_of_work() -> Union[AbstractUnitOfWork, AbstractAsyncUnitOfWork]:
+    """
+    Returns the unit of work the transaction middleware opened for the message being handled.
+
+    Raises:
+        LookupError: If called outside a TransactionMiddleware or AsyncTransactionMiddleware.
+    """
+    try:
+        return _current_uow.get()
+    except LookupError:
+        raise LookupError("No unit of work is open; add a TransactionMiddleware to the bus") from None
+
+class TransactionMiddleware:
+    """
+    Runs each message inside a fresh unit of work: committed if the handler
+    returns, rolled back if it raises. Handlers behind it get the unit of work from
+    ``current_unit_of_work()`` and must not enter it themselves. Each dispatch gets
+    its own unit of work, so one bus can serve concurrent threads.
+    """
+    def __init__(self, uow_factory: Callable[[], AbstractUnitOfWork]) -> None:
+        """
+        Args:
+            uow_factory (Callable[[], AbstractUnitOfWork]): Creates the unit of work for one dispatch.
+        """
+        self.uow_factory = uow_factory
+
+    def __call__(self, message: Any, next_step: Callable[[Any], Any]) -> Any:
+        with self.uow_factory() as uow:
+            token = _current_uow.set(uow)
+            try:
+                return next_step(message)
+            finally:
+                _current_uow.reset(token)
+
+class AsyncTransactionMiddleware:
+    """asyncio variant of TransactionMiddleware; concurrent tasks each get their own unit of work."""
+    def __init__(self, uow_factory: Callable[[], AbstractAsyncUnitOfWork]) -> None:
+        """
+        Args:
+            uow_factory (Callable[[], AbstractAsyncUnitOfWork]): Creates the unit of work for one dispatch.
+        """
+        self.uow_factory = uow_factory
+
+    async def __call__(self, message: Any, next_step: Callable[[Any], Awaitable[Any]]) -> Any:
+        async with self.uow_factory() as uow:
+            token = _current_uow.set(uow)
+            try:
+                return await next_step(message)
+            finally:
+                _current_uow.reset(token)
+
+class RetryMiddleware:
+    """
+    Retries a message on transient errors with jittered exponential backoff.
+
+    Place it outside TransactionMiddleware so each attempt gets a fresh transaction.
+    """
+    def __init__(
+        self,
+        attempts: int = 3,
+        retry_on: Tuple[Type[BaseException], ...] = (OperationalError,),
+        backoff_base_seconds: float = 0.05,
+    ) -> None:
+        """
+        Args:
+            attempts (int): Total attempts, including the first.
+            retry_on (Tuple[Type[BaseException], ...]): Exceptions treated as transient.
+            backoff_base_seconds (float): Upper bound of the first delay; doubles per attempt.
+        """
+        self.attempts = attempts
+        self.retry_on = retry_on
+        self.backoff_base_seconds = backoff_base_seconds
+
+    def _delay(self, attempt: int) -> float:
+        return random.uniform(0, self.backoff_base_seconds * 2 ** attempt)
+
+    def __call__(self, message: Any, next_step: Callable[[Any], Any]) -> Any:
+        for attempt in range(self.attempts - 1):
+            try:
+                return next_step(message)
+            except self.retry_on:
+                time.sleep(self._delay(attempt))
+        return next_step(message)
+
+class AsyncRetryMiddleware(RetryMiddleware):
+    async def __call__(self, message: Any, next_step: Callable[[Any], Awaitable[Any]]) -> Any:
+        for attempt in range(self.attempts - 1):
+            try:
+                return await next_step(message)
+            except self.retry_on:
+                await asyncio.sleep(self._delay(attempt))
+        return await next_step(message)
@@ -1,14 +1,142 @@
-from sqlalchemy import create_engine
+from typing import Any, AsyncIterator, Dict, Optional
+from pydantic_settings import BaseSettings
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 
-DATABASE_URL = "sqlite:///./test.db"
+class DatabaseSettings(BaseSettings):
+    """
+    Settings for the SQLAlchemy engines and their connection pools.
+    """
+    database_url: str = "sqlite:///./test.db"
+    async_database_url: str = "sqlite+aiosqlite:///./test.db"
+    pool_size: int = 5  # Connections kept open in the pool
+    max_overflow: int = 10  # Extra connections allowed under load
+    pool_timeout_seconds: float = 30.0  # Wait for a free connection before failing
+    pool_recycle_seconds: int = 1800  # Reconnect connections older than this (-1 disables)
+    pool_pre_ping: bool = True  # Check connections are alive before handing them out
+    # SQLite performance profile, applied to every new connection
+    sqlite_journal_mode: str = "WAL"  # Readers no longer block behind writers
+    sqlite_synchronous: str = "NORMAL"  # Safe with WAL; fsync at checkpoints instead of every commit
+    sqlite_mmap_size: int = 256 * 1024 * 1024  # Bytes of the database file read through mmap
+    sqlite_busy_timeout_ms: int = 5000  # Wait for locks instead of failing with "database is locked"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    class Config:
+        env_file = ".env"  # Environment file that contains the database settings
+
+def _is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+def _is_memory_sqlite(url: str) -> bool:
+    return _is_sqlite(url) and make_url(url).database in (None, "", ":memory:")
+
+def _engine_options(url: str, settings: DatabaseSettings) -> Dict[str, Any]:
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.pool_pre_ping,
+        "pool_recycle": settings.pool_recycle_seconds,
+    }
+    # In-memory SQLite uses a single shared connection, so there is no pool to size.
+    if not _is_memory_sqlite(url):
+        options.update(
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.pool_timeout_seconds,
+        )
+    return options
+
+def _apply_sqlite_pragmas(engine: Engine, settings: DatabaseSettings) -> None:
+    pragmas = [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}",
+        f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}",
+    ]
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+def create_db_engine(settings: DatabaseSettings) -> Engine:
+    """
+    Create the synchronous engine described by ``settings``.
+
+    Args:
+        settings (DatabaseSettings): Connection URL, pool and SQLite configuration.
+
+    Returns:
+        Engine: The configured engine.
+    """
+    url = settings.database_url
+    connect_args = {"check_same_thread": False} if _is_sqlite(url) else {}
+    engine = create_engine(url, connect_args=connect_args, **_engine_options(url, settings))
+    if _is_sqlite(url):
+        _apply_sqlite_pragmas(engine, settings)
+    return engine
+
+def create_async_db_engine(settings: DatabaseSettings) -> AsyncEngine:
+    """
+    Create the asyncio engine described by ``settings``.
+
+    Args:
+        settings (DatabaseSettings): Connection URL, pool and SQLite configuration.
+
+    Returns:
+        AsyncEngine: The configured engine.
+    """
+    url = settings.async_database_url
+    engine = create_async_engine(url, **_engine_options(url, settings))
+    if _is_sqlite(url):
+        _apply_sqlite_pragmas(engine.sync_engine, settings)
+    return engine
+
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker[Session]] = None
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+def configure_database(settings: DatabaseSettings) -> None:
+    """
+    Build the process-wide engines and session factories; call once at application startup.
+
+    Engines from a previous configuration are disposed of synchronously, so call this
+    before the event loop starts serving requests.
+    """
+    global _engine, _session_factory, _async_engine, _async_session_factory
+    if _engine is not None:
+        _engine.dispose()
+    if _async_engine is not None:
+        _async_engine.sync_engine.dispose()
+    _engine = create_db_engine(settings)
+    _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
+    _async_engine = create_async_db_engine(settings)
+    # Entities are built from rows inside the transaction, so nothing needs reloading after commit.
+    _async_session_factory = async_sessionmaker(bind=_async_engine, autoflush=False, expire_on_commit=False)
+
+def get_session_factory() -> sessionmaker[Session]:
+    """Returns the synchronous session factory, configuring from the environment if needed."""
+    if _session_factory is None:
+        configure_database(DatabaseSettings())
+    return _session_factory
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Returns the async session factory, configuring from the environment if needed."""
+    if _async_session_factory is None:
+        configure_database(DatabaseSettings())
+    return _async_session_factory
 
 def get_db_session() -> Session:
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db_session() -> AsyncIterator[AsyncSession]:
+    async with get_async_session_factory()() as db:
+        yield db
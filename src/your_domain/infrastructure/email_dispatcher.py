@@ -0,0 +1,275 @@
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Protocol, Sequence, Union
+from uuid import uuid4
+
+from your_domain.application.interfaces.email_service import EmailServiceInterface
+from your_domain.domain.entities.user import User
+from your_domain.infrastructure.smtp_pool import EmailBatchError, OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+class EmailSender(Protocol):
+    """What the dispatcher needs from EmailService: composing messages and sending a batch."""
+    def compose_confirmation_email(self, user: User) -> OutboundEmail:
+        ...
+
+    def compose_password_reset_email(self, user: User, reset_token: str) -> OutboundEmail:
+        ...
+
+    def send_many(self, emails: Sequence[OutboundEmail]) -> int:
+        ...
+
+@dataclass
+class EmailQueueStats:
+    """Counters and recent send latencies reported by QueuedEmailDispatcher."""
+    enqueued: int = 0
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    # Seconds spent in send_many per batch, most recent last
+    send_latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    def latency_percentile(self, percentile: float) -> float:
+        """
+        Returns the given percentile (0-100) of the recent batch send latencies, in seconds.
+        """
+        if not self.send_latencies:
+            return 0.0
+        ordered = sorted(self.send_latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+
+@dataclass
+class _QueuedEmail:
+    email: OutboundEmail
+    spool_id: str = field(default_factory=lambda: uuid4().hex)
+    attempts: int = 0
+
+class QueuedEmailDispatcher(EmailServiceInterface):
+    """
+    EmailServiceInterface that queues messages and sends them in the background.
+
+    ``send_*`` calls only compose the message and enqueue it, so use cases no
+    longer wait on SMTP. Async workers drain the queue in batches through the
+    wrapped sender's ``send_many`` (run in the default executor, since SMTP is
+    blocking), retrying failed messages with exponential backoff and jitter.
+
+    With ``spool_dir`` set, each message is also written there as JSON until it is
+    sent, and spooled messages are re-queued by ``start``, so a restart does not
+    lose mail. Messages that exhaust their attempts are logged and their spool
+    file is renamed to ``*.failed``.
+
+    ``send_*`` may be called from any thread; workers run on the loop that
+    called ``start``.
+    """
+
+    def __init__(
+        self,
+        sender: EmailSender,
+        workers: int = 2,
+        batch_size: int = 20,
+        max_attempts: int = 5,
+        backoff_base_seconds: float = 1.0,
+        backoff_max_seconds: float = 60.0,
+        spool_dir: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """
+        Args:
+            sender (EmailSender): Composes and delivers messages, usually an EmailService.
+            workers (int): Number of concurrent worker tasks.
+            batch_size (int): Maximum messages a worker sends in one send_many call.
+            max_attempts (int): Attempts per message before it is given up on.
+            backoff_base_seconds (float): Delay before the first retry; doubles per attempt.
+            backoff_max_seconds (float): Upper bound on the retry delay.
+            spool_dir (Optional[Union[str, Path]]): Directory for the durable spool; in memory only if None.
+        """
+        self.sender = sender
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.spool_dir = Path(spool_dir) if spool_dir is not None else None
+        self.stats = EmailQueueStats()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional["asyncio.Queue[_QueuedEmail]"] = None
+        self._tasks: List[asyncio.Task] = []
+        self._retries: Dict[asyncio.TimerHandle, _QueuedEmail] = {}
+        # Messages enqueued before start() are held here
+        self._backlog: List[_QueuedEmail] = []
+        self._lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """Messages waiting to be sent, including those waiting for a retry."""
+        with self._lock:
+            queued = self._queue.qsize() if self._queue is not None else 0
+            return queued + len(self._backlog) + len(self._retries)
+
+    def send_confirmation_email(self, user: User) -> None:
+        self.enqueue(self.sender.compose_confirmation_email(user))
+
+    def send_password_reset_email(self, user: User, reset_token: str) -> None:
+        self.enqueue(self.sender.compose_password_reset_email(user, reset_token))
+
+    def enqueue(self, email: OutboundEmail) -> None:
+        """
+        Queues a message for background delivery; safe to call from any thread.
+
+        Args:
+            email (OutboundEmail): The message to send.
+        """
+        item = _QueuedEmail(email)
+        self._spool(item)
+        with self._lock:
+            self.stats.enqueued += 1
+            if self._loop is None:
+                self._backlog.append(item)
+                return
+            loop, queue = self._loop, self._queue
+        if _running_loop() is loop:
+            queue.put_nowait(item)
+        else:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+
+    async def start(self) -> None:
+        """Starts the workers on the running loop and re-queues spooled and early messages."""
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[_QueuedEmail]" = asyncio.Queue()
+        queued = {item.spool_id for item in self._backlog}
+        for item in self._load_spool():
+            if item.spool_id not in queued:
+                queue.put_nowait(item)
+        with self._lock:
+            for item in self._backlog:
+                queue.put_nowait(item)
+            self._backlog = []
+            self._loop, self._queue = loop, queue
+        self._tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stops the workers.
+
+        Messages still queued (only possible without ``drain``) and messages
+        enqueued after the stop are held until the next ``start``.
+
+        Args:
+            drain (bool): Wait until every queued message (including retries) is sent or given up on first.
+        """
+        if drain and self._queue is not None:
+            while True:
+                await self._queue.join()
+                if not self._retries:
+                    break
+                await asyncio.sleep(0.01)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        with self._lock:
+            queue, self._loop, self._queue = self._queue, None, None
+            for handle, item in self._retries.items():
+                handle.cancel()
+                self._backlog.append(item)
+            self._retries = {}
+            while queue is not None and not queue.empty():
+                self._backlog.append(queue.get_nowait())
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._send_batch(loop, batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _send_batch(self, loop: asyncio.AbstractEventLoop, batch: List[_QueuedEmail]) -> None:
+        started = time.perf_counter()
+        try:
+            sent = await loop.run_in_executor(None, self.sender.send_many, [item.email for item in batch])
+            error: Optional[Exception] = None
+        except EmailBatchError as e:
+            sent, error = e.sent, e
+        except Exception as e:
+            sent, error = 0, e
+        self.stats.send_latencies.append(time.perf_counter() - started)
+        self.stats.sent += sent
+        for item in batch[:sent]:
+            self._unspool(item)
+        if error is None:
+            return
+        # Only the first unsent message is known to have failed; the rest are retried with it.
+        for item in batch[sent:]:
+            item.attempts += 1
+            if item.attempts >= self.max_attempts:
+                self.stats.failed += 1
+                logger.error(
+                    "Giving up on email to %s after %d attempts: %s", item.email.to_email, item.attempts, error
+                )
+                self._unspool(item, failed=True)
+                continue
+            self.stats.retried += 1
+            self._schedule_retry(loop, item)
+
+    def _schedule_retry(self, loop: asyncio.AbstractEventLoop, item: _QueuedEmail) -> None:
+        delay = min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (item.attempts - 1))
+        # Full jitter spreads retries out so a recovering SMTP server is not hit all at once
+        delay = random.uniform(0, delay)
+
+        def requeue() -> None:
+            with self._lock:
+                del self._retries[handle]
+                queue = self._queue
+            queue.put_nowait(item)
+
+        with self._lock:
+            handle = loop.call_later(delay, requeue)
+            self._retries[handle] = item
+
+    def _spool_path(self, item: _QueuedEmail) -> Path:
+        return self.spool_dir / f"{item.spool_id}.json"
+
+    def _spool(self, item: _QueuedEmail) -> None:
+        if self.spool_dir is None:
+            return
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        path = self._spool_path(item)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(asdict(item.email)))
+        # Rename is atomic, so start() never reads a half-written message
+        temporary.replace(path)
+
+    def _unspool(self, item: _QueuedEmail, failed: bool = False) -> None:
+        if self.spool_dir is None:
+            return
+        path = self._spool_path(item)
+        if failed:
+            path.replace(path.with_suffix(".failed"))
+        else:
+            path.unlink(missing_ok=True)
+
+    def _load_spool(self) -> List[_QueuedEmail]:
+        if self.spool_dir is None or not self.spool_dir.exists():
+            return []
+        paths = sorted(self.spool_dir.glob("*.json"), key=lambda path: path.stat().st_mtime)
+        return [_QueuedEmail(OutboundEmail(**json.loads(path.read_text())), spool_id=path.stem) for path in paths]
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
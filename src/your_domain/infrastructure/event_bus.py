@@ -1,34 +1,207 @@
-from abc import ABC, abstractmethod
-from typing import Callable, Dict, List, Type
-
-class Event:
-    pass
-
-class EventHandler(ABC):
-    @abstractmethod
-    def handle(self, event: Event):
-        pass
-
-class EventBus(ABC):
-    @abstractmethod
-    def publish(self, event: Event):
-        pass
-
-    @abstractmethod
-    def subscribe(self, event_type: Type[Event], handler: EventHandler):
-        pass
-
-class SimpleEventBus(EventBus):
-    def __init__(self):
-        self._handlers: Dict[Type[Event], List[EventHandler]] = {}
-
-    def publish(self, event: Event):
-        event_type = type(event)
-        if event_type in self._handlers:
-            for handler in self._handlers[event_type]:
-                handler.handle(event)
-
-    def subscribe(self, event_type: Type[Event], handler: EventHandler):
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# The abstractions live in the application layer; they are re-exported here for existing imports.
+from your_domain.application.event_bus import (
+    AbstractAsyncEventBus,
+    AsyncEventHandler,
+    Event,
+    EventBus,
+    EventHandler,
+    HandlerRegistry,
+    SimpleEventBus,
+    deliver_batch,
+    deliver_batch_async,
+    group_by_type,
+)
+
+__all__ = [
+    "Event",
+    "EventBus",
+    "EventHandler",
+    "AbstractAsyncEventBus",
+    "AsyncEventHandler",
+    "SimpleEventBus",
+    "HandlerStats",
+    "AsyncEventBus",
+    "PooledEventBus",
+]
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class HandlerStats:
+    """Latency and outcome counters for one handler."""
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def record(self, seconds: float) -> None:
+        self.calls += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+def _handler_name(handler: EventHandler) -> str:
+    return type(handler).__qualname__
+
+class _StatsMixin:
+    def _init_stats(self) -> None:
+        # Keyed by handler class name; read it to find slow or failing handlers
+        self.handler_stats: Dict[str, HandlerStats] = {}
+        self._stats_lock = threading.Lock()
+
+    def _record(
+        self, handler: EventHandler, seconds: Optional[float] = None, error: bool = False, timeout: bool = False
+    ) -> None:
+        name = _handler_name(handler)
+        with self._stats_lock:
+            stats = self.handler_stats.get(name)
+            if stats is None:
+                stats = self.handler_stats[name] = HandlerStats()
+            if seconds is not None:
+                stats.record(seconds)
+            stats.errors += error
+            stats.timeouts += timeout
+
+class AsyncEventBus(_StatsMixin, HandlerRegistry, AbstractAsyncEventBus):
+    """
+    Event bus whose ``publish`` is a coroutine running every handler concurrently.
+
+    Handlers whose ``handle`` returns an awaitable (AsyncEventHandler, or any
+    ``async def handle``) are awaited together with ``asyncio.gather``, and so
+    are their ``handle_batch`` calls; plain handlers run inline on the loop, so
+    keep them cheap. A failing or timed-out handler is logged and does not affect
+    the others or the publisher.
+    """
+    def __init__(self, handler_timeout_seconds: Optional[float] = None) -> None:
+        """
+        Args:
+            handler_timeout_seconds (Optional[float]): Time each async handler may take; unlimited if None.
+        """
+        super().__init__()
+        self.handler_timeout_seconds = handler_timeout_seconds
+        self._init_stats()
+
+    async def _run(self, handler: EventHandler, deliver: Callable[[], Any], event_name: str) -> None:
+        started = time.perf_counter()
+        error = timeout = False
+        try:
+            result = deliver()
+            if inspect.isawaitable(result):
+                await asyncio.wait_for(result, self.handler_timeout_seconds)
+        except asyncio.TimeoutError:
+            timeout = True
+            logger.warning("Handler %s timed out on %s", _handler_name(handler), event_name)
+        except Exception:
+            error = True
+            logger.exception("Handler %s failed on %s", _handler_name(handler), event_name)
+        self._record(handler, time.perf_counter() - started, error=error, timeout=timeout)
+
+    async def publish(self, event: Event) -> None:
+        handlers = self._handlers_for(type(event))
+        name = type(event).__name__
+        if handlers:
+            await asyncio.gather(*(self._run(handler, lambda h=handler: h.handle(event), name) for handler in handlers))
+
+    async def publish_many(self, events: Iterable[Event]) -> None:
+        """Publishes events grouped by type, each handler receiving a type's events in one ``handle_batch`` call."""
+        runs = [
+            self._run(handler, lambda h=handler, b=batch: deliver_batch_async(h, b), event_type.__name__)
+            for event_type, batch in group_by_type(events).items()
+            for handler in self._handlers_for(event_type)
+        ]
+        if runs:
+            await asyncio.gather(*runs)
+
+class PooledEventBus(_StatsMixin, SimpleEventBus):
+    """
+    Event bus that fans each event out to its handlers on an executor.
+
+    ``publish`` returns once every handler has finished or has run for the
+    per-handler timeout, so the publisher waits for the slowest handler rather
+    than the sum of all of them. The timeout counts from when a handler starts:
+    handlers queued behind busy workers are waited for, not reported as timed
+    out. Handler errors are logged and isolated. A handler that times out keeps
+    running on its worker thread (threads cannot be interrupted) but is counted
+    in its stats.
+    """
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_workers: int = 8,
+        handler_timeout_seconds: Optional[float] = 5.0,
+    ) -> None:
+        """
+        Args:
+            executor (Optional[Executor]): Executor running the handlers; a thread pool is created if None.
+            max_workers (int): Size of the created thread pool.
+            handler_timeout_seconds (Optional[float]): Time the publisher waits for each handler; unlimited if None.
+        """
+        super().__init__()
+        self.executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="event-bus")
+        self.handler_timeout_seconds = handler_timeout_seconds
+        self._init_stats()
+
+    def _run(self, handler: EventHandler, events: List[Event], started_at: Optional[List[float]] = None) -> None:
+        started = time.perf_counter()
+        if started_at is not None:
+            started_at.append(started)
+        error = False
+        try:
+            if len(events) == 1:
+                handler.handle(events[0])
+            else:
+                deliver_batch(handler, events)
+        except Exception:
+            error = True
+            logger.exception("Handler %s failed on %s", _handler_name(handler), type(events[0]).__name__)
+        self._record(handler, time.perf_counter() - started, error=error)
+
+    def _fan_out(self, groups: Dict[type, List[Event]]) -> None:
+        # Each job appends its start time to its list, so deadlines count from when it started running
+        futures: Dict[Future, Tuple[EventHandler, type, List[float]]] = {}
+        for event_type, batch in groups.items():
+            for handler in self._handlers_for(event_type):
+                started_at: List[float] = []
+                future = self.executor.submit(self._run, handler, batch, started_at)
+                futures[future] = (handler, event_type, started_at)
+        timeout = self.handler_timeout_seconds
+        if timeout is None:
+            wait(futures)
+            return
+        pending = set(futures)
+        while pending:
+            deadlines = [futures[future][2][0] + timeout for future in pending if futures[future][2]]
+            # Until a pending handler has started, re-check after one timeout
+            wait_seconds = max(0.0, min(deadlines) - time.perf_counter()) if deadlines else timeout
+            _, pending = wait(pending, timeout=wait_seconds, return_when=FIRST_COMPLETED)
+            now = time.perf_counter()
+            for future in [future for future in pending if futures[future][2]]:
+                handler, event_type, started_at = futures[future]
+                if now >= started_at[0] + timeout:
+                    pending.discard(future)
+                    self._record(handler, timeout=True)
+                    logger.warning("Handler %s timed out on %s", _handler_name(handler), event_type.__name__)
+
+    def publish(self, event: Event) -> None:
+        self._fan_out({type(event): [event]})
+
+    def publish_many(self, events: Iterable[Event]) -> None:
+        """Publishes events grouped by type, each handler receiving a type's events in one ``handle_batch`` call."""
+        self._fan_out(group_by_type(events))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shuts down the executor."""
+        self.executor.shutdown(wait=wait)
@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+from sqlalchemy import JSON, Boolean, DateTime, Integer, LargeBinary, String, Uuid
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+# SQLAlchemy table mappings. Domain entities stay plain pydantic models; repositories
+# translate between these records and the entities.
+
+class Base(DeclarativeBase):
+    pass
+
+class UserRecord(Base):
+    __tablename__ = "users"
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+    email: Mapped[str] = mapped_column(String(320), unique=True, index=True)
+    hashed_password: Mapped[bytes] = mapped_column(LargeBinary(60))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False)
+
+class OutboxRecord(Base):
+    """Domain event written in the same transaction as the change that raised it."""
+    __tablename__ = "outbox"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    event_type: Mapped[str] = mapped_column(String(255))
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSON)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    # NULL until the relay has handed the event to the event bus
+    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
+    # Failed publishing attempts; once the relay's limit is reached the row is set aside with failed_at
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    failed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+class ProjectionCheckpointRecord(Base):
+    """Last outbox id applied to each read-model projection."""
+    __tablename__ = "projection_checkpoints"
+
+    name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    position: Mapped[int] = mapped_column(Integer)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
@@ -0,0 +1,235 @@
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Set, Type
+
+from pydantic import BaseModel
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+
+from your_domain.application.event_bus import AbstractAsyncEventBus, EventBus
+from your_domain.application.interfaces.outbox import AsyncOutboxInterface, OutboxInterface
+from your_domain.domain.events.user_registered import UserRegisteredEvent
+from your_domain.infrastructure.orm import OutboxRecord
+
+logger = logging.getLogger(__name__)
+
+# Stable names stored with outbox events. Only registered classes are ever rebuilt
+# from a row, and moving or renaming a class does not orphan events already stored.
+_EVENT_TYPES: Dict[str, Type[BaseModel]] = {}
+_EVENT_NAMES: Dict[Type[BaseModel], str] = {}
+
+def register_event_type(name: str, event_type: Type[BaseModel]) -> None:
+    """
+    Registers an event class under the name stored in the outbox.
+
+    Args:
+        name (str): Stable name for the event, e.g. ``user_registered``; never reuse one for another class.
+        event_type (Type[BaseModel]): The event class.
+
+    Raises:
+        ValueError: If the name or the class is already registered to something else.
+    """
+    if _EVENT_TYPES.get(name, event_type) is not event_type or _EVENT_NAMES.get(event_type, name) != name:
+        raise ValueError(f"Event type {name!r} conflicts with an existing registration")
+    _EVENT_TYPES[name] = event_type
+    _EVENT_NAMES[event_type] = name
+
+register_event_type("user_registered", UserRegisteredEvent)
+
+def registered_name(event_type: Type[BaseModel]) -> str:
+    """
+    Returns the name stored with events of a class.
+
+    Raises:
+        ValueError: If the class was never registered.
+    """
+    try:
+        return _EVENT_NAMES[event_type]
+    except KeyError:
+        raise ValueError(f"{event_type.__qualname__} is not a registered event type") from None
+
+def event_type_name(event: BaseModel) -> str:
+    """Returns the name stored with an event; see ``registered_name``."""
+    return registered_name(type(event))
+
+def _to_record(event: BaseModel) -> OutboxRecord:
+    return OutboxRecord(
+        event_type=event_type_name(event),
+        payload=event.model_dump(mode="json"),
+        occurred_at=datetime.now(timezone.utc),
+    )
+
+def deserialize_event(record: OutboxRecord) -> BaseModel:
+    """
+    Rebuilds the event stored in an outbox record.
+
+    Raises:
+        ValueError: If the record's event type is not registered.
+    """
+    event_type = _EVENT_TYPES.get(record.event_type)
+    if event_type is None:
+        raise ValueError(f"Unknown event type {record.event_type!r} in outbox record {record.id}")
+    return event_type.model_validate(record.payload)
+
+class OutboxRepository(OutboxInterface):
+    """
+    Writes events to the outbox table through the unit of work's session, so they
+    commit or roll back together with the change that raised them.
+    """
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def add(self, event: BaseModel) -> None:
+        # Flushed together with the rest of the unit of work at commit time
+        self.session.add(_to_record(event))
+
+class AsyncOutboxRepository(AsyncOutboxInterface):
+    """
+    asyncio variant of OutboxRepository.
+    """
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def add(self, event: BaseModel) -> None:
+        self.session.add(_to_record(event))
+
+class InMemoryOutbox(OutboxInterface):
+    """
+    Outbox for in-memory units of work: events are kept in ``events`` until
+    ``drain`` hands them to the caller, e.g. to publish them after the use case.
+    """
+    def __init__(self) -> None:
+        self.events: List[Any] = []
+
+    def add(self, event: Any) -> None:
+        self.events.append(event)
+
+    def drain(self) -> List[Any]:
+        events, self.events = self.events, []
+        return events
+
+class OutboxRelay:
+    """
+    Drains unpublished outbox events to the event bus in batches.
+
+    Each batch is read, handed to ``EventBus.publish_many`` (so batch-aware
+    handlers get it in one ``handle_batch`` call) and marked published in one
+    transaction. Rows are locked with ``SKIP LOCKED`` where the database supports
+    it, so several relays can run side by side.
+
+    A row that cannot be rebuilt, or whose publishing raises, does not hold back
+    the rest of the batch: if the batch fails, its events are published one at a
+    time, the failing rows get their ``attempts`` counted and are retried on later
+    passes, and after ``max_attempts`` they are set aside with ``failed_at``.
+    Delivery is at least once: events of a failed batch and of a batch whose
+    commit was lost are published again, so handlers must tolerate duplicates.
+    """
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        event_bus: EventBus,
+        batch_size: int = 100,
+        poll_interval_seconds: float = 1.0,
+        max_attempts: int = 5,
+    ) -> None:
+        """
+        Args:
+            session_factory (sessionmaker[Session]): Sessions on the database holding the outbox.
+            event_bus (EventBus): Bus the events are published to.
+            batch_size (int): Events read and published per transaction.
+            poll_interval_seconds (float): Wait between passes once the outbox is drained.
+            max_attempts (int): Failed attempts after which a row is set aside as failed.
+
+        Raises:
+            TypeError: If ``event_bus`` publishes asynchronously; the relay cannot await it.
+        """
+        if isinstance(event_bus, AbstractAsyncEventBus):
+            raise TypeError("OutboxRelay publishes synchronously; pass an EventBus, not an async bus")
+        self.session_factory = session_factory
+        self.event_bus = event_bus
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_attempts = max_attempts
+
+    def _claim_batch(self, session: Session) -> List[OutboxRecord]:
+        statement = (
+            select(OutboxRecord)
+            .where(OutboxRecord.published_at.is_(None), OutboxRecord.failed_at.is_(None))
+            .order_by(OutboxRecord.id)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        return list(session.scalars(statement))
+
+    def _publish(self, events: Dict[int, BaseModel]) -> Set[int]:
+        """Publishes events and returns the ids of the records whose events failed."""
+        try:
+            self.event_bus.publish_many(list(events.values()))
+            return set()
+        except Exception:
+            logger.warning("Publishing a batch of outbox events failed; publishing them one at a time", exc_info=True)
+        failed = set()
+        for record_id, event in events.items():
+            try:
+                self.event_bus.publish_many([event])
+            except Exception:
+                logger.exception("Publishing outbox record %s failed", record_id)
+                failed.add(record_id)
+        return failed
+
+    def _record_failures(self, records: List[OutboxRecord], now: datetime) -> None:
+        for record in records:
+            record.attempts = (record.attempts or 0) + 1
+            if record.attempts >= self.max_attempts:
+                record.failed_at = now
+                logger.error(
+                    "Outbox record %s (%s) failed %d times; it is set aside",
+                    record.id, record.event_type, record.attempts,
+                )
+
+    def relay_once(self) -> int:
+        """
+        Publishes one batch of pending events.
+
+        Returns:
+            int: Number of events published; rows that failed are counted for a retry instead.
+        """
+        try:
+            with self.session_factory() as session, session.begin():
+                records = self._claim_batch(session)
+                if not records:
+                    return 0
+                events: Dict[int, BaseModel] = {}
+                failed: Set[int] = set()
+                for record in records:
+                    try:
+                        events[record.id] = deserialize_event(record)
+                    except Exception:
+                        logger.exception("Outbox record %s cannot be rebuilt", record.id)
+                        failed.add(record.id)
+                if events:
+                    failed |= self._publish(events)
+                now = datetime.now(timezone.utc)
+                published = [record.id for record in records if record.id not in failed]
+                if published:
+                    session.execute(
+                        update(OutboxRecord).where(OutboxRecord.id.in_(published)).values(published_at=now)
+                    )
+                self._record_failures([record for record in records if record.id in failed], now)
+                return len(published)
+        except Exception:
+            logger.exception("Relaying a batch of outbox events failed; it will be retried")
+            return 0
+
+    def run(self, stop: threading.Event) -> None:
+        """
+        Relays events until ``stop`` is set, polling while the outbox is empty.
+
+        Args:
+            stop (threading.Event): Set to end the loop after the current batch.
+        """
+        while not stop.is_set():
+            if self.relay_once() < self.batch_size:
+                stop.wait(self.poll_interval_seconds)
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Set
+from uuid import UUID
+
+from your_domain.application.interfaces.password_rehasher import PasswordRehasherInterface
+from your_domain.application.uow import AbstractAsyncUnitOfWork, AbstractUnitOfWork
+from your_domain.domain.entities.user import User
+from your_domain.domain.value_objects.password_hash import PasswordHash
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class RehashStats:
+    rehashed: int = 0
+    skipped: int = 0  # The password changed or the user disappeared before the rehash was written
+    dropped: int = 0  # Not scheduled because the queue was full; retried at the next login
+    failed: int = 0
+
+class BackgroundPasswordRehasher(PasswordRehasherInterface):
+    """
+    Upgrades (or downgrades) stored BCrypt hashes to the configured cost after a
+    successful login, on a background executor so the login does not pay for a
+    second hash.
+
+    The new hash is written only if the stored hash is still the one that was
+    verified, so a password changed in the meantime is never overwritten. Each
+    job opens its own unit of work from ``uow_factory``, because units of work
+    hold per-transaction state and cannot be shared across threads.
+    """
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractUnitOfWork],
+        max_pending: int = 100,
+        executor: Optional[Executor] = None
+    ) -> None:
+        """
+        Args:
+            uow_factory (Callable[[], AbstractUnitOfWork]): Builds a unit of work per job.
+            max_pending (int): Rehashes allowed in flight; further ones are dropped.
+            executor (Optional[Executor]): Where jobs run; defaults to a single background thread.
+        """
+        self.uow_factory = uow_factory
+        self.max_pending = max_pending
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="rehash")
+        self.stats = RehashStats()
+        self._pending: Set[UUID] = set()
+        self._lock = threading.Lock()
+
+    def schedule(self, user: User, plain_text_password: str) -> None:
+        with self._lock:
+            if user.id in self._pending:
+                return
+            if len(self._pending) >= self.max_pending:
+                self.stats.dropped += 1
+                return
+            self._pending.add(user.id)
+        self.executor.submit(self._rehash, user.id, user.password_hash.hashed_password, plain_text_password)
+
+    def _rehash(self, user_id: UUID, verified_hash: bytes, plain_text_password: str) -> None:
+        try:
+            new_hash = PasswordHash.create(plain_text_password)
+            with self.uow_factory() as uow:
+                user = uow.users.find_by_id(user_id)
+                if user is None or user.password_hash.hashed_password != verified_hash:
+                    self.stats.skipped += 1
+                    return
+                user.password_hash = new_hash
+                uow.users.update(user)
+            self.stats.rehashed += 1
+        except Exception:
+            self.stats.failed += 1
+            logger.exception("Rehashing the password of user %s failed", user_id)
+        finally:
+            with self._lock:
+                self._pending.discard(user_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shuts down the executor, by default after the pending rehashes have been written."""
+        self.executor.shutdown(wait=wait)
+
+class AsyncBackgroundPasswordRehasher(PasswordRehasherInterface):
+    """
+    asyncio variant of BackgroundPasswordRehasher, for AsyncAuthenticateUser.
+
+    Each rehash is a task on the running event loop: the new hash is computed on
+    the shared hashing pool and written through its own async unit of work, under
+    the same rule that a password changed in the meantime is never overwritten.
+    ``schedule`` must be called from the loop.
+    """
+    def __init__(self, uow_factory: Callable[[], AbstractAsyncUnitOfWork], max_pending: int = 100) -> None:
+        """
+        Args:
+            uow_factory (Callable[[], AbstractAsyncUnitOfWork]): Builds a unit of work per job.
+            max_pending (int): Rehashes allowed in flight; further ones are dropped.
+        """
+        self.uow_factory = uow_factory
+        self.max_pending = max_pending
+        self.stats = RehashStats()
+        self._tasks: Dict[UUID, "asyncio.Task[None]"] = {}
+
+    def schedule(self, user: User, plain_text_password: str) -> None:
+        if user.id in self._tasks:
+            return
+        if len(self._tasks) >= self.max_pending:
+            self.stats.dropped += 1
+            return
+        task = asyncio.get_running_loop().create_task(
+            self._rehash(user.id, user.password_hash.hashed_password, plain_text_password)
+        )
+        self._tasks[user.id] = task
+        task.add_done_callback(lambda _, user_id=user.id: self._tasks.pop(user_id, None))
+
+    async def _rehash(self, user_id: UUID, verified_hash: bytes, plain_text_password: str) -> None:
+        try:
+            new_hash = await PasswordHash.create_async(plain_text_password)
+            async with self.uow_factory() as uow:
+                user = await uow.users.find_by_id(user_id)
+                if user is None or user.password_hash.hashed_password != verified_hash:
+                    self.stats.skipped += 1
+                    return
+                user.password_hash = new_hash
+                await uow.users.update(user)
+            self.stats.rehashed += 1
+        except Exception:
+            self.stats.failed += 1
+            logger.exception("Rehashing the password of user %s failed", user_id)
+
+    async def shutdown(self) -> None:
+        """Waits until the pending rehashes have been written."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks.values())
@@ -0,0 +1,269 @@
+import logging
+import threading
+from abc import abstractmethod
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Protocol, Sequence, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from your_domain.application.event_bus import EventHandler
+from your_domain.domain.events.user_registered import UserRegisteredEvent
+from your_domain.infrastructure.orm import OutboxRecord, ProjectionCheckpointRecord
+from your_domain.infrastructure.outbox import deserialize_event, registered_name
+
+logger = logging.getLogger(__name__)
+
+class Projection(EventHandler):
+    """
+    Read model kept up to date from domain events.
+
+    Applying an event must be idempotent: the runner delivers events at least once.
+    A projection can be subscribed to the event bus directly, or fed from the
+    outbox by a ProjectionRunner, which also supports checkpoints and rebuilds.
+    """
+    # Unique name, used as the checkpoint key
+    name: str
+    # Registered event classes the projection consumes; others are skipped
+    event_types: Tuple[type, ...] = ()
+
+    @abstractmethod
+    def apply(self, event: BaseModel) -> None:
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Drops all state, before a rebuild."""
+
+    def handle(self, event: BaseModel) -> None:
+        self.apply(event)
+
+class UserProfileSummary(BaseModel):
+    """Denormalized user profile, served without touching the users table."""
+    user_id: UUID
+    email: str
+    registered_at: datetime
+    email_confirmed: bool = False
+
+class UserProfileSummaryProjection(Projection):
+    """In-memory view of UserProfileSummary, indexed by id and by case-folded email."""
+    name = "user_profile_summary"
+    event_types = (UserRegisteredEvent,)
+
+    def __init__(self) -> None:
+        self._by_id: Dict[UUID, UserProfileSummary] = {}
+        self._id_by_email: Dict[str, UUID] = {}
+        self._lock = threading.Lock()
+
+    def apply(self, event: BaseModel) -> None:
+        if isinstance(event, UserRegisteredEvent):
+            summary = UserProfileSummary(user_id=event.user_id, email=event.email, registered_at=event.registered_at)
+            with self._lock:
+                self._by_id[summary.user_id] = summary
+                self._id_by_email[summary.email.casefold()] = summary.user_id
+
+    def reset(self) -> None:
+        with self._lock:
+            self._by_id = {}
+            self._id_by_email = {}
+
+    def get(self, user_id: UUID) -> Optional[UserProfileSummary]:
+        return self._by_id.get(user_id)
+
+    def get_by_email(self, email: str) -> Optional[UserProfileSummary]:
+        user_id = self._id_by_email.get(email.casefold())
+        return self._by_id.get(user_id) if user_id is not None else None
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+class CheckpointStore(Protocol):
+    """Remembers the last outbox id each projection has applied."""
+    def load(self, name: str) -> int:
+        ...
+
+    def save(self, name: str, position: int) -> None:
+        ...
+
+class InMemoryCheckpointStore(CheckpointStore):
+    """
+    Checkpoints for in-memory projections, which are rebuilt from scratch on every start.
+    """
+    def __init__(self) -> None:
+        self._positions: Dict[str, int] = {}
+
+    def load(self, name: str) -> int:
+        return self._positions.get(name, 0)
+
+    def save(self, name: str, position: int) -> None:
+        self._positions[name] = position
+
+class SqlCheckpointStore(CheckpointStore):
+    """
+    Checkpoints in the projection_checkpoints table, for projections persisted in
+    read tables. Write the read table and the checkpoint in one transaction where
+    possible so they cannot drift apart.
+    """
+    def __init__(self, session_factory: sessionmaker[Session]) -> None:
+        self.session_factory = session_factory
+
+    def load(self, name: str) -> int:
+        with self.session_factory() as session:
+            record = session.get(ProjectionCheckpointRecord, name)
+            return record.position if record is not None else 0
+
+    def save(self, name: str, position: int) -> None:
+        with self.session_factory() as session, session.begin():
+            session.merge(
+                ProjectionCheckpointRecord(name=name, position=position, updated_at=datetime.now(timezone.utc))
+            )
+
+class ProjectionRunner:
+    """
+    Feeds projections from the outbox table, which keeps published events and so
+    doubles as the event log.
+
+    Each pass reads the events after each projection's own checkpoint (once per
+    distinct checkpoint), applies them in batches of consecutive events of one
+    type, and then advances the checkpoint. A checkpoint never moves past
+    an event the projection consumes but could not rebuild or apply: the failure is
+    logged and the event is retried on the next pass. Outbox ids are assigned at
+    insert time, so an id committed after a higher one has been read is skipped;
+    keep write transactions short or rebuild periodically if that matters.
+    """
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        projections: Sequence[Projection],
+        checkpoints: CheckpointStore,
+        batch_size: int = 500,
+        poll_interval_seconds: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            session_factory (sessionmaker[Session]): Sessions on the database holding the outbox.
+            projections (Sequence[Projection]): Projections to keep up to date.
+            checkpoints (CheckpointStore): Where positions are kept.
+            batch_size (int): Events read per pass.
+            poll_interval_seconds (float): Wait between passes once every projection is caught up.
+        """
+        self.session_factory = session_factory
+        self.projections = list(projections)
+        self.checkpoints = checkpoints
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+
+    def _read(self, after: int) -> List[OutboxRecord]:
+        with self.session_factory() as session:
+            return list(session.scalars(
+                select(OutboxRecord).where(OutboxRecord.id > after).order_by(OutboxRecord.id).limit(self.batch_size)
+            ))
+
+    @staticmethod
+    def _handle(projection: Projection, batch: List[BaseModel]) -> bool:
+        try:
+            projection.handle_batch(batch)
+            return True
+        except Exception:
+            logger.exception(
+                "Projection %s failed to apply %s; it will be retried", projection.name, type(batch[0]).__name__
+            )
+            return False
+
+    def _apply(self, projection: Projection, records: List[OutboxRecord], position: int) -> int:
+        """
+        Applies the records a projection consumes, in order.
+
+        Returns:
+            int: The new checkpoint: every record up to it was applied or is not consumed by the projection.
+        """
+        consumed = {registered_name(event_type) for event_type in projection.event_types}
+        batch: List[BaseModel] = []
+        # Every record up to here was skipped or is in ``batch``
+        reached = position
+        for record in records:
+            if record.event_type in consumed:
+                try:
+                    event = deserialize_event(record)
+                except Exception:
+                    logger.exception("Projection %s cannot rebuild outbox record %s", projection.name, record.id)
+                    break
+                if batch and type(event) is not type(batch[0]):
+                    if not self._handle(projection, batch):
+                        return position
+                    position, batch = reached, []
+                batch.append(event)
+            reached = record.id
+        if batch and not self._handle(projection, batch):
+            return position
+        return reached
+
+    def _pass(self) -> Tuple[int, bool]:
+        positions = {projection.name: self.checkpoints.load(projection.name) for projection in self.projections}
+        if not positions:
+            return 0, False
+        # Projections at the same checkpoint share one read; a stalled one does not hold back the others
+        reads: Dict[int, List[OutboxRecord]] = {}
+        read = 0
+        advanced = False
+        for projection in self.projections:
+            position = positions[projection.name]
+            if position not in reads:
+                reads[position] = self._read(position)
+            records = reads[position]
+            read = max(read, len(records))
+            reached = self._apply(projection, records, position)
+            if reached != position:
+                self.checkpoints.save(projection.name, reached)
+                advanced = True
+        return read, advanced
+
+    def run_once(self) -> int:
+        """
+        Applies one batch of events to every projection.
+
+        Returns:
+            int: Number of events in the largest batch read for a projection.
+        """
+        return self._pass()[0]
+
+    def catch_up(self) -> int:
+        """
+        Applies events until every projection has reached the end of the outbox,
+        or no checkpoint moves because the remaining projections keep failing.
+
+        Returns:
+            int: Number of events read.
+        """
+        total = 0
+        while True:
+            read, advanced = self._pass()
+            total += read
+            if read < self.batch_size or not advanced:
+                return total
+
+    def rebuild(self, projection: Projection) -> int:
+        """
+        Resets a projection and replays the whole outbox into it.
+
+        Returns:
+            int: Number of events read.
+        """
+        projection.reset()
+        self.checkpoints.save(projection.name, 0)
+        runner = ProjectionRunner(self.session_factory, [projection], self.checkpoints, self.batch_size)
+        return runner.catch_up()
+
+    def run(self, stop: threading.Event) -> None:
+        """
+        Applies events until ``stop`` is set, polling once caught up.
+
+        Args:
+            stop (threading.Event): Set to end the loop after the current batch.
+        """
+        while not stop.is_set():
+            read, advanced = self._pass()
+            if read < self.batch_size or not advanced:
+                stop.wait(self.poll_interval_seconds)
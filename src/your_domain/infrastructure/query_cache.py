@@ -0,0 +1,213 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+from your_domain.application.cqrs import Query, QueryHandler
+from your_domain.application.event_bus import Event, EventHandler
+from your_domain.infrastructure.cache import CacheBackend, CacheStats, TTLCache
+
+def query_cache_key(query: Query) -> Tuple[Hashable, ...]:
+    """
+    Key for a query: its type plus its field values, so equal queries share an entry.
+    Unhashable field values are keyed by their repr.
+    """
+    fields = query.model_dump() if hasattr(query, "model_dump") else vars(query)
+    items = []
+    for name, value in sorted(fields.items()):
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        items.append((name, value))
+    return (type(query).__module__, type(query).__qualname__, *items)
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+class QueryCache:
+    """
+    Store of query results shared by CachedQueryHandlers, with tag-based invalidation.
+
+    Each result is stored with the tags it was cached with (e.g. ``user:<id>``) and
+    the version each tag had at the time; tag versions live in the backend too.
+    ``invalidate`` drops the versions of the given tags, so every entry carrying
+    one of them stops matching and is treated as a miss, and nothing has to track
+    which keys a tag covers. With a shared backend, invalidations are therefore
+    seen by every process.
+
+    A result computed while one of its tags was invalidated in this process is not
+    stored, so a slow query cannot put stale data back into the cache; invalidations
+    from other processes during a computation are only bounded by the ttl.
+    """
+    def __init__(self, backend: Optional[CacheBackend] = None, tag_ttl: float = 86_400.0) -> None:
+        """
+        Args:
+            backend (Optional[CacheBackend]): Where entries live; defaults to a size-bounded in-process TTLCache.
+            tag_ttl (float): Seconds tag versions are kept. An entry whose tag version expired is a
+                miss, so this bounds the ttl of every CachedQueryHandler using the cache.
+        """
+        self.backend = backend if backend is not None else TTLCache()
+        self.tag_ttl = tag_ttl
+        self.stats = CacheStats()
+        # Invalidations seen while computations were in flight: tag -> sequence number.
+        # Emptied whenever no computation is running, so it stays small.
+        self._sequence = 0
+        self._cleared_at = 0
+        self._in_flight = 0
+        self._invalidated: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _tag_key(tag: str) -> Tuple[str, str]:
+        return ("query-tag", tag)
+
+    def _tag_version(self, tag: str) -> str:
+        version = self.backend.get(self._tag_key(tag))
+        if version is None:
+            # Entries always record a version, so one dropped by invalidate or evicted never matches again
+            version = uuid4().hex
+            self.backend.set(self._tag_key(tag), version, self.tag_ttl)
+        return version
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any]]:
+        # Results are returned in a 1-tuple so a cached None is distinguishable from a miss
+        entry = self.backend.get(key)
+        if entry is not None:
+            result, versions = entry
+            if all(self.backend.get(self._tag_key(tag)) == version for tag, version in versions.items()):
+                self.stats.hits += 1
+                return (result,)
+        self.stats.misses += 1
+        return None
+
+    def begin(self) -> int:
+        """
+        Marks the start of a computation whose result will be passed to ``set``.
+
+        Returns:
+            int: Token to pass to ``set``; call ``end`` once done.
+        """
+        with self._lock:
+            self._in_flight += 1
+            return self._sequence
+
+    def end(self) -> None:
+        """Marks the end of a computation started with ``begin``."""
+        with self._lock:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._invalidated.clear()
+
+    def set(self, key: Hashable, result: Any, ttl: Optional[float], tags: Iterable[str], started: int) -> None:
+        """
+        Stores a result unless one of its tags was invalidated since ``begin`` returned ``started``.
+        """
+        tags = list(tags)
+        with self._lock:
+            if started < self._cleared_at or any(self._invalidated.get(tag, 0) > started for tag in tags):
+                return
+            versions = {tag: self._tag_version(tag) for tag in tags}
+            self.backend.set(key, (result, versions), ttl)
+
+    def invalidate(self, *tags: str) -> None:
+        """Drops every entry cached with any of ``tags``."""
+        with self._lock:
+            self._sequence += 1
+            if self._in_flight:
+                for tag in tags:
+                    self._invalidated[tag] = self._sequence
+            if tags:
+                self.backend.delete(*(self._tag_key(tag) for tag in tags))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sequence += 1
+            self._cleared_at = self._sequence
+            self.backend.clear()
+
+class CachedQueryHandler(QueryHandler[Any]):
+    """
+    Caching decorator for a QueryHandler.
+
+    Results are keyed by the query's type and fields and kept for ``ttl`` seconds
+    or until one of their tags is invalidated. Concurrent identical queries are
+    single-flighted: the first runs the handler, the others wait for its result.
+    Cached results are shared between callers and must not be mutated.
+    """
+    def __init__(
+        self,
+        inner: QueryHandler[Any],
+        cache: QueryCache,
+        ttl: float = 60.0,
+        tags: Optional[Callable[[Query, Any], Iterable[str]]] = None,
+    ) -> None:
+        """
+        Args:
+            inner (QueryHandler): Handler computing the result on a miss.
+            cache (QueryCache): Cache shared with the invalidators.
+            ttl (float): Seconds a result of this query type may be served; at most ``cache.tag_ttl``.
+            tags (Optional[Callable[[Query, Any], Iterable[str]]]): Tags for a result, e.g.
+                ``lambda query, user: [f"user:{query.user_id}"]``.
+
+        Raises:
+            ValueError: If ``ttl`` is longer than the cache keeps tag versions.
+        """
+        if ttl > cache.tag_ttl:
+            raise ValueError(f"ttl {ttl} exceeds the cache's tag_ttl {cache.tag_ttl}")
+        self.inner = inner
+        self.cache = cache
+        self.ttl = ttl
+        self.tags = tags
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def handle(self, query: Query) -> Any:
+        key = query_cache_key(query)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry[0]
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        started = self.cache.begin()
+        try:
+            flight.result = self.inner.handle(query)
+            tags = self.tags(query, flight.result) if self.tags is not None else ()
+            self.cache.set(key, flight.result, self.ttl, tags, started)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            self.cache.end()
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+class QueryCacheInvalidator(EventHandler):
+    """
+    Event handler that invalidates cached query results when domain events arrive,
+    e.g. subscribed to a user-updated event with ``lambda event: [f"user:{event.user_id}"]``.
+    Commands can call ``QueryCache.invalidate`` directly instead.
+    """
+    def __init__(self, cache: QueryCache, tags: Callable[[Event], Iterable[str]]) -> None:
+        self.cache = cache
+        self.tags = tags
+
+    def handle(self, event: Event) -> None:
+        self.cache.invalidate(*self.tags(event))
+
+    def handle_batch(self, events: List[Event]) -> None:
+        self.cache.invalidate(*(tag for event in events for tag in self.tags(event)))
@@ -0,0 +1,102 @@
+import math
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+from your_domain.application.interfaces.rate_limiter import RateLimiterInterface
+
+class _Bucket:
+    __slots__ = ("tokens", "updated_at", "slot")  # slot is -1 while not on the wheel
+
+    def __init__(self, tokens: float, updated_at: float, slot: int) -> None:
+        self.tokens = tokens
+        self.updated_at = updated_at
+        self.slot = slot
+
+class TokenBucketRateLimiter(RateLimiterInterface):
+    """
+    Thread-safe in-process token buckets, one per key.
+
+    Each bucket holds up to ``capacity`` tokens and refills at
+    ``refill_per_second``. A bucket left alone long enough to refill completely
+    is indistinguishable from a new one, so it is dropped; a timing wheel finds
+    those buckets in O(1) per expired key instead of scanning the whole store,
+    keeping memory proportional to the keys seen in the last refill period.
+    """
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        wheel_slots: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            capacity (float): Burst size, in tokens.
+            refill_per_second (float): Sustained rate, in tokens per second.
+            wheel_slots (int): Resolution of the expiry wheel over one refill period.
+            clock (Callable[[], float]): Monotonic time source, in seconds.
+        """
+        if capacity <= 0 or refill_per_second <= 0:
+            raise ValueError("capacity and refill_per_second must be positive")
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.clock = clock
+        # A bucket is full again this long after its last use
+        self._idle_seconds = capacity / refill_per_second
+        self._slot_seconds = self._idle_seconds / wheel_slots
+        # Two spare slots so a bucket is never scheduled into the slot being processed
+        self._wheel: List[Set[str]] = [set() for _ in range(wheel_slots + 2)]
+        self._tick = math.floor(clock() / self._slot_seconds)
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _advance(self, now: float) -> None:
+        tick = math.floor(now / self._slot_seconds)
+        # Once a whole revolution has passed, every slot is due
+        for current in range(self._tick + 1, min(tick, self._tick + len(self._wheel)) + 1):
+            index = current % len(self._wheel)
+            due, self._wheel[index] = self._wheel[index], set()
+            for key in due:
+                bucket = self._buckets[key]
+                bucket.slot = -1
+                if now - bucket.updated_at >= self._idle_seconds:
+                    del self._buckets[key]
+                else:
+                    self._schedule(key, bucket)
+        self._tick = max(self._tick, tick)
+
+    def _schedule(self, key: str, bucket: _Bucket) -> None:
+        slot = math.ceil((bucket.updated_at + self._idle_seconds) / self._slot_seconds) % len(self._wheel)
+        if slot != bucket.slot:
+            if bucket.slot >= 0:
+                self._wheel[bucket.slot].discard(key)
+            self._wheel[slot].add(key)
+            bucket.slot = slot
+
+    def try_acquire(self, key: str, cost: float = 1.0) -> bool:
+        now = self.clock()
+        with self._lock:
+            self._advance(now)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket(self.capacity, now, slot=-1)
+            else:
+                bucket.tokens = min(self.capacity, bucket.tokens + (now - bucket.updated_at) * self.refill_per_second)
+                bucket.updated_at = now
+            allowed = bucket.tokens >= cost
+            if allowed:
+                bucket.tokens -= cost
+            self._schedule(key, bucket)
+            return allowed
+
+    def tokens(self, key: str) -> Optional[float]:
+        """Tokens currently in the bucket for ``key``; None if the key has no bucket, i.e. it would be full."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                return None
+            return min(self.capacity, bucket.tokens + (self.clock() - bucket.updated_at) * self.refill_per_second)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
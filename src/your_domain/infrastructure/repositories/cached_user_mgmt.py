@@ -0,0 +1,241 @@
+from uuid import UUID, uuid4
+from typing import Any, Dict, Iterable, Optional, Set
+
+from your_domain.application.interfaces.user_mgmt import UserMgmtInterface
+from your_domain.domain.entities.user import User
+from your_domain.domain.value_objects.email import Email
+from your_domain.infrastructure.cache import CacheBackend, CacheStats, TTLCache
+
+class UserCache:
+    """
+    Process-wide store of users keyed by id, with an email -> id index.
+
+    Emails only map to ids, so each user is stored once and the two keys cannot
+    disagree: an email entry pointing at a user whose address changed is treated
+    as a miss. Users are copied on the way in and out, so callers mutating a
+    returned entity cannot change the cached one.
+
+    Every invalidation also gives the invalidated keys a new version. Readers take
+    the versions of the keys they look up before querying the database and pass
+    them to ``put``, which drops the user if any of them changed in between: a row
+    read just before a write committed is never cached after that write.
+    """
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: Optional[float] = 300.0) -> None:
+        """
+        Args:
+            backend (Optional[CacheBackend]): Where entries live; defaults to an in-process TTLCache.
+            ttl (Optional[float]): Seconds an entry may be served. Bounds staleness for
+                writes made by other processes.
+        """
+        self.backend = backend if backend is not None else TTLCache(default_ttl=ttl)
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    @staticmethod
+    def _id_key(user_id: UUID) -> str:
+        return f"user:id:{user_id}"
+
+    @staticmethod
+    def _email_key(address: str) -> str:
+        return f"user:email:{address}"
+
+    @staticmethod
+    def _version_key(key: str) -> str:
+        return f"{key}:version"
+
+    def versions(self, user_ids: Iterable[UUID] = (), addresses: Iterable[str] = ()) -> Dict[str, Any]:
+        """
+        Current versions of the id and email keys, to be taken before reading the database.
+
+        Returns:
+            Dict[str, Any]: Versions to pass to ``put``.
+        """
+        keys = [self._id_key(user_id) for user_id in user_ids] + [self._email_key(address) for address in addresses]
+        return {key: self.backend.get(self._version_key(key)) for key in keys}
+
+    def get_by_id(self, user_id: UUID) -> Optional[User]:
+        user = self.backend.get(self._id_key(user_id))
+        if user is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return user.model_copy()
+
+    def get_by_email(self, email: Email) -> Optional[User]:
+        address = str(email.address)
+        user_id = self.backend.get(self._email_key(address))
+        user = self.backend.get(self._id_key(user_id)) if user_id is not None else None
+        if user is None or str(user.email.address) != address:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return user.model_copy()
+
+    def put(self, user: User, versions: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Caches a user read from the database.
+
+        Args:
+            user (User): The user as read.
+            versions (Optional[Dict[str, Any]]): What ``versions`` returned before the read;
+                the user is not cached if any of those keys was invalidated since.
+        """
+        if versions and any(self.backend.get(self._version_key(key)) != version for key, version in versions.items()):
+            return
+        self.backend.set(self._id_key(user.id), user.model_copy(), self.ttl)
+        self.backend.set(self._email_key(str(user.email.address)), user.id, self.ttl)
+
+    def invalidate(self, user_id: UUID, *addresses: str) -> None:
+        """
+        Drops a user and bumps the versions of its keys.
+
+        Args:
+            user_id (UUID): The user to drop.
+            *addresses (str): Email addresses the user has or had, besides the cached one.
+        """
+        cached = self.backend.get(self._id_key(user_id))
+        keys = [self._id_key(user_id)] + [self._email_key(address) for address in addresses]
+        if cached is not None:
+            keys.append(self._email_key(str(cached.email.address)))
+        for key in keys:
+            self.backend.set(self._version_key(key), uuid4().hex, self.ttl)
+        self.backend.delete(*keys)
+
+class CachedUserMgmt(UserMgmtInterface):
+    """
+    Read-through cache in front of a UserMgmtInterface.
+
+    Lookups by id and email are served from the shared UserCache when possible and
+    populated from the wrapped repository on a miss. Writes invalidate the affected
+    entries instead of writing through, because the surrounding unit of work may
+    still roll back; for the same reason users written through this instance are
+    neither read from nor stored in the cache afterwards. Create one instance per
+    unit of work (e.g. via its users_factory). Misses are never cached, so a newly
+    registered email is visible immediately.
+
+    Entries are invalidated both before the write and again in ``after_commit``,
+    which SqlAlchemyUnitOfWork calls once the transaction has committed. Until then
+    other units of work still read the old row, and the second invalidation stops
+    them from keeping it cached for the whole TTL.
+    """
+    def __init__(self, inner: UserMgmtInterface, cache: UserCache) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            inner (UserMgmtInterface): Repository that owns the data.
+            cache (UserCache): Cache shared by every repository instance in the process.
+        """
+        self.inner = inner
+        self.cache = cache
+        # Users changed through this instance; their rows may not be committed yet
+        self._written_ids: Set[UUID] = set()
+        self._written_emails: Set[str] = set()
+        # Invalidations to repeat once the unit of work has committed: user id -> addresses
+        self._pending: Dict[UUID, Set[str]] = {}
+
+    def _mark_written(self, user: User) -> None:
+        self._written_ids.add(user.id)
+        self._written_emails.add(str(user.email.address))
+
+    def _store(self, user: User, versions: Dict[str, Any]) -> None:
+        if user.id not in self._written_ids and str(user.email.address) not in self._written_emails:
+            self.cache.put(user, versions)
+
+    def _invalidate(self, user: User) -> None:
+        addresses = {str(user.email.address)}
+        # The stored row may still carry the previous address
+        previous = self.inner.find_by_id(user.id)
+        if previous is not None:
+            addresses.add(str(previous.email.address))
+        self._pending.setdefault(user.id, set()).update(addresses)
+        self.cache.invalidate(user.id, *addresses)
+
+    def after_commit(self) -> None:
+        """Repeats this unit of work's invalidations now that its writes are visible to other readers."""
+        pending, self._pending = self._pending, {}
+        for user_id, addresses in pending.items():
+            self.cache.invalidate(user_id, *addresses)
+
+    def add(self, user: User) -> None:
+        self._mark_written(user)
+        self.inner.add(user)
+
+    def add_many(self, users: Iterable[User]) -> None:
+        users = list(users)
+        for user in users:
+            self._mark_written(user)
+        self.inner.add_many(users)
+
+    def update(self, user: User) -> None:
+        self._mark_written(user)
+        self._invalidate(user)
+        self.inner.update(user)
+
+    def hard_delete(self, user: User) -> None:
+        self._mark_written(user)
+        self._invalidate(user)
+        self.inner.hard_delete(user)
+
+    def find_by_id(self, user_id: UUID) -> Optional[User]:
+        if user_id not in self._written_ids:
+            user = self.cache.get_by_id(user_id)
+            if user is not None:
+                return user
+        versions = self.cache.versions(user_ids=[user_id])
+        user = self.inner.find_by_id(user_id)
+        if user is not None:
+            self._store(user, versions)
+        return user
+
+    def find_by_email(self, email: Email) -> Optional[User]:
+        if str(email.address) not in self._written_emails:
+            user = self.cache.get_by_email(email)
+            if user is not None and user.id not in self._written_ids:
+                return user
+        versions = self.cache.versions(addresses=[str(email.address)])
+        user = self.inner.find_by_email(email)
+        if user is not None:
+            self._store(user, versions)
+        return user
+
+    def find_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        found: Dict[UUID, User] = {}
+        missing = []
+        for user_id in user_ids:
+            user = self.cache.get_by_id(user_id) if user_id not in self._written_ids else None
+            if user is not None:
+                found[user_id] = user
+            else:
+                missing.append(user_id)
+        if missing:
+            versions = self.cache.versions(user_ids=missing)
+            loaded = self.inner.find_by_ids(missing)
+            for user in loaded.values():
+                self._store(user, {self.cache._id_key(user.id): versions[self.cache._id_key(user.id)]})
+            found.update(loaded)
+        return found
+
+    def find_by_emails(self, emails: Iterable[Email]) -> Dict[Email, User]:
+        found: Dict[Email, User] = {}
+        missing = []
+        for email in emails:
+            user = self.cache.get_by_email(email) if str(email.address) not in self._written_emails else None
+            if user is not None and user.id not in self._written_ids:
+                found[email] = user
+            else:
+                missing.append(email)
+        if missing:
+            versions = self.cache.versions(addresses=[str(email.address) for email in missing])
+            loaded = self.inner.find_by_emails(missing)
+            for email, user in loaded.items():
+                key = self.cache._email_key(str(email.address))
+                self._store(user, {key: versions[key]})
+            found.update(loaded)
+        return found
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose other repository operations (e.g. iter_emails) of the wrapped repository.
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
@@ -0,0 +1,112 @@
+from uuid import UUID
+from typing import Any, Dict, Iterable, Optional
+
+from your_domain.application.interfaces.user_mgmt import UserMgmtInterface
+from your_domain.infrastructure.bloom_filter import BloomFilter
+from your_domain.domain.entities.user import User
+from your_domain.domain.value_objects.email import Email
+
+def email_filter_key(address: str) -> str:
+    """
+    Key used for an address in the email filter.
+
+    The whole address is case-folded. Folding can only merge keys, so it may add
+    false positives but never hides a registered address.
+    """
+    return address.casefold()
+
+class EmailFilteredUserMgmt(UserMgmtInterface):
+    """
+    UserMgmtInterface decorator that answers "is this email taken?" misses from memory.
+
+    ``is_email_possibly_taken`` consults a Bloom filter over every registered email;
+    RegisterUser uses it to skip the uniqueness query when the filter says the
+    address was never added. Every other lookup, ``find_by_email`` included, goes
+    to the wrapped repository unchanged, because login and password reset need an
+    exact answer.
+
+    The filter is per process, so a user registered by another worker after warm-up is
+    invisible to the pre-check. The unique constraint on email remains the final guard:
+    the repository turns the violation into DuplicateUserError.
+    """
+    def __init__(self, inner: UserMgmtInterface, email_filter: BloomFilter) -> None:
+        """
+        Initialize the decorator.
+
+        Args:
+            inner (UserMgmtInterface): Repository that owns the data.
+            email_filter (BloomFilter): Filter holding the keys of all registered emails.
+        """
+        self.inner = inner
+        self.email_filter = email_filter
+        self.lookups = 0
+        self.skipped_lookups = 0
+
+    @classmethod
+    def warm(
+        cls,
+        inner: UserMgmtInterface,
+        emails: Iterable[str],
+        capacity: int,
+        false_positive_rate: float = 0.01
+    ) -> "EmailFilteredUserMgmt":
+        """
+        Build the decorator with a filter preloaded from existing emails.
+
+        Args:
+            inner (UserMgmtInterface): Repository that owns the data.
+            emails (Iterable[str]): Every registered email, e.g. UserMgmtRepository.iter_emails().
+            capacity (int): Expected number of users, including expected growth.
+            false_positive_rate (float): Target false positive rate at capacity.
+
+        Returns:
+            EmailFilteredUserMgmt: The warmed decorator.
+        """
+        email_filter = BloomFilter(capacity, false_positive_rate)
+        email_filter.update(email_filter_key(email) for email in emails)
+        return cls(inner, email_filter)
+
+    def add(self, user: User) -> None:
+        self.inner.add(user)
+        self.email_filter.add(email_filter_key(str(user.email.address)))
+
+    def update(self, user: User) -> None:
+        # The previous address stays in the filter; that only costs a false positive.
+        self.inner.update(user)
+        self.email_filter.add(email_filter_key(str(user.email.address)))
+
+    def is_email_possibly_taken(self, email: Email) -> bool:
+        """
+        Returns False if the email is definitely not registered (as far as this process knows).
+
+        Only the registration uniqueness check should rely on this; a False here can be
+        wrong for a user registered by another worker.
+        """
+        self.lookups += 1
+        if not self.email_filter.might_contain(email_filter_key(str(email.address))):
+            self.skipped_lookups += 1
+            return False
+        return True
+
+    def find_by_email(self, email: Email) -> Optional[User]:
+        return self.inner.find_by_email(email)
+
+    def find_by_id(self, user_id: UUID) -> Optional[User]:
+        return self.inner.find_by_id(user_id)
+
+    def add_many(self, users: Iterable[User]) -> None:
+        users = list(users)
+        self.inner.add_many(users)
+        self.email_filter.update(email_filter_key(str(user.email.address)) for user in users)
+
+    def find_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        return self.inner.find_by_ids(user_ids)
+
+    def find_by_emails(self, emails: Iterable[Email]) -> Dict[Email, User]:
+        return self.inner.find_by_emails(emails)
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose optional repository operations (e.g. hard_delete) of the wrapped repository.
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
@@ -0,0 +1,240 @@
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Union
+from uuid import UUID
+
+from your_domain.application.interfaces.user_mgmt import DuplicateUserError, UserMgmtInterface
+from your_domain.application.uow import AbstractUnitOfWork
+from your_domain.domain.entities.user import User
+from your_domain.domain.value_objects.email import Email
+from your_domain.domain.value_objects.password_hash import PasswordHash
+from your_domain.infrastructure.outbox import InMemoryOutbox
+
+def _email_key(email: Email) -> str:
+    # Email already normalizes the domain; this matches the users.email unique column
+    return str(email.address)
+
+class InMemoryUserMgmtRepository(UserMgmtInterface):
+    """
+    Thread-safe UserMgmtInterface kept entirely in process memory.
+
+    Users are indexed by id and by normalized email, so every lookup is a dict
+    access with no ORM involved. Semantics follow UserMgmtRepository: ids and
+    emails are unique, ``update`` inserts unknown users (like ``merge``), soft
+    deletion is an update with ``is_deleted`` set and soft-deleted users are
+    still returned by the finders. Stored users are copies, so callers cannot
+    change them without going through the repository.
+
+    Writes take effect immediately; there is no transaction to roll back. Use
+    ``snapshot``/``restore`` to persist the data across restarts.
+    """
+    def __init__(self) -> None:
+        self._by_id: Dict[UUID, User] = {}
+        self._id_by_email: Dict[str, UUID] = {}
+        # Secondary indexes: name -> key function, and name -> key -> ids
+        self._indexes: Dict[str, Callable[[User], Hashable]] = {}
+        self._index_entries: Dict[str, Dict[Hashable, Set[UUID]]] = {}
+        self._lock = threading.RLock()
+
+    def add_index(self, name: str, key: Callable[[User], Hashable]) -> None:
+        """
+        Adds a secondary (non-unique) index, built over the current users and kept up to date.
+
+        Args:
+            name (str): Name used with ``find_by_index``.
+            key (Callable[[User], Hashable]): Index key of a user, e.g. ``lambda user: user.is_deleted``.
+        """
+        with self._lock:
+            self._indexes[name] = key
+            entries: Dict[Hashable, Set[UUID]] = {}
+            for user in self._by_id.values():
+                entries.setdefault(key(user), set()).add(user.id)
+            self._index_entries[name] = entries
+
+    def find_by_index(self, name: str, value: Hashable) -> List[User]:
+        """
+        Returns every user whose key for index ``name`` equals ``value``.
+
+        Raises:
+            KeyError: If no index has that name.
+        """
+        with self._lock:
+            ids = self._index_entries[name].get(value, ())
+            return [self._by_id[user_id].model_copy() for user_id in ids]
+
+    def _check_unique(self, user: User, allow_existing_id: bool) -> None:
+        if not allow_existing_id and user.id in self._by_id:
+            raise DuplicateUserError(f"User {user.id} already exists")
+        owner = self._id_by_email.get(_email_key(user.email))
+        if owner is not None and owner != user.id:
+            raise DuplicateUserError(f"User with email {user.email} already exists")
+
+    def _unindex(self, user: User) -> None:
+        del self._id_by_email[_email_key(user.email)]
+        for name, key in self._indexes.items():
+            ids = self._index_entries[name].get(key(user))
+            if ids is not None:
+                ids.discard(user.id)
+                if not ids:
+                    del self._index_entries[name][key(user)]
+
+    def _store(self, user: User) -> None:
+        stored = user.model_copy()
+        self._by_id[stored.id] = stored
+        self._id_by_email[_email_key(stored.email)] = stored.id
+        for name, key in self._indexes.items():
+            self._index_entries[name].setdefault(key(stored), set()).add(stored.id)
+
+    def add(self, user: User) -> None:
+        """
+        Raises:
+            DuplicateUserError: If the id or email is already taken.
+        """
+        with self._lock:
+            self._check_unique(user, allow_existing_id=False)
+            self._store(user)
+
+    def add_many(self, users: Iterable[User]) -> None:
+        """
+        Adds every user or, if any id or email is taken (or repeated in ``users``), none.
+
+        Raises:
+            DuplicateUserError: If an id or email is already taken.
+        """
+        users = list(users)
+        ids = {user.id for user in users}
+        emails = {_email_key(user.email) for user in users}
+        if len(ids) != len(users) or len(emails) != len(users):
+            raise DuplicateUserError("Duplicate id or email in the batch")
+        with self._lock:
+            for user in users:
+                self._check_unique(user, allow_existing_id=False)
+            for user in users:
+                self._store(user)
+
+    def update(self, user: User) -> None:
+        """
+        Raises:
+            DuplicateUserError: If the new email belongs to another user.
+        """
+        with self._lock:
+            self._check_unique(user, allow_existing_id=True)
+            previous = self._by_id.get(user.id)
+            if previous is not None:
+                self._unindex(previous)
+            self._store(user)
+
+    def hard_delete(self, user: User) -> None:
+        with self._lock:
+            stored = self._by_id.pop(user.id, None)
+            if stored is not None:
+                self._unindex(stored)
+
+    def find_by_id(self, user_id: UUID) -> Optional[User]:
+        user = self._by_id.get(user_id)
+        return user.model_copy() if user is not None else None
+
+    def find_by_email(self, email: Email) -> Optional[User]:
+        with self._lock:
+            user_id = self._id_by_email.get(_email_key(email))
+            return self._by_id[user_id].model_copy() if user_id is not None else None
+
+    def find_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        with self._lock:
+            return {user_id: self._by_id[user_id].model_copy() for user_id in user_ids if user_id in self._by_id}
+
+    def find_by_emails(self, emails: Iterable[Email]) -> Dict[Email, User]:
+        found: Dict[Email, User] = {}
+        with self._lock:
+            for email in emails:
+                user_id = self._id_by_email.get(_email_key(email))
+                if user_id is not None:
+                    user = self._by_id[user_id].model_copy()
+                    found[user.email] = user
+        return found
+
+    def iter_emails(self, batch_size: int = 1000) -> Iterator[str]:
+        # batch_size is accepted for parity with UserMgmtRepository
+        with self._lock:
+            emails = list(self._id_by_email)
+        return iter(emails)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def snapshot(self, path: Union[str, Path]) -> None:
+        """
+        Writes every user to a JSON file, atomically replacing any previous snapshot.
+
+        Args:
+            path (Union[str, Path]): File to write.
+        """
+        with self._lock:
+            users = [
+                {
+                    "id": str(user.id),
+                    "email": str(user.email.address),
+                    "hashed_password": user.password_hash.hashed_password.decode("ascii"),
+                    "created_at": user.created_at.isoformat(),
+                    "is_deleted": user.is_deleted,
+                }
+                for user in self._by_id.values()
+            ]
+        path = Path(path)
+        temporary = path.with_suffix(path.suffix + ".tmp")
+        temporary.write_text(json.dumps({"version": 1, "users": users}))
+        temporary.replace(path)
+
+    def restore(self, path: Union[str, Path]) -> None:
+        """
+        Replaces the repository's contents with a snapshot written by ``snapshot``.
+
+        Args:
+            path (Union[str, Path]): File to read.
+        """
+        data = json.loads(Path(path).read_text())
+        # The snapshot was validated when written, so build users without re-validating
+        users = [
+            User.model_construct(
+                id=UUID(row["id"]),
+                email=Email.model_construct(address=row["email"]),
+                password_hash=PasswordHash.model_construct(hashed_password=row["hashed_password"].encode("ascii")),
+                created_at=datetime.fromisoformat(row["created_at"]),
+                is_deleted=row["is_deleted"],
+            )
+            for row in data["users"]
+        ]
+        with self._lock:
+            self._by_id = {}
+            self._id_by_email = {}
+            self._index_entries = {name: {} for name in self._indexes}
+            for user in users:
+                self._store(user)
+
+class InMemoryUnitOfWork(AbstractUnitOfWork):
+    """
+    Unit of work over an InMemoryUserMgmtRepository, for edge nodes and tests that
+    should not pay for SQLAlchemy. Writes apply immediately, so there is nothing
+    to commit and an exception does not undo them.
+    """
+    def __init__(
+        self,
+        users: Optional[InMemoryUserMgmtRepository] = None,
+        outbox: Optional[InMemoryOutbox] = None
+    ):
+        self.users = users if users is not None else InMemoryUserMgmtRepository()
+        self.outbox = outbox if outbox is not None else InMemoryOutbox()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
@@ -1,18 +1,70 @@
 from uuid import UUID
-from typing import Optional
+from typing import Dict, Iterable, Iterator, List, Optional, TypeVar
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
 
 # Import the UserMgmtInterface to implement it
-from src.your_domain.application.interfaces.user_mgmt import UserMgmtInterface
+from your_domain.application.interfaces.user_mgmt import AsyncUserMgmtInterface, DuplicateUserError, UserMgmtInterface
+from your_domain.infrastructure.orm import UserRecord
 # Import the User entity and Email value object
 from your_domain.domain.entities.user import User
 from your_domain.domain.value_objects.email import Email
+from your_domain.domain.value_objects.password_hash import PasswordHash
 
 # This repository uses an ORM (SQLAlchemy in this example) to manage User entity persistence.
-# Note: The ORM mapping for User should be set up separately (e.g., with SQLAlchemy declarative base).
+# The table mapping lives in infrastructure/orm.py; entities are translated to and from
+# UserRecord rows so the domain model stays free of ORM concerns.
+
+T = TypeVar("T")
+
+# Keys bound per IN (...) query. Stays well below SQLite's historical 999-parameter limit.
+IN_CLAUSE_CHUNK_SIZE = 500
+
+def _chunks(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    # Split (deduplicated) keys into IN-clause sized chunks
+    unique = list(dict.fromkeys(items))
+    for start in range(0, len(unique), size):
+        yield unique[start:start + size]
+
+def _to_row(user: User) -> dict:
+    return {
+        "id": user.id,
+        "email": str(user.email.address),
+        "hashed_password": user.password_hash.hashed_password,
+        "created_at": user.created_at,
+        "is_deleted": user.is_deleted,
+    }
+
+def _to_record(user: User) -> UserRecord:
+    return UserRecord(
+        id=user.id,
+        email=str(user.email.address),
+        hashed_password=user.password_hash.hashed_password,
+        created_at=user.created_at,
+        is_deleted=user.is_deleted,
+    )
+
+def _to_entity(record: UserRecord) -> User:
+    # Rows were validated when they were written, so skip pydantic validation (and the
+    # EmailStr parsing in Email) when loading them back; model_construct only sets fields.
+    return User.model_construct(
+        id=record.id,
+        email=Email.model_construct(address=record.email),
+        password_hash=PasswordHash.model_construct(hashed_password=record.hashed_password),
+        created_at=record.created_at,
+        is_deleted=record.is_deleted,
+    )
 
 class UserMgmtRepository(UserMgmtInterface):
+    """
+    Synchronous user repository on a SQLAlchemy Session.
+
+    Writes are only flushed; committing (and rolling back on error) is left to
+    SqlAlchemyUnitOfWork so that a use case touching several rows costs a single
+    transaction.
+    """
     def __init__(self, session: Session) -> None:
         """
         Initialize the repository with a SQLAlchemy session.
@@ -24,28 +76,26 @@ class UserMgmtRepository(UserMgmtInterface):
 
     def add(self, user: User) -> None:
         """
-        Add a new User to the database.
+        Add a new User to the current transaction.
 
         Args:
             user (User): User entity to be added.
 
         Raises:
+            DuplicateUserError: If the id or email is already taken.
             SQLAlchemyError: If there's an error during the database operation.
         """
+        # Add the user record to the current session and flush so constraint violations surface here
+        self.session.add(_to_record(user))
         try:
-            # Add the user instance to the current session
-            self.session.add(user)
-            # Commit the transaction to persist the new user
-            self.session.commit()
-        except SQLAlchemyError as e:
-            # Roll back the session in case of an error
-            self.session.rollback()
-            # Re-raise the exception or handle logging as needed
-            raise e
+            self.session.flush()
+        except IntegrityError as e:
+            # e.g. another worker registered the email after this use case checked for it
+            raise DuplicateUserError(f"User with email {user.email} already exists") from e
 
     def update(self, user: User) -> None:
         """
-        Update an existing User in the database.
+        Update an existing User in the current transaction.
 
         Args:
             user (User): User entity with updated data.
@@ -53,15 +103,21 @@ class UserMgmtRepository(UserMgmtInterface):
         Raises:
             SQLAlchemyError: If there's an error during the database operation.
         """
-        try:
-            # Use merge to update the existing user record with new values
-            self.session.merge(user)
-            # Commit the changes to the database
-            self.session.commit()
-        except SQLAlchemyError as e:
-            # Roll back the session in case of error
-            self.session.rollback()
-            raise e
+        # Use merge to update the existing user record with new values
+        self.session.merge(_to_record(user))
+        self.session.flush()
+
+    def hard_delete(self, user: User) -> None:
+        """
+        Permanently remove a User in the current transaction.
+
+        Args:
+            user (User): User entity to be removed.
+
+        Raises:
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        self.session.query(UserRecord).filter_by(id=user.id).delete()
 
     def find_by_email(self, email: Email) -> Optional[User]:
         """
@@ -76,13 +132,8 @@ class UserMgmtRepository(UserMgmtInterface):
         Raises:
             SQLAlchemyError: If there's an error during the database operation.
         """
-        try:
-            # Assuming User has an 'email' column that stores the email address as a string.
-            user = self.session.query(User).filter_by(email=email.address).first()
-            return user
-        except SQLAlchemyError as e:
-            self.session.rollback()
-            raise e
+        record = self.session.query(UserRecord).filter_by(email=str(email.address)).first()
+        return _to_entity(record) if record is not None else None
 
     def find_by_id(self, user_id: UUID) -> Optional[User]:
         """
@@ -97,14 +148,279 @@ class UserMgmtRepository(UserMgmtInterface):
         Raises:
             SQLAlchemyError: If there's an error during the database operation.
         """
+        record = self.session.get(UserRecord, user_id)
+        return _to_entity(record) if record is not None else None
+
+    def add_many(self, users: Iterable[User]) -> None:
+        """
+        Add many Users to the current transaction with a single executemany.
+
+        Args:
+            users (Iterable[User]): User entities to be added.
+
+        Raises:
+            DuplicateUserError: If an id or email is already taken or repeated in ``users``.
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        rows = [_to_row(user) for user in users]
+        if rows:
+            try:
+                self.session.execute(insert(UserRecord), rows)
+            except IntegrityError as e:
+                raise DuplicateUserError("Duplicate id or email in the batch") from e
+
+    def find_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """
+        Find many Users by unique identifier with one IN query per chunk of ids.
+
+        Args:
+            user_ids (Iterable[UUID]): Unique identifiers to resolve.
+
+        Returns:
+            Dict[UUID, User]: Found users keyed by id; unknown ids are omitted.
+
+        Raises:
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        found: Dict[UUID, User] = {}
+        for chunk in _chunks(user_ids, IN_CLAUSE_CHUNK_SIZE):
+            for record in self.session.query(UserRecord).filter(UserRecord.id.in_(chunk)):
+                found[record.id] = _to_entity(record)
+        return found
+
+    def find_by_emails(self, emails: Iterable[Email]) -> Dict[Email, User]:
+        """
+        Find many Users by email with one IN query per chunk of addresses.
+
+        Args:
+            emails (Iterable[Email]): Email value objects to resolve.
+
+        Returns:
+            Dict[Email, User]: Found users keyed by email; unknown emails are omitted.
+
+        Raises:
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        found: Dict[Email, User] = {}
+        for chunk in _chunks((str(email.address) for email in emails), IN_CLAUSE_CHUNK_SIZE):
+            for record in self.session.query(UserRecord).filter(UserRecord.email.in_(chunk)):
+                user = _to_entity(record)
+                found[user.email] = user
+        return found
+
+    def iter_emails(self, batch_size: int = 1000) -> Iterator[str]:
+        """
+        Stream the email address of every stored user.
+
+        Used to warm in-memory indexes such as the email filter at startup.
+
+        Args:
+            batch_size (int): Number of rows fetched per round trip.
+
+        Yields:
+            str: Stored email addresses.
+
+        Raises:
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        for (email,) in self.session.query(UserRecord.email).yield_per(batch_size):
+            yield email
+
+    def list_page(self, after_id: Optional[UUID] = None, limit: int = 100) -> List[User]:
+        """
+        Return up to ``limit`` users with an id greater than ``after_id``, in id order.
+
+        Keyset pagination: the primary key index seeks straight to the page, so the
+        cost does not grow with the page number the way OFFSET does. Pass the id of
+        the last user of a page to get the next one.
+
+        Args:
+            after_id (Optional[UUID]): Id of the last user of the previous page; None for the first page.
+            limit (int): Maximum number of users returned.
+
+        Returns:
+            List[User]: The page; empty once the end is reached.
+
+        Raises:
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        statement = select(UserRecord).order_by(UserRecord.id).limit(limit)
+        if after_id is not None:
+            statement = statement.where(UserRecord.id > after_id)
+        return [_to_entity(record) for record in self.session.scalars(statement)]
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[User]:
+        """
+        Stream every stored user in id order, one keyset page at a time.
+
+        Args:
+            batch_size (int): Number of users fetched per query.
+
+        Yields:
+            User: Stored users, soft-deleted ones included.
+
+        Raises:
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        after_id: Optional[UUID] = None
+        while True:
+            page = self.list_page(after_id, batch_size)
+            yield from page
+            if len(page) < batch_size:
+                return
+            after_id = page[-1].id
+
+class AsyncUserMgmtRepository(AsyncUserMgmtInterface):
+    """
+    asyncio counterpart of UserMgmtRepository built on SQLAlchemy's AsyncSession.
+
+    Writes are only flushed; committing is left to AsyncSqlAlchemyUnitOfWork so that
+    a use case touching several rows costs a single transaction.
+    """
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize the repository with an async SQLAlchemy session.
+
+        Args:
+            session (AsyncSession): Async SQLAlchemy session for DB transactions.
+        """
+        self.session = session
+
+    async def add(self, user: User) -> None:
+        """
+        Add a new User to the current transaction.
+
+        Args:
+            user (User): User entity to be added.
+
+        Raises:
+            DuplicateUserError: If the id or email is already taken.
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        self.session.add(_to_record(user))
         try:
-            user = self.session.query(User).filter_by(id=user_id).first()
-            return user
-        except SQLAlchemyError as e:
-            self.session.rollback()
-            raise e
+            await self.session.flush()
+        except IntegrityError as e:
+            raise DuplicateUserError(f"User with email {user.email} already exists") from e
+
+    async def update(self, user: User) -> None:
+        """
+        Update an existing User in the current transaction.
+
+        Args:
+            user (User): User entity with updated data.
+
+        Raises:
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        await self.session.merge(_to_record(user))
+        await self.session.flush()
+
+    async def hard_delete(self, user: User) -> None:
+        """
+        Permanently remove a User in the current transaction.
+
+        Args:
+            user (User): User entity to be removed.
+
+        Raises:
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        await self.session.execute(delete(UserRecord).where(UserRecord.id == user.id))
+
+    async def find_by_email(self, email: Email) -> Optional[User]:
+        """
+        Find a User in the database by email.
+
+        Args:
+            email (Email): Email value object representing the email.
+
+        Returns:
+            Optional[User]: User entity if found, else None.
+
+        Raises:
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        result = await self.session.scalars(
+            select(UserRecord).where(UserRecord.email == str(email.address)).limit(1)
+        )
+        record = result.first()
+        return _to_entity(record) if record is not None else None
+
+    async def find_by_id(self, user_id: UUID) -> Optional[User]:
+        """
+        Find a User in the database by unique identifier.
+
+        Args:
+            user_id (UUID): Unique identifier of the user.
+
+        Returns:
+            Optional[User]: User entity if found, else None.
+
+        Raises:
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        record = await self.session.get(UserRecord, user_id)
+        return _to_entity(record) if record is not None else None
+
+    async def add_many(self, users: Iterable[User]) -> None:
+        """
+        Add many Users to the current transaction with a single executemany.
+
+        Args:
+            users (Iterable[User]): User entities to be added.
+
+        Raises:
+            DuplicateUserError: If an id or email is already taken or repeated in ``users``.
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        rows = [_to_row(user) for user in users]
+        if rows:
+            try:
+                await self.session.execute(insert(UserRecord), rows)
+            except IntegrityError as e:
+                raise DuplicateUserError("Duplicate id or email in the batch") from e
+
+    async def find_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """
+        Find many Users by unique identifier with one IN query per chunk of ids.
+
+        Args:
+            user_ids (Iterable[UUID]): Unique identifiers to resolve.
+
+        Returns:
+            Dict[UUID, User]: Found users keyed by id; unknown ids are omitted.
+
+        Raises:
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        found: Dict[UUID, User] = {}
+        for chunk in _chunks(user_ids, IN_CLAUSE_CHUNK_SIZE):
+            for record in await self.session.scalars(select(UserRecord).where(UserRecord.id.in_(chunk))):
+                found[record.id] = _to_entity(record)
+        return found
+
+    async def find_by_emails(self, emails: Iterable[Email]) -> Dict[Email, User]:
+        """
+        Find many Users by email with one IN query per chunk of addresses.
+
+        Args:
+            emails (Iterable[Email]): Email value objects to resolve.
+
+        Returns:
+            Dict[Email, User]: Found users keyed by email; unknown emails are omitted.
+
+        Raises:
+            SQLAlchemyError: If there's an error during the database operation.
+        """
+        found: Dict[Email, User] = {}
+        for chunk in _chunks((str(email.address) for email in emails), IN_CLAUSE_CHUNK_SIZE):
+            for record in await self.session.scalars(select(UserRecord).where(UserRecord.email.in_(chunk))):
+                user = _to_entity(record)
+                found[user.email] = user
+        return found
 
 # To complete this implementation:
-# 1. Ensure that the SQLAlchemy ORM mappings for the User entity are correctly defined.
+# 1. Create the tables from infrastructure/orm.py (e.g. Base.metadata.create_all) or via migrations.
 # 2. Configure the SQLAlchemy session (e.g., using sessionmaker) and pass it to this repository.
 # 3. Handle the exceptions and logging as per your application's requirements.
@@ -0,0 +1,201 @@
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.message import Message
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence
+
+# OutboundEmail and EmailBatchError are re-exported for existing imports
+from your_domain.application.interfaces.email_service import EmailBatchError, EmailTransportInterface, OutboundEmail
+
+if TYPE_CHECKING:
+    from your_domain.domain.services.email_service import SMTPSettings
+
+@dataclass
+class SMTPPoolStats:
+    """Counters reported by SMTPConnectionPool."""
+    connections_opened: int = 0
+    connections_recycled: int = 0
+    connections_discarded: int = 0
+    messages_sent: int = 0
+
+@dataclass
+class _PooledConnection:
+    smtp: smtplib.SMTP
+    messages_sent: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+class SMTPConnectionPool(EmailTransportInterface):
+    """
+    Pool of connected, authenticated SMTP sessions.
+
+    Opening a session costs a TCP connect, EHLO, STARTTLS and AUTH; the pool pays
+    that once and reuses the session for later messages. Idle sessions are checked
+    with NOOP before reuse, sessions are recycled after ``max_messages_per_connection``
+    messages, and any session that raised an error is discarded.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        pool_size: int = 4,
+        max_messages_per_connection: int = 100,
+        health_check_after_seconds: float = 30.0,
+        timeout_seconds: float = 30.0,
+    ) -> None:
+        """
+        Args:
+            host (str): SMTP server host.
+            port (int): SMTP server port.
+            username (Optional[str]): Login user; no AUTH is attempted when empty.
+            password (Optional[str]): Login password.
+            use_tls (bool): Upgrade sessions with STARTTLS.
+            pool_size (int): Maximum number of open sessions; callers wait for a free one.
+            max_messages_per_connection (int): Messages sent before a session is closed and replaced.
+            health_check_after_seconds (float): Idle time after which a session is NOOP-checked before reuse.
+            timeout_seconds (float): Socket timeout, also the wait for a free session.
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.max_messages_per_connection = max_messages_per_connection
+        self.health_check_after_seconds = health_check_after_seconds
+        self.timeout_seconds = timeout_seconds
+        self.stats = SMTPPoolStats()
+        self._idle: List[_PooledConnection] = []
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: "SMTPSettings") -> "SMTPConnectionPool":
+        """Builds a pool from the ``smtp_*`` fields of SMTPSettings."""
+        return cls(
+            host=settings.smtp_server,
+            port=settings.smtp_port,
+            username=settings.smtp_username,
+            password=settings.smtp_password,
+            use_tls=settings.use_tls,
+            pool_size=settings.smtp_pool_size,
+            max_messages_per_connection=settings.smtp_max_messages_per_connection,
+            health_check_after_seconds=settings.smtp_health_check_after_seconds,
+            timeout_seconds=settings.smtp_timeout_seconds,
+        )
+
+    def _open(self) -> _PooledConnection:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout_seconds)
+        try:
+            if self.use_tls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password or "")
+        except (smtplib.SMTPException, OSError):
+            self._close(smtp)
+            raise
+        with self._lock:
+            self.stats.connections_opened += 1
+        return _PooledConnection(smtp)
+
+    @staticmethod
+    def _close(smtp: smtplib.SMTP) -> None:
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+
+    @staticmethod
+    def _is_alive(smtp: smtplib.SMTP) -> bool:
+        try:
+            return smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _checkout(self) -> _PooledConnection:
+        while True:
+            with self._lock:
+                pooled = self._idle.pop() if self._idle else None
+            if pooled is None:
+                return self._open()
+            if time.monotonic() - pooled.last_used < self.health_check_after_seconds or self._is_alive(pooled.smtp):
+                return pooled
+            with self._lock:
+                self.stats.connections_discarded += 1
+            pooled.smtp.close()
+
+    def _checkin(self, pooled: _PooledConnection, healthy: bool) -> None:
+        if not healthy:
+            with self._lock:
+                self.stats.connections_discarded += 1
+            pooled.smtp.close()
+        elif pooled.messages_sent >= self.max_messages_per_connection:
+            with self._lock:
+                self.stats.connections_recycled += 1
+            self._close(pooled.smtp)
+        else:
+            pooled.last_used = time.monotonic()
+            with self._lock:
+                self._idle.append(pooled)
+
+    @contextmanager
+    def _session(self) -> Iterator[_PooledConnection]:
+        if not self._slots.acquire(timeout=self.timeout_seconds):
+            raise smtplib.SMTPException("Timed out waiting for a free SMTP connection")
+        try:
+            pooled = self._checkout()
+            healthy = False
+            try:
+                yield pooled
+                healthy = True
+            finally:
+                self._checkin(pooled, healthy)
+        finally:
+            self._slots.release()
+
+    def send(self, message: Message) -> None:
+        """
+        Send one message over a pooled session.
+
+        Raises:
+            smtplib.SMTPException: If the message could not be sent.
+        """
+        self.send_many([message])
+
+    def send_many(self, messages: Sequence[Message]) -> int:
+        """
+        Send messages back to back, each session carrying up to ``max_messages_per_connection`` of them.
+
+        Args:
+            messages (Sequence[Message]): Messages to send, in order.
+
+        Returns:
+            int: Number of messages sent.
+
+        Raises:
+            EmailBatchError: If a message fails; ``sent`` tells how many went out before it.
+        """
+        sent = 0
+        while sent < len(messages):
+            try:
+                with self._session() as pooled:
+                    while sent < len(messages) and pooled.messages_sent < self.max_messages_per_connection:
+                        pooled.smtp.send_message(messages[sent])
+                        pooled.messages_sent += 1
+                        sent += 1
+                        with self._lock:
+                            self.stats.messages_sent += 1
+            except (smtplib.SMTPException, OSError) as e:
+                raise EmailBatchError(sent, e) from e
+        return sent
+
+    def close(self) -> None:
+        """Closes every idle session."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._close(pooled.smtp)
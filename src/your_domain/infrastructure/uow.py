@@ -0,0 +1,88 @@
+from typing import Callable
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from your_domain.application.interfaces.outbox import AsyncOutboxInterface, OutboxInterface
+from your_domain.application.interfaces.user_mgmt import AsyncUserMgmtInterface, UserMgmtInterface
+from your_domain.application.uow import AbstractAsyncUnitOfWork, AbstractUnitOfWork
+from your_domain.infrastructure.outbox import AsyncOutboxRepository, OutboxRepository
+from your_domain.infrastructure.repositories.user_mgmt import AsyncUserMgmtRepository, UserMgmtRepository
+
+class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
+    """
+    Unit of work over a Session. Repositories opened through it only flush;
+    the single commit happens when the ``with`` block exits cleanly.
+
+    ``users_factory`` builds the user repository for each session, e.g. to wrap
+    it in EmailFilteredUserMgmt. Events added to ``outbox`` commit in the same
+    transaction and are published later by an OutboxRelay. If the user repository
+    defines ``after_commit()`` (CachedUserMgmt does), it is called once the
+    transaction has committed.
+    """
+    def __init__(
+        self,
+        session_factory,
+        users_factory: Callable[[Session], UserMgmtInterface] = UserMgmtRepository,
+        outbox_factory: Callable[[Session], OutboxInterface] = OutboxRepository
+    ):
+        self.session_factory = session_factory
+        self.users_factory = users_factory
+        self.outbox_factory = outbox_factory
+
+    def __enter__(self):
+        self.session = self.session_factory()
+        self.users = self.users_factory(self.session)
+        self.outbox = self.outbox_factory(self.session)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_tb is None:
+            self.commit()
+        else:
+            self.rollback()
+        self.session.close()
+
+    def commit(self):
+        self.session.commit()
+        after_commit = getattr(self.users, "after_commit", None)
+        if after_commit is not None:
+            after_commit()
+
+    def rollback(self):
+        self.session.rollback()
+
+class AsyncSqlAlchemyUnitOfWork(AbstractAsyncUnitOfWork):
+    """
+    Unit of work over an AsyncSession. Repositories opened through it only flush;
+    the single commit happens when the ``async with`` block exits cleanly.
+    """
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        users_factory: Callable[[AsyncSession], AsyncUserMgmtInterface] = AsyncUserMgmtRepository,
+        outbox_factory: Callable[[AsyncSession], AsyncOutboxInterface] = AsyncOutboxRepository
+    ) -> None:
+        self.session_factory = session_factory
+        self.users_factory = users_factory
+        self.outbox_factory = outbox_factory
+
+    async def __aenter__(self) -> "AsyncSqlAlchemyUnitOfWork":
+        self.session = self.session_factory()
+        self.users = self.users_factory(self.session)
+        self.outbox = self.outbox_factory(self.session)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            if exc_tb is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.session.close()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
@@ -0,0 +1,67 @@
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import bcrypt
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from your_domain.domain.entities.user import User
+from your_domain.domain.events.user_registered import UserRegisteredEvent
+from your_domain.domain.value_objects import password_hash
+from your_domain.domain.value_objects.email import Email
+from your_domain.domain.value_objects.password_hash import PasswordHash, PasswordHashingSettings, configure_hashing_pool
+from your_domain.infrastructure.orm import Base
+
+
+@pytest.fixture
+def make_user():
+    def make(address: str) -> User:
+        # A pre-hashed password keeps BCrypt out of the persistence tests
+        return User(email=Email(address=address), password_hash=PasswordHash(hashed_password=b"$2b$04$hash"))
+
+    return make
+
+
+@pytest.fixture
+def make_event():
+    def make(address: str) -> UserRegisteredEvent:
+        return UserRegisteredEvent(
+            user_id=uuid4(), email=address, registered_at=datetime.now(timezone.utc), confirmation_token="token"
+        )
+
+    return make
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    # A file database so that concurrent units of work get separate connections
+    engine = create_engine(f"sqlite:///{tmp_path / 'users.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def async_session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+
+    async def create_tables() -> None:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def hashes(monkeypatch):
+    configure_hashing_pool(PasswordHashingSettings(bcrypt_rounds=4))
+    calls = []
+    hashpw = bcrypt.hashpw
+    monkeypatch.setattr(password_hash.bcrypt, "hashpw", lambda *args: calls.append(1) or hashpw(*args))
+    yield calls
+    configure_hashing_pool(PasswordHashingSettings())
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from your_domain.application.interfaces.user_mgmt import DuplicateUserError
+from your_domain.domain.value_objects.email import Email
+from your_domain.infrastructure.uow import AsyncSqlAlchemyUnitOfWork
+
+
+def test_unit_of_work_commits_on_clean_exit(async_session_factory, make_user):
+    user = make_user("alice@example.com")
+
+    async def scenario():
+        async with AsyncSqlAlchemyUnitOfWork(async_session_factory) as uow:
+            await uow.users.add(user)
+
+        async with AsyncSqlAlchemyUnitOfWork(async_session_factory) as uow:
+            by_email = await uow.users.find_by_email(Email(address="alice@example.com"))
+            by_id = await uow.users.find_by_id(user.id)
+        return by_email, by_id
+
+    by_email, by_id = asyncio.run(scenario())
+    assert by_email is not None and by_email.id == user.id
+    assert by_id is not None and by_id.email == user.email
+
+
+def test_unit_of_work_rolls_back_on_error(async_session_factory, make_user):
+    user = make_user("bob@example.com")
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            async with AsyncSqlAlchemyUnitOfWork(async_session_factory) as uow:
+                await uow.users.add(user)
+                raise RuntimeError("boom")
+
+        async with AsyncSqlAlchemyUnitOfWork(async_session_factory) as uow:
+            return await uow.users.find_by_id(user.id)
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_update_and_hard_delete(async_session_factory, make_user):
+    user = make_user("carol@example.com")
+
+    async def scenario():
+        async with AsyncSqlAlchemyUnitOfWork(async_session_factory) as uow:
+            await uow.users.add(user)
+
+        user.is_deleted = True
+        async with AsyncSqlAlchemyUnitOfWork(async_session_factory) as uow:
+            await uow.users.update(user)
+        async with AsyncSqlAlchemyUnitOfWork(async_session_factory) as uow:
+            soft_deleted = await uow.users.find_by_id(user.id)
+            await uow.users.hard_delete(user)
+        async with AsyncSqlAlchemyUnitOfWork(async_session_factory) as uow:
+            return soft_deleted, await uow.users.find_by_id(user.id)
+
+    soft_deleted, removed = asyncio.run(scenario())
+    assert soft_deleted is not None and soft_deleted.is_deleted
+    assert removed is None
+
+
+def test_add_many_rejects_duplicates_in_the_batch(async_session_factory, make_user):
+    async def scenario():
+        async with AsyncSqlAlchemyUnitOfWork(async_session_factory) as uow:
+            await uow.users.add_many([make_user("carol@example.com"), make_user("carol@example.com")])
+
+    with pytest.raises(DuplicateUserError):
+        asyncio.run(scenario())
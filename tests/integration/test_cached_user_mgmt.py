@@ -0,0 +1,65 @@
+import pytest
+
+from your_domain.domain.value_objects.email import Email
+from your_domain.domain.value_objects.password_hash import PasswordHash
+from your_domain.infrastructure.repositories.cached_user_mgmt import CachedUserMgmt, UserCache
+from your_domain.infrastructure.repositories.user_mgmt import UserMgmtRepository
+from your_domain.infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def cache():
+    return UserCache()
+
+
+def cached_uow(session_factory, cache) -> SqlAlchemyUnitOfWork:
+    return SqlAlchemyUnitOfWork(
+        session_factory, users_factory=lambda session: CachedUserMgmt(UserMgmtRepository(session), cache)
+    )
+
+
+def test_reads_are_served_from_the_cache(session_factory, cache, make_user):
+    user = make_user("alice@example.com")
+    with cached_uow(session_factory, cache) as uow:
+        uow.users.add(user)
+
+    with cached_uow(session_factory, cache) as uow:
+        loaded = uow.users.find_by_id(user.id)
+    with cached_uow(session_factory, cache) as uow:
+        assert uow.users.find_by_email(user.email) == loaded
+
+    assert cache.stats.hits == 1
+
+
+def test_an_update_is_not_hidden_by_a_row_cached_before_its_commit(session_factory, cache, make_user):
+    user = make_user("alice@example.com")
+    with cached_uow(session_factory, cache) as uow:
+        uow.users.add(user)
+
+    writer = cached_uow(session_factory, cache)
+    with writer:
+        changed = user.model_copy(update={"password_hash": PasswordHash(hashed_password=b"$2b$04$new")})
+        writer.users.update(changed)
+
+        # A concurrent reader still sees the committed row and caches it
+        with cached_uow(session_factory, cache) as reader:
+            assert reader.users.find_by_id(user.id).password_hash.hashed_password == b"$2b$04$hash"
+
+    with cached_uow(session_factory, cache) as uow:
+        assert uow.users.find_by_id(user.id).password_hash.hashed_password == b"$2b$04$new"
+        assert uow.users.find_by_email(user.email).password_hash.hashed_password == b"$2b$04$new"
+
+
+def test_a_changed_email_no_longer_resolves_from_the_cache(session_factory, cache, make_user):
+    user = make_user("alice@example.com")
+    with cached_uow(session_factory, cache) as uow:
+        uow.users.add(user)
+    with cached_uow(session_factory, cache) as uow:
+        uow.users.find_by_email(user.email)
+
+    with cached_uow(session_factory, cache) as uow:
+        uow.users.update(user.model_copy(update={"email": Email(address="alice@example.org")}))
+
+    with cached_uow(session_factory, cache) as uow:
+        assert uow.users.find_by_email(user.email) is None
+        assert uow.users.find_by_email(Email(address="alice@example.org")).id == user.id
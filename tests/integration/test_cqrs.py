@@ -0,0 +1,156 @@
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from your_domain.infrastructure.cqrs import (
+    AsyncCommandBus,
+    AsyncRetryMiddleware,
+    AsyncTimingMiddleware,
+    AsyncTransactionMiddleware,
+    Command,
+    CommandBus,
+    CommandHandler,
+    HandlerNotFoundError,
+    RetryMiddleware,
+    TimingMiddleware,
+    TransactionMiddleware,
+    current_unit_of_work,
+)
+
+
+class Rename(Command):
+    def __init__(self, name: str):
+        self.name = name
+
+
+class FlakyRenameHandler(CommandHandler[Rename]):
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    def handle(self, command: Rename) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise OperationalError("UPDATE", {}, Exception("database is locked"))
+        return command.name
+
+
+class AsyncRenameHandler(CommandHandler[Rename]):
+    async def handle(self, command: Rename) -> str:
+        await asyncio.sleep(0)
+        return command.name.upper()
+
+
+class RecordingUnitOfWork:
+    def __init__(self):
+        self.outcome = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.outcome = "committed" if exc_type is None else "rolled back"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+
+class UnitOfWorkRecorder(CommandHandler[Rename]):
+    def __init__(self, barrier=None):
+        self.barrier = barrier
+        self.seen = []
+
+    def handle(self, command: Rename):
+        uow = current_unit_of_work()
+        if self.barrier is not None:
+            self.barrier.wait(1.0)
+        self.seen.append(uow)
+        if command.name == "fail":
+            raise RuntimeError("handler failed")
+        return uow
+
+
+def test_middlewares_wrap_the_handler_in_order():
+    calls = []
+
+    def outer(message, next_step):
+        calls.append("outer")
+        return next_step(message)
+
+    def inner(message, next_step):
+        calls.append("inner")
+        return next_step(message)
+
+    timing = TimingMiddleware()
+    handler = FlakyRenameHandler(failures=2)
+    bus = CommandBus([outer, timing, RetryMiddleware(attempts=3, backoff_base_seconds=0)])
+    bus.register(Rename, handler)
+    bus.add_middleware(inner)
+
+    assert bus.dispatch(Rename("alice")) == "alice"
+    assert handler.calls == 3
+    assert calls == ["outer", "inner", "inner", "inner"]
+    assert timing.stats["Rename"].calls == 1
+
+
+def test_unregistered_and_duplicate_handlers_are_rejected():
+    bus = CommandBus()
+    bus.register(Rename, FlakyRenameHandler(failures=0))
+
+    with pytest.raises(ValueError):
+        bus.register(Rename, FlakyRenameHandler(failures=0))
+    with pytest.raises(HandlerNotFoundError):
+        bus.dispatch(type("Unknown", (Command,), {})())
+
+
+def test_async_bus_runs_async_middlewares_and_handlers():
+    timing = AsyncTimingMiddleware()
+    bus = AsyncCommandBus([timing, AsyncRetryMiddleware(backoff_base_seconds=0)])
+    bus.register(Rename, AsyncRenameHandler())
+
+    assert asyncio.run(bus.dispatch(Rename("bob"))) == "BOB"
+    assert timing.stats["Rename"].calls == 1
+
+
+def test_transaction_middleware_opens_a_unit_of_work_per_dispatch():
+    handler = UnitOfWorkRecorder(barrier=threading.Barrier(2))
+    bus = CommandBus([TransactionMiddleware(RecordingUnitOfWork)])
+    bus.register(Rename, handler)
+
+    threads = [threading.Thread(target=bus.dispatch, args=(Rename(name),)) for name in ("alice", "bob")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    handler.barrier = None
+    with pytest.raises(RuntimeError):
+        bus.dispatch(Rename("fail"))
+
+    assert len({id(uow) for uow in handler.seen}) == 3
+    assert [uow.outcome for uow in handler.seen] == ["committed", "committed", "rolled back"]
+    with pytest.raises(LookupError):
+        current_unit_of_work()
+
+
+def test_async_transaction_middleware_opens_a_unit_of_work_per_dispatch():
+    class AsyncRecorder(CommandHandler[Rename]):
+        async def handle(self, command: Rename):
+            uow = current_unit_of_work()
+            await asyncio.sleep(0)
+            assert current_unit_of_work() is uow
+            return uow
+
+    bus = AsyncCommandBus([AsyncTransactionMiddleware(RecordingUnitOfWork)])
+    bus.register(Rename, AsyncRecorder())
+
+    async def dispatch_both():
+        return await asyncio.gather(bus.dispatch(Rename("alice")), bus.dispatch(Rename("bob")))
+
+    first, second = asyncio.run(dispatch_both())
+    assert first is not second
+    assert first.outcome == second.outcome == "committed"
@@ -0,0 +1,120 @@
+import asyncio
+
+from your_domain.application.use_cases.reset_user_password import ResetPassword, ResetPasswordInput
+from your_domain.domain.entities.user import User
+from your_domain.domain.services.email_service import EmailService, SMTPSettings
+from your_domain.infrastructure.email_dispatcher import QueuedEmailDispatcher
+from your_domain.infrastructure.repositories.in_memory_user_mgmt import InMemoryUnitOfWork
+from your_domain.infrastructure.smtp_pool import EmailBatchError, OutboundEmail
+
+
+class FlakySender:
+    """Fails the first batch after one message, then delivers everything."""
+
+    def __init__(self):
+        self.delivered = []
+        self.calls = 0
+
+    def send_many(self, emails):
+        self.calls += 1
+        if self.calls == 1:
+            self.delivered.extend(emails[:1])
+            raise EmailBatchError(1, OSError("connection reset"))
+        self.delivered.extend(emails)
+        return len(emails)
+
+
+def make_email(i: int) -> OutboundEmail:
+    return OutboundEmail(to_email=f"user{i}@example.com", subject="Hello", body="Hello")
+
+
+def test_failed_messages_are_retried_and_metrics_recorded():
+    sender = FlakySender()
+    dispatcher = QueuedEmailDispatcher(sender, workers=1, backoff_base_seconds=0.01)
+
+    async def scenario():
+        for i in range(3):
+            dispatcher.enqueue(make_email(i))
+        assert dispatcher.queue_depth == 3
+        await dispatcher.start()
+        await dispatcher.stop()
+
+    asyncio.run(scenario())
+
+    assert sorted(email.to_email for email in sender.delivered) == [f"user{i}@example.com" for i in range(3)]
+    assert dispatcher.stats.sent == 3
+    assert dispatcher.stats.retried == 2
+    assert dispatcher.queue_depth == 0
+    assert dispatcher.stats.latency_percentile(99) > 0
+
+
+def test_spooled_messages_survive_a_restart(tmp_path):
+    QueuedEmailDispatcher(FlakySender(), spool_dir=tmp_path).enqueue(make_email(1))
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    sender = FlakySender()
+    sender.calls = 1  # deliver on the first attempt
+    dispatcher = QueuedEmailDispatcher(sender, spool_dir=tmp_path)
+
+    async def scenario():
+        await dispatcher.start()
+        await dispatcher.stop()
+
+    asyncio.run(scenario())
+
+    assert [email.to_email for email in sender.delivered] == ["user1@example.com"]
+    assert list(tmp_path.glob("*.json")) == []
+
+
+class RecordingTransport:
+    def __init__(self):
+        self.messages = []
+
+    def send(self, message):
+        self.send_many([message])
+
+    def send_many(self, messages):
+        self.messages.extend(messages)
+        return len(messages)
+
+
+def test_reset_password_sends_the_token_through_the_dispatcher():
+    transport = RecordingTransport()
+    settings = SMTPSettings(
+        smtp_server="localhost", smtp_port=25, smtp_username="", smtp_password="", from_email="noreply@example.com"
+    )
+    dispatcher = QueuedEmailDispatcher(EmailService(settings, pool=transport))
+    uow = InMemoryUnitOfWork()
+    uow.users.add(User.create("alice@example.com", "correct horse battery staple"))
+
+    async def scenario():
+        await dispatcher.start()
+        token = ResetPassword(uow, dispatcher).execute(ResetPasswordInput(email="alice@example.com"))
+        await dispatcher.stop()
+        return token
+
+    token = asyncio.run(scenario())
+
+    [message] = transport.messages
+    assert message["To"] == "alice@example.com"
+    assert f"token={token}" in message.get_payload()[0].get_payload()
+
+
+def test_messages_enqueued_after_stop_wait_for_the_next_start():
+    sender = FlakySender()
+    sender.calls = 1  # deliver on the first attempt
+    dispatcher = QueuedEmailDispatcher(sender)
+
+    async def run(enqueue_after_stop):
+        await dispatcher.start()
+        await dispatcher.stop()
+        if enqueue_after_stop:
+            dispatcher.enqueue(make_email(1))
+
+    asyncio.run(run(enqueue_after_stop=True))
+    assert dispatcher.queue_depth == 1
+    assert sender.delivered == []
+
+    asyncio.run(run(enqueue_after_stop=False))
+    assert [email.to_email for email in sender.delivered] == ["user1@example.com"]
+    assert dispatcher.queue_depth == 0
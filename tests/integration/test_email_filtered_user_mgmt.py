@@ -0,0 +1,57 @@
+import pytest
+
+from your_domain.application.use_cases.register_user import RegisterUser, RegisterUserInput
+from your_domain.domain.entities.user import User
+from your_domain.domain.value_objects.email import Email
+from your_domain.infrastructure.bloom_filter import BloomFilter
+from your_domain.infrastructure.repositories.email_filtered_user_mgmt import EmailFilteredUserMgmt
+from your_domain.infrastructure.repositories.user_mgmt import UserMgmtRepository
+from your_domain.infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def email_filter():
+    # Stands in for this worker's filter, warmed before other workers registered anyone
+    return BloomFilter(capacity=1_000)
+
+
+def filtered_uow(session_factory, email_filter) -> SqlAlchemyUnitOfWork:
+    return SqlAlchemyUnitOfWork(
+        session_factory, users_factory=lambda session: EmailFilteredUserMgmt(UserMgmtRepository(session), email_filter)
+    )
+
+
+def register_on_another_worker(session_factory, user: User) -> User:
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        uow.users.add(user)
+    return user
+
+
+def test_lookups_stay_exact_for_users_the_filter_has_not_seen(session_factory, email_filter, make_user):
+    user = register_on_another_worker(session_factory, make_user("alice@example.com"))
+
+    with filtered_uow(session_factory, email_filter) as uow:
+        assert not uow.users.is_email_possibly_taken(user.email)
+        assert uow.users.find_by_email(user.email).id == user.id
+        assert set(uow.users.find_by_emails([user.email])) == {user.email}
+
+
+def test_registration_skips_the_query_only_for_definite_misses(session_factory, email_filter):
+    register = RegisterUser(filtered_uow(session_factory, email_filter))
+    register.execute(RegisterUserInput(email="bob@example.com", plain_text_password="secret-password"))
+
+    with filtered_uow(session_factory, email_filter) as uow:
+        assert uow.users.is_email_possibly_taken(Email.from_string("bob@example.com"))
+        assert not uow.users.is_email_possibly_taken(Email.from_string("carol@example.com"))
+        assert (uow.users.lookups, uow.users.skipped_lookups) == (2, 1)
+    with pytest.raises(ValueError, match="already exists"):
+        register.execute(RegisterUserInput(email="bob@example.com", plain_text_password="secret-password"))
+
+
+def test_duplicates_missed_by_the_filter_still_raise_value_error(session_factory, email_filter, make_user):
+    register_on_another_worker(session_factory, make_user("dave@example.com"))
+
+    with pytest.raises(ValueError, match="already exists"):
+        RegisterUser(filtered_uow(session_factory, email_filter)).execute(
+            RegisterUserInput(email="dave@example.com", plain_text_password="secret-password")
+        )
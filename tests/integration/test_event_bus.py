@@ -0,0 +1,193 @@
+import asyncio
+import threading
+import time
+
+from your_domain.infrastructure.event_bus import (
+    AsyncEventBus,
+    AsyncEventHandler,
+    Event,
+    EventBus,
+    EventHandler,
+    PooledEventBus,
+    SimpleEventBus,
+)
+
+
+class UserSignedUp(Event):
+    pass
+
+
+class SlowHandler(EventHandler):
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.handled = []
+
+    def handle(self, event):
+        time.sleep(self.seconds)
+        self.handled.append(event)
+
+
+class FailingHandler(EventHandler):
+    def handle(self, event):
+        raise RuntimeError("boom")
+
+
+class AsyncSlowHandler(EventHandler):
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.handled = []
+
+    async def handle(self, event):
+        await asyncio.sleep(self.seconds)
+        self.handled.append(event)
+
+
+def test_pooled_bus_runs_handlers_concurrently_and_isolates_errors():
+    bus = PooledEventBus(max_workers=4, handler_timeout_seconds=1.0)
+    slow = [SlowHandler(0.1) for _ in range(3)]
+    for handler in slow:
+        bus.subscribe(UserSignedUp, handler)
+    bus.subscribe(UserSignedUp, FailingHandler())
+
+    started = time.perf_counter()
+    bus.publish(UserSignedUp())
+    elapsed = time.perf_counter() - started
+    bus.shutdown()
+
+    assert elapsed < 0.25
+    assert all(len(handler.handled) == 1 for handler in slow)
+    assert bus.handler_stats["FailingHandler"].errors == 1
+    assert bus.handler_stats["SlowHandler"].calls == 3
+    assert bus.handler_stats["SlowHandler"].max_seconds >= 0.1
+
+
+def test_pooled_bus_counts_timeouts():
+    release = threading.Event()
+
+    class BlockedHandler(EventHandler):
+        def handle(self, event):
+            release.wait(1.0)
+
+    bus = PooledEventBus(handler_timeout_seconds=0.05)
+    bus.subscribe(UserSignedUp, BlockedHandler())
+    bus.publish(UserSignedUp())
+    release.set()
+    bus.shutdown()
+
+    assert bus.handler_stats[BlockedHandler.__qualname__].timeouts == 1
+
+
+def test_pooled_bus_times_handlers_from_when_they_start():
+    bus = PooledEventBus(max_workers=2, handler_timeout_seconds=0.15)
+    handlers = [SlowHandler(0.1) for _ in range(4)]
+    for handler in handlers:
+        bus.subscribe(UserSignedUp, handler)
+
+    bus.publish(UserSignedUp())
+    bus.shutdown()
+
+    # Two handlers wait for a worker for 0.1 s; that must not count against their timeout
+    assert all(len(handler.handled) == 1 for handler in handlers)
+    assert bus.handler_stats["SlowHandler"].timeouts == 0
+    assert bus.handler_stats["SlowHandler"].calls == 4
+
+
+def test_async_bus_gathers_coroutine_handlers():
+    bus = AsyncEventBus(handler_timeout_seconds=0.5)
+    handlers = [AsyncSlowHandler(0.1) for _ in range(5)]
+    for handler in handlers:
+        bus.subscribe(UserSignedUp, handler)
+    bus.subscribe(UserSignedUp, AsyncSlowHandler(5.0))
+
+    started = time.perf_counter()
+    asyncio.run(bus.publish(UserSignedUp()))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.0
+    assert all(len(handler.handled) == 1 for handler in handlers)
+    assert bus.handler_stats["AsyncSlowHandler"].calls == 6
+    assert bus.handler_stats["AsyncSlowHandler"].timeouts == 1
+
+
+def test_async_bus_awaits_batches_of_async_handlers():
+    class AsyncRecorder(AsyncEventHandler):
+        def __init__(self):
+            self.handled = []
+
+        async def handle(self, event):
+            await asyncio.sleep(0)
+            self.handled.append(event)
+
+    class AsyncBatchRecorder(AsyncRecorder):
+        async def handle_batch(self, events):
+            await asyncio.sleep(0)
+            self.handled.append(list(events))
+
+    bus = AsyncEventBus()
+    recorder, batch_recorder, legacy = AsyncRecorder(), AsyncBatchRecorder(), AsyncSlowHandler(0)
+    for handler in (recorder, batch_recorder, legacy):
+        bus.subscribe(UserSignedUp, handler)
+    events = [UserSignedUp(), UserSignedUp()]
+
+    asyncio.run(bus.publish_many(events))
+
+    assert recorder.handled == events
+    assert batch_recorder.handled == [events]
+    assert legacy.handled == events
+    assert bus.handler_stats["AsyncSlowHandler"].errors == 0
+    assert not isinstance(bus, EventBus)
+
+
+def test_handlers_subscribed_to_a_base_class_receive_subclass_events():
+    class Recorder(EventHandler):
+        def __init__(self):
+            self.handled = []
+
+        def handle(self, event):
+            self.handled.append(event)
+
+    bus = SimpleEventBus()
+    every_event, sign_ups, both = Recorder(), Recorder(), Recorder()
+    bus.subscribe(Event, every_event)
+    bus.publish(UserSignedUp())
+    bus.subscribe(UserSignedUp, sign_ups)
+    bus.subscribe(UserSignedUp, both)
+    bus.subscribe(Event, both)
+    bus.publish(UserSignedUp())
+    bus.publish(Event())
+
+    assert len(every_event.handled) == 3
+    assert len(sign_ups.handled) == 1
+    assert len(both.handled) == 2
+
+
+def test_publish_many_groups_events_by_type_for_batch_handlers():
+    class OtherEvent(Event):
+        pass
+
+    class BatchRecorder(EventHandler):
+        def __init__(self):
+            self.batches = []
+
+        def handle(self, event):
+            self.batches.append([event])
+
+        def handle_batch(self, events):
+            self.batches.append(events)
+
+    class PlainRecorder(EventHandler):
+        def __init__(self):
+            self.handled = []
+
+        def handle(self, event):
+            self.handled.append(event)
+
+    bus = SimpleEventBus()
+    batch, plain = BatchRecorder(), PlainRecorder()
+    bus.subscribe(Event, batch)
+    bus.subscribe(UserSignedUp, plain)
+    events = [UserSignedUp(), OtherEvent(), UserSignedUp()]
+    bus.publish_many(events)
+
+    assert batch.batches == [[events[0], events[2]], [events[1]]]
+    assert plain.handled == [events[0], events[2]]
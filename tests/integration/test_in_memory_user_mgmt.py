@@ -0,0 +1,53 @@
+import pytest
+
+from your_domain.application.use_cases.delete_user import DeleteUser, DeleteUserInput
+from your_domain.domain.value_objects.email import Email
+from your_domain.infrastructure.repositories.in_memory_user_mgmt import (
+    DuplicateUserError,
+    InMemoryUnitOfWork,
+    InMemoryUserMgmtRepository,
+)
+
+
+def test_ids_and_emails_are_unique(make_user):
+    repository = InMemoryUserMgmtRepository()
+    alice, bob = make_user("alice@example.com"), make_user("bob@example.com")
+    repository.add_many([alice, bob])
+
+    with pytest.raises(DuplicateUserError):
+        repository.add(make_user("alice@example.com"))
+    with pytest.raises(DuplicateUserError):
+        repository.add_many([make_user("carol@example.com"), make_user("bob@example.com")])
+    bob.email = Email(address="alice@example.com")
+    with pytest.raises(DuplicateUserError):
+        repository.update(bob)
+
+    assert len(repository) == 2
+    assert repository.find_by_email(Email(address="carol@example.com")) is None
+    assert repository.find_by_email(Email(address="bob@example.com")).id == bob.id
+
+
+def test_soft_delete_keeps_the_user_and_updates_secondary_indexes(make_user):
+    uow = InMemoryUnitOfWork()
+    uow.users.add_index("deleted", lambda user: user.is_deleted)
+    alice = make_user("alice@example.com")
+    uow.users.add(alice)
+
+    DeleteUser(uow).execute(DeleteUserInput(user_id=alice.id))
+
+    assert uow.users.find_by_id(alice.id).is_deleted
+    assert [user.id for user in uow.users.find_by_index("deleted", True)] == [alice.id]
+    assert uow.users.find_by_index("deleted", False) == []
+
+
+def test_snapshot_and_restore_round_trip(tmp_path, make_user):
+    repository = InMemoryUserMgmtRepository()
+    users = [make_user(f"user{i}@example.com") for i in range(3)]
+    repository.add_many(users)
+    repository.snapshot(tmp_path / "users.json")
+
+    restored = InMemoryUserMgmtRepository()
+    restored.restore(tmp_path / "users.json")
+
+    assert restored.find_by_ids([user.id for user in users]) == {user.id: user for user in users}
+    assert restored.find_by_email(users[1].email).password_hash == users[1].password_hash
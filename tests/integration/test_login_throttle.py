@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from your_domain.application.use_cases.authenticate_user import (
+    AuthenticateUser,
+    AuthenticateUserInput,
+    LoginThrottledError,
+    ThrottledAuthenticateUser,
+)
+from your_domain.infrastructure.rate_limit import TokenBucketRateLimiter
+from your_domain.infrastructure.repositories.in_memory_user_mgmt import InMemoryUnitOfWork
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingAuthenticateUser(AuthenticateUser):
+    def __init__(self):
+        super().__init__(InMemoryUnitOfWork(), auth_service=None)
+        self.calls = 0
+
+    def execute(self, input_data):
+        self.calls += 1
+        raise ValueError("Invalid credentials")
+
+
+def test_token_bucket_refills_and_expires_idle_keys():
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(capacity=2, refill_per_second=1, wheel_slots=4, clock=clock)
+
+    assert limiter.try_acquire("a") and limiter.try_acquire("a")
+    assert not limiter.try_acquire("a")
+    clock.now += 1.0
+    assert limiter.try_acquire("a")
+    assert len(limiter) == 1
+
+    clock.now += 10.0
+    limiter.try_acquire("b")
+    assert limiter.tokens("a") is None
+    assert len(limiter) == 1
+
+
+def test_over_limit_attempts_never_reach_the_use_case():
+    clock = FakeClock()
+    inner = CountingAuthenticateUser()
+    throttled = ThrottledAuthenticateUser(
+        inner,
+        email_limiter=TokenBucketRateLimiter(capacity=3, refill_per_second=0.1, clock=clock),
+        client_limiter=TokenBucketRateLimiter(capacity=5, refill_per_second=0.1, clock=clock),
+    )
+    attempt = AuthenticateUserInput(email="alice@example.com", plain_text_password="wrong-password")
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            throttled.execute(attempt, client_key="10.0.0.1")
+    with pytest.raises(LoginThrottledError):
+        throttled.execute(attempt, client_key="10.0.0.1")
+    other = AuthenticateUserInput(email="bob@example.com", plain_text_password="wrong-password")
+    with pytest.raises(ValueError):
+        throttled.execute(other, client_key="10.0.0.1")
+    with pytest.raises(LoginThrottledError):
+        throttled.execute(other, client_key="10.0.0.1")
+
+    assert inner.calls == 4
+    assert throttled.stats.allowed == 4
+    assert throttled.stats.rejected_by_email == 1
+    assert throttled.stats.rejected_by_client == 1
+
+
+def test_stats_count_every_concurrent_attempt():
+    throttled = ThrottledAuthenticateUser(
+        CountingAuthenticateUser(), email_limiter=TokenBucketRateLimiter(capacity=10_000, refill_per_second=1)
+    )
+    attempt = AuthenticateUserInput(email="alice@example.com", plain_text_password="wrong-password")
+
+    def attempt_many():
+        for _ in range(500):
+            with pytest.raises(ValueError):
+                throttled.execute(attempt)
+
+    threads = [threading.Thread(target=attempt_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert throttled.stats.allowed == 4_000
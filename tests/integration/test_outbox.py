@@ -0,0 +1,120 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from your_domain.application.event_bus import EventHandler, SimpleEventBus
+from your_domain.application.use_cases.register_user import RegisterUser, RegisterUserInput
+from your_domain.domain.events.user_registered import UserRegisteredEvent
+from your_domain.infrastructure.event_bus import AsyncEventBus
+from your_domain.infrastructure.orm import OutboxRecord
+from your_domain.infrastructure.outbox import OutboxRelay, deserialize_event
+from your_domain.infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+class Recorder(EventHandler):
+    def __init__(self, fail_once: bool = False):
+        self.batches = []
+        self.fail_once = fail_once
+
+    def handle(self, event):
+        raise AssertionError("the relay publishes in batches")
+
+    def handle_batch(self, events):
+        if self.fail_once:
+            self.fail_once = False
+            raise RuntimeError("handler failed")
+        self.batches.append(events)
+
+
+def make_bus(handler: EventHandler) -> SimpleEventBus:
+    bus = SimpleEventBus()
+    bus.subscribe(UserRegisteredEvent, handler)
+    return bus
+
+
+def test_events_commit_and_roll_back_with_the_unit_of_work(session_factory, make_event):
+    recorder = Recorder()
+    relay = OutboxRelay(session_factory, make_bus(recorder), batch_size=2)
+
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        for i in range(3):
+            uow.outbox.add(make_event(f"user{i}@example.com"))
+    with pytest.raises(RuntimeError):
+        with SqlAlchemyUnitOfWork(session_factory) as uow:
+            uow.outbox.add(make_event("rolled-back@example.com"))
+            raise RuntimeError
+
+    assert relay.relay_once() == 2
+    assert relay.relay_once() == 1
+    assert relay.relay_once() == 0
+    assert [[event.email for event in batch] for batch in recorder.batches] == [
+        ["user0@example.com", "user1@example.com"],
+        ["user2@example.com"],
+    ]
+
+
+def test_failed_batch_is_published_one_event_at_a_time(session_factory, make_event):
+    recorder = Recorder(fail_once=True)
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        for i in range(3):
+            uow.outbox.add(make_event(f"user{i}@example.com"))
+
+    relay = OutboxRelay(session_factory, make_bus(recorder))
+    assert relay.relay_once() == 3
+    assert relay.relay_once() == 0
+    assert [len(batch) for batch in recorder.batches] == [1, 1, 1]
+
+
+def test_registration_events_reach_subscribed_handlers(session_factory):
+    recorder = Recorder()
+    user = RegisterUser(SqlAlchemyUnitOfWork(session_factory)).execute(
+        RegisterUserInput(email="alice@example.com", plain_text_password="secret-password")
+    )
+
+    with session_factory() as session:
+        assert session.query(OutboxRecord.event_type).scalar() == "user_registered"
+    assert OutboxRelay(session_factory, make_bus(recorder)).relay_once() == 1
+    [[event]] = recorder.batches
+    assert isinstance(event, UserRegisteredEvent)
+    assert event.user_id == user.id
+
+
+def test_unregistered_event_types_are_not_rebuilt(session_factory):
+    with session_factory() as session, session.begin():
+        session.add(OutboxRecord(event_type="os:system", payload={}, occurred_at=datetime.now(timezone.utc)))
+
+    with session_factory() as session:
+        with pytest.raises(ValueError, match="Unknown event type"):
+            deserialize_event(session.query(OutboxRecord).one())
+    assert OutboxRelay(session_factory, make_bus(Recorder())).relay_once() == 0
+
+
+def test_bad_rows_are_set_aside_without_blocking_later_events(session_factory, make_event):
+    class RejectingRecorder(Recorder):
+        def handle_batch(self, events):
+            if any(event.email == "poison@example.com" for event in events):
+                raise RuntimeError("handler rejects this event")
+            super().handle_batch(events)
+
+    with session_factory() as session, session.begin():
+        session.add(OutboxRecord(event_type="os:system", payload={}, occurred_at=datetime.now(timezone.utc)))
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        uow.outbox.add(make_event("poison@example.com"))
+        uow.outbox.add(make_event("alice@example.com"))
+    recorder = RejectingRecorder()
+    relay = OutboxRelay(session_factory, make_bus(recorder), max_attempts=2)
+
+    assert relay.relay_once() == 1
+    assert [[event.email for event in batch] for batch in recorder.batches] == [["alice@example.com"]]
+    assert relay.relay_once() == 0
+    assert relay.relay_once() == 0
+
+    with session_factory() as session:
+        bad = session.query(OutboxRecord).filter(OutboxRecord.published_at.is_(None)).all()
+        assert len(bad) == 2
+        assert all(record.attempts == 2 and record.failed_at is not None for record in bad)
+
+
+def test_relay_rejects_async_buses(session_factory):
+    with pytest.raises(TypeError):
+        OutboxRelay(session_factory, AsyncEventBus())
@@ -0,0 +1,103 @@
+import asyncio
+
+
+from your_domain.application.use_cases.authenticate_user import (
+    AsyncAuthenticateUser,
+    AuthenticateUser,
+    AuthenticateUserInput,
+)
+from your_domain.domain.entities.user import User
+from your_domain.domain.value_objects.password_hash import (
+    PasswordHashingSettings,
+    calibrate_bcrypt_rounds,
+    configure_hashing_pool,
+)
+from your_domain.infrastructure.password_rehash import AsyncBackgroundPasswordRehasher, BackgroundPasswordRehasher
+from your_domain.infrastructure.repositories.in_memory_user_mgmt import InMemoryUnitOfWork, InMemoryUserMgmtRepository
+from your_domain.infrastructure.uow import AsyncSqlAlchemyUnitOfWork
+
+PASSWORD = "correct horse battery staple"
+
+
+class StaticTokens:
+    def generate_jwt_token(self, user: User) -> str:
+        return "token"
+
+
+def test_calibration_stays_within_bounds():
+    assert calibrate_bcrypt_rounds(target_ms=0.001, min_rounds=4, max_rounds=8) == 4
+    assert calibrate_bcrypt_rounds(target_ms=10_000, min_rounds=4, max_rounds=8) == 8
+
+
+def test_login_rehashes_to_the_configured_cost():
+    try:
+        configure_hashing_pool(PasswordHashingSettings(bcrypt_rounds=5))
+        users = InMemoryUserMgmtRepository()
+        user = User.create("alice@example.com", PASSWORD)
+        users.add(user)
+        configure_hashing_pool(PasswordHashingSettings(bcrypt_rounds=4))
+        assert user.needs_password_rehash()
+
+        rehasher = BackgroundPasswordRehasher(lambda: InMemoryUnitOfWork(users=users))
+        authenticate = AuthenticateUser(InMemoryUnitOfWork(users=users), StaticTokens(), rehasher=rehasher)
+        attempt = AuthenticateUserInput(email="alice@example.com", plain_text_password=PASSWORD)
+        assert authenticate.execute(attempt) == "token"
+        rehasher.shutdown()
+
+        stored = users.find_by_id(user.id)
+        assert stored.password_hash.rounds == 4
+        assert stored.verify_password(PASSWORD)
+        assert rehasher.stats.rehashed == 1
+    finally:
+        configure_hashing_pool(PasswordHashingSettings())
+
+
+def test_rehash_does_not_overwrite_a_changed_password():
+    try:
+        configure_hashing_pool(PasswordHashingSettings(bcrypt_rounds=4))
+        users = InMemoryUserMgmtRepository()
+        user = User.create("bob@example.com", PASSWORD)
+        users.add(user)
+        changed = users.find_by_id(user.id)
+        changed.password_hash = User.create("bob@example.com", "a new password").password_hash
+        users.update(changed)
+
+        rehasher = BackgroundPasswordRehasher(lambda: InMemoryUnitOfWork(users=users))
+        rehasher.schedule(user, PASSWORD)
+        rehasher.shutdown()
+
+        assert users.find_by_id(user.id).verify_password("a new password")
+        assert rehasher.stats.skipped == 1
+    finally:
+        configure_hashing_pool(PasswordHashingSettings())
+
+
+def test_async_login_rehashes_to_the_configured_cost(async_session_factory):
+    def uow_factory():
+        return AsyncSqlAlchemyUnitOfWork(async_session_factory)
+
+    async def scenario(rehasher):
+        configure_hashing_pool(PasswordHashingSettings(bcrypt_rounds=5))
+        user = User.create("carol@example.com", PASSWORD)
+        async with uow_factory() as uow:
+            await uow.users.add(user)
+        configure_hashing_pool(PasswordHashingSettings(bcrypt_rounds=4))
+
+        authenticate = AsyncAuthenticateUser(uow_factory(), StaticTokens(), rehasher=rehasher)
+        token = await authenticate.execute(
+            AuthenticateUserInput(email="carol@example.com", plain_text_password=PASSWORD)
+        )
+        await rehasher.shutdown()
+        async with uow_factory() as uow:
+            return token, await uow.users.find_by_id(user.id)
+
+    try:
+        rehasher = AsyncBackgroundPasswordRehasher(uow_factory)
+        token, stored = asyncio.run(scenario(rehasher))
+
+        assert token == "token"
+        assert stored.password_hash.rounds == 4
+        assert stored.verify_password(PASSWORD)
+        assert rehasher.stats.rehashed == 1
+    finally:
+        configure_hashing_pool(PasswordHashingSettings())
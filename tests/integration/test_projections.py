@@ -0,0 +1,94 @@
+from your_domain.application.use_cases.register_user import RegisterUser, RegisterUserInput
+from your_domain.infrastructure.projections import (
+    InMemoryCheckpointStore,
+    ProjectionRunner,
+    SqlCheckpointStore,
+    UserProfileSummaryProjection,
+)
+from your_domain.infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+class FlakyProjection(UserProfileSummaryProjection):
+    name = "flaky"
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    def apply(self, event):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("read store unavailable")
+        super().apply(event)
+
+
+def record(session_factory, events):
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        for event in events:
+            uow.outbox.add(event)
+
+
+def test_runner_applies_new_events_from_the_checkpoint_and_rebuilds(session_factory, make_event):
+    events = [make_event(f"user{i}@example.com") for i in range(5)]
+    record(session_factory, events[:3])
+    projection = UserProfileSummaryProjection()
+    checkpoints = SqlCheckpointStore(session_factory)
+    runner = ProjectionRunner(session_factory, [projection], checkpoints, batch_size=2)
+
+    assert runner.catch_up() == 3
+    assert checkpoints.load(projection.name) == 3
+    record(session_factory, events[3:])
+    assert runner.catch_up() == 2
+    assert runner.catch_up() == 0
+
+    assert len(projection) == 5
+    assert projection.get(events[4].user_id).email == "user4@example.com"
+    assert projection.get_by_email("USER0@example.com").user_id == events[0].user_id
+
+    rebuilt = UserProfileSummaryProjection()
+    assert runner.rebuild(rebuilt) == 5
+    assert len(rebuilt) == 5
+
+
+def test_registrations_reach_the_projection(session_factory):
+    user = RegisterUser(SqlAlchemyUnitOfWork(session_factory)).execute(
+        RegisterUserInput(email="alice@example.com", plain_text_password="secret-password")
+    )
+    projection = UserProfileSummaryProjection()
+    checkpoints = InMemoryCheckpointStore()
+
+    assert ProjectionRunner(session_factory, [projection], checkpoints).catch_up() == 1
+
+    assert projection.get(user.id).email == "alice@example.com"
+    assert checkpoints.load(projection.name) == 1
+
+
+def test_checkpoint_stays_before_events_that_failed_to_apply(session_factory, make_event):
+    events = [make_event(f"user{i}@example.com") for i in range(3)]
+    record(session_factory, events)
+    healthy, flaky = UserProfileSummaryProjection(), FlakyProjection(failures=1)
+    checkpoints = InMemoryCheckpointStore()
+    runner = ProjectionRunner(session_factory, [healthy, flaky], checkpoints, batch_size=3)
+
+    assert runner.run_once() == 3
+    assert checkpoints.load(healthy.name) == 3
+    assert checkpoints.load(flaky.name) == 0
+    assert len(flaky) == 0
+
+    assert runner.run_once() == 3
+    assert checkpoints.load(flaky.name) == 3
+    assert len(flaky) == 3
+
+
+def test_a_stalled_projection_does_not_hold_back_the_others(session_factory, make_event):
+    events = [make_event(f"user{i}@example.com") for i in range(6)]
+    record(session_factory, events)
+    healthy, stalled = UserProfileSummaryProjection(), FlakyProjection(failures=1_000)
+    checkpoints = InMemoryCheckpointStore()
+    runner = ProjectionRunner(session_factory, [healthy, stalled], checkpoints, batch_size=2)
+
+    runner.catch_up()
+
+    assert checkpoints.load(healthy.name) == 6
+    assert len(healthy) == 6
+    assert checkpoints.load(stalled.name) == 0
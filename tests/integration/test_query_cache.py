@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+from your_domain.infrastructure.cache import TTLCache
+from your_domain.infrastructure.cqrs import GetUserQuery, QueryHandler
+from your_domain.infrastructure.event_bus import Event, SimpleEventBus
+from your_domain.infrastructure.query_cache import CachedQueryHandler, QueryCache, QueryCacheInvalidator
+
+
+class UserUpdated(Event):
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+
+
+class CountingHandler(QueryHandler[dict]):
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+
+    def handle(self, query: GetUserQuery) -> dict:
+        self.calls += 1
+        time.sleep(self.delay)
+        return {"id": query.user_id, "version": self.calls}
+
+
+def user_tags(query, result):
+    return [f"user:{query.user_id}"]
+
+
+def test_results_are_cached_per_query_fields_until_invalidated_by_an_event():
+    inner = CountingHandler()
+    cache = QueryCache()
+    handler = CachedQueryHandler(inner, cache, ttl=60, tags=user_tags)
+    bus = SimpleEventBus()
+    bus.subscribe(UserUpdated, QueryCacheInvalidator(cache, lambda event: [f"user:{event.user_id}"]))
+
+    assert handler.handle(GetUserQuery(1)) == {"id": 1, "version": 1}
+    assert handler.handle(GetUserQuery(1)) == {"id": 1, "version": 1}
+    assert handler.handle(GetUserQuery(2))["id"] == 2
+    bus.publish(UserUpdated(1))
+    assert handler.handle(GetUserQuery(1))["version"] == 3
+    assert handler.handle(GetUserQuery(2))["version"] == 2
+    assert inner.calls == 3
+
+
+def test_concurrent_identical_queries_run_the_handler_once():
+    inner = CountingHandler(delay=0.1)
+    handler = CachedQueryHandler(inner, QueryCache())
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(handler.handle(GetUserQuery(7)))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert inner.calls == 1
+    assert len(results) == 8
+
+
+def test_invalidations_reach_every_process_sharing_the_backend():
+    backend = TTLCache()
+    inner = CountingHandler()
+    here = CachedQueryHandler(inner, QueryCache(backend), tags=user_tags)
+    elsewhere = QueryCache(backend)
+
+    here.handle(GetUserQuery(1))
+    here.handle(GetUserQuery(2))
+    elsewhere.invalidate("user:1")
+
+    assert here.handle(GetUserQuery(1))["version"] == 3
+    assert here.handle(GetUserQuery(2))["version"] == 2
+
+
+def test_result_computed_across_an_invalidation_is_not_stored():
+    inner = CountingHandler(delay=0.1)
+    cache = QueryCache()
+    handler = CachedQueryHandler(inner, cache, tags=user_tags)
+
+    slow = threading.Thread(target=handler.handle, args=(GetUserQuery(1),))
+    slow.start()
+    time.sleep(0.05)
+    cache.invalidate("user:1")
+    slow.join()
+
+    assert handler.handle(GetUserQuery(1))["version"] == 2
+    assert handler.handle(GetUserQuery(1))["version"] == 2
+
+
+def test_evicted_tag_versions_never_revive_entries():
+    backend = TTLCache(max_size=3)
+    inner = CountingHandler()
+    handler = CachedQueryHandler(inner, QueryCache(backend), tags=user_tags)
+
+    # Each query stores an entry and a tag version, so older ones are evicted
+    for user_id in range(10):
+        handler.handle(GetUserQuery(user_id))
+
+    assert handler.handle(GetUserQuery(0))["version"] == 11
+
+
+def test_entries_outlive_the_backend_default_ttl():
+    inner = CountingHandler()
+    handler = CachedQueryHandler(inner, QueryCache(TTLCache(default_ttl=0.05)), ttl=3600, tags=user_tags)
+
+    handler.handle(GetUserQuery(1))
+    time.sleep(0.1)
+
+    assert handler.handle(GetUserQuery(1))["version"] == 1
+    assert inner.calls == 1
+
+
+def test_handler_ttl_cannot_exceed_the_tag_ttl():
+    with pytest.raises(ValueError):
+        CachedQueryHandler(CountingHandler(), QueryCache(tag_ttl=60), ttl=120)
@@ -0,0 +1,20 @@
+import asyncio
+
+import pytest
+
+from your_domain.application.use_cases.register_user import RegisterUser, RegisterUserInput
+from your_domain.infrastructure.repositories.in_memory_user_mgmt import InMemoryUnitOfWork
+
+
+def test_duplicate_registrations_are_rejected_before_hashing(hashes):
+    register = RegisterUser(InMemoryUnitOfWork())
+    attempt = RegisterUserInput(email="alice@example.com", plain_text_password="secret-password")
+    register.execute(attempt)
+    assert len(hashes) == 1
+
+    with pytest.raises(ValueError, match="already exists"):
+        register.execute(attempt)
+    with pytest.raises(ValueError, match="already exists"):
+        asyncio.run(register.execute_async(attempt))
+
+    assert len(hashes) == 1
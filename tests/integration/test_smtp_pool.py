@@ -0,0 +1,123 @@
+import socket
+from email.message import EmailMessage
+
+import pytest
+
+from your_domain.application.interfaces.email_service import EmailBatchError, OutboundEmail
+from your_domain.domain.services.email_service import EmailService, SMTPSettings
+from your_domain.infrastructure.smtp_pool import SMTPConnectionPool
+
+aiosmtpd = pytest.importorskip("aiosmtpd.controller")
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.sessions = set()
+        self.recipients = []
+        self.rejected = set()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address in self.rejected:
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.sessions.add(id(session))
+        self.recipients.extend(envelope.rcpt_tos)
+        return "250 OK"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = aiosmtpd.Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+
+def make_message(to: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "noreply@example.com"
+    message["To"] = to
+    message["Subject"] = "Hello"
+    message.set_content("Hello")
+    return message
+
+
+def make_pool(controller, **kwargs) -> SMTPConnectionPool:
+    return SMTPConnectionPool(controller.hostname, controller.port, use_tls=False, **kwargs)
+
+
+def test_sends_reuse_one_session(smtp_server):
+    controller, handler = smtp_server
+    pool = make_pool(controller)
+
+    for i in range(5):
+        pool.send(make_message(f"user{i}@example.com"))
+    pool.close()
+
+    assert len(handler.recipients) == 5
+    assert len(handler.sessions) == 1
+    assert pool.stats.connections_opened == 1
+
+
+def test_sessions_are_recycled_after_max_messages(smtp_server):
+    controller, handler = smtp_server
+    pool = make_pool(controller, max_messages_per_connection=2)
+
+    sent = pool.send_many([make_message(f"user{i}@example.com") for i in range(5)])
+    pool.close()
+
+    assert sent == 5
+    assert len(handler.recipients) == 5
+    assert pool.stats.connections_opened == 3
+    assert pool.stats.connections_recycled == 2
+
+
+def make_service(controller, pool=None) -> EmailService:
+    settings = SMTPSettings(
+        smtp_server=controller.hostname,
+        smtp_port=controller.port,
+        smtp_username="",
+        smtp_password="",
+        use_tls=False,
+        from_email="noreply@example.com",
+        smtp_max_messages_per_connection=2,
+    )
+    return EmailService(settings, pool=pool if pool is not None else SMTPConnectionPool.from_settings(settings))
+
+
+def test_email_service_sends_a_batch_over_the_pool(smtp_server):
+    controller, handler = smtp_server
+    service = make_service(controller)
+    emails = [OutboundEmail(to_email=f"user{i}@example.com", subject="Hello", body="Hello") for i in range(5)]
+
+    assert service.send_many(emails) == 5
+    service.pool.close()
+
+    assert handler.recipients == [email.to_email for email in emails]
+    assert service.pool.stats.connections_opened == 3
+
+
+def test_email_service_without_a_pool_reports_partial_batches(smtp_server):
+    controller, handler = smtp_server
+    handler.rejected.add("gone@example.com")
+    service = EmailService(make_service(controller).settings)
+    emails = [
+        OutboundEmail(to_email="user0@example.com", subject="Hello", body="Hello"),
+        OutboundEmail(to_email="gone@example.com", subject="Hello", body="Hello"),
+    ]
+
+    with pytest.raises(EmailBatchError) as raised:
+        service.send_many(emails)
+
+    assert raised.value.sent == 1
+    assert handler.recipients == ["user0@example.com"]
@@ -0,0 +1,34 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from your_domain.application.use_cases.register_user import RegisterUser, RegisterUserInput
+from your_domain.application.use_cases.update_user_profile import UpdateUserProfile, UpdateUserProfileInput
+from your_domain.infrastructure.repositories.in_memory_user_mgmt import InMemoryUnitOfWork
+
+
+def test_unknown_users_are_rejected_before_hashing(hashes):
+    update = UpdateUserProfile(InMemoryUnitOfWork())
+    attempt = UpdateUserProfileInput(user_id=uuid4(), new_plain_text_password="new-password")
+
+    with pytest.raises(ValueError, match="User not found"):
+        update.execute(attempt)
+    with pytest.raises(ValueError, match="User not found"):
+        asyncio.run(update.execute_async(attempt))
+
+    assert hashes == []
+
+
+def test_password_change_hashes_once(hashes):
+    uow = InMemoryUnitOfWork()
+    user = RegisterUser(uow).execute(
+        RegisterUserInput(email="alice@example.com", plain_text_password="secret-password")
+    )
+
+    updated = UpdateUserProfile(uow).execute(
+        UpdateUserProfileInput(user_id=user.id, new_plain_text_password="new-password")
+    )
+
+    assert len(hashes) == 2
+    assert updated.password_hash.verify("new-password")
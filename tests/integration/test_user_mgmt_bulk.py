@@ -0,0 +1,101 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from your_domain.application.interfaces.user_mgmt import DuplicateUserError
+from your_domain.domain.value_objects.email import Email
+from your_domain.infrastructure.orm import Base
+from your_domain.infrastructure.repositories import user_mgmt
+from your_domain.infrastructure.repositories.user_mgmt import UserMgmtRepository
+from your_domain.infrastructure.uow import SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+    event.listen(engine, "before_cursor_execute", lambda *args: executed.append(args[2]))
+    return executed
+
+
+def test_add_many_uses_one_statement_and_one_commit(engine, statements, make_user):
+    users = [make_user(f"user{i}@example.com") for i in range(50)]
+    session_factory = sessionmaker(bind=engine)
+    commits = []
+    event.listen(session_factory, "after_commit", lambda s: commits.append(s))
+
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        uow.users.add_many(users)
+
+    inserts = [statement for statement in statements if statement.startswith("INSERT")]
+    assert len(inserts) == 1
+    assert len(commits) == 1
+    assert len(UserMgmtRepository(Session(engine)).find_by_ids(user.id for user in users)) == 50
+
+
+def test_find_by_ids_chunks_in_queries(engine, statements, monkeypatch, make_user):
+    users = [make_user(f"user{i}@example.com") for i in range(5)]
+    repository = UserMgmtRepository(Session(engine))
+    repository.add_many(users)
+    monkeypatch.setattr(user_mgmt, "IN_CLAUSE_CHUNK_SIZE", 2)
+    statements.clear()
+
+    found = repository.find_by_ids([user.id for user in users] + [users[0].id])
+
+    assert set(found) == {user.id for user in users}
+    assert len([statement for statement in statements if statement.startswith("SELECT")]) == 3
+
+
+def test_find_by_emails_omits_unknown_addresses(engine, make_user):
+    users = [make_user("a@example.com"), make_user("b@example.com")]
+    repository = UserMgmtRepository(Session(engine))
+    repository.add_many(users)
+
+    found = repository.find_by_emails([Email(address="a@example.com"), Email(address="missing@example.com")])
+
+    assert list(found) == [Email(address="a@example.com")]
+    assert found[Email(address="a@example.com")].id == users[0].id
+
+
+def test_keyset_pages_cover_every_user_once(engine, statements, make_user):
+    users = [make_user(f"user{i}@example.com") for i in range(7)]
+    with Session(engine) as session:
+        assert list(UserMgmtRepository(session).iter_all()) == []
+        UserMgmtRepository(session).add_many(users)
+        session.commit()
+    expected = sorted(user.id for user in users)
+
+    with Session(engine) as session:
+        repository = UserMgmtRepository(session)
+        first = repository.list_page(limit=3)
+        second = repository.list_page(first[-1].id, limit=3)
+        last = repository.list_page(second[-1].id, limit=3)
+        assert [user.id for user in first + second + last] == expected
+        assert len(last) == 1
+        assert repository.list_page(last[-1].id, limit=3) == []
+
+        del statements[:]
+        assert [user.id for user in repository.iter_all(batch_size=7)] == expected
+        # A full final page costs one more query to find the end
+        assert len(statements) == 2
+        assert [user.id for user in repository.iter_all(batch_size=3)] == expected
+
+
+def test_add_many_rejects_taken_emails_like_add(engine, make_user):
+    session_factory = sessionmaker(bind=engine)
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        uow.users.add(make_user("alice@example.com"))
+
+    with pytest.raises(DuplicateUserError):
+        with SqlAlchemyUnitOfWork(session_factory) as uow:
+            uow.users.add_many([make_user("bob@example.com"), make_user("alice@example.com")])
+
+    with Session(engine) as session:
+        assert UserMgmtRepository(session).find_by_email(Email(address="bob@example.com")) is None
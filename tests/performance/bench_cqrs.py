@@ -0,0 +1,58 @@
+"""
+Benchmark: CommandBus dispatch overhead compared with calling the handler directly.
+
+Run with:
+    python tests/performance/bench_cqrs.py --messages 1000000 --types 100
+"""
+import argparse
+import time
+
+from your_domain.infrastructure.cqrs import Command, CommandBus, CommandHandler, RetryMiddleware, TimingMiddleware
+
+
+class NoopHandler(CommandHandler[Command]):
+    def handle(self, command: Command) -> None:
+        return None
+
+
+def passthrough(message, next_step):
+    return next_step(message)
+
+
+def measure(call, message, messages: int) -> float:
+    started = time.perf_counter()
+    for _ in range(messages):
+        call(message)
+    return (time.perf_counter() - started) / messages * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--types", type=int, default=100, help="registered command types")
+    args = parser.parse_args()
+
+    command_types = [type(f"Command{i}", (Command,), {}) for i in range(args.types)]
+    handler = NoopHandler()
+    message = command_types[-1]()
+    configurations = {
+        "direct call": None,
+        "bus, no middleware": [],
+        "bus, passthrough x3": [passthrough] * 3,
+        "bus, timing + retry": [TimingMiddleware(), RetryMiddleware()],
+    }
+
+    print(f"{'configuration':<24}{'ns/dispatch':>14}")
+    for name, middlewares in configurations.items():
+        if middlewares is None:
+            call = handler.handle
+        else:
+            bus = CommandBus(middlewares)
+            for command_type in command_types:
+                bus.register(command_type, handler)
+            call = bus.dispatch
+        print(f"{name:<24}{measure(call, message, args.messages):>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
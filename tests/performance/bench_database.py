@@ -0,0 +1,114 @@
+"""
+Benchmark: UserMgmtRepository throughput with the default engine vs the DatabaseSettings profile.
+
+Reader threads look users up by id while writer threads insert new users, each
+operation in its own unit of work, against a file-backed SQLite database.
+
+Run with:
+    python tests/performance/bench_database.py --seconds 5 --readers 8 --writers 2
+"""
+import argparse
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from your_domain.domain.entities.user import User
+from your_domain.domain.value_objects.email import Email
+from your_domain.domain.value_objects.password_hash import PasswordHash
+from your_domain.infrastructure.database import DatabaseSettings, create_db_engine
+from your_domain.infrastructure.orm import Base
+from your_domain.infrastructure.uow import SqlAlchemyUnitOfWork
+
+PASSWORD_HASH = PasswordHash(hashed_password=b"$2b$04$benchmark")
+
+
+def make_user() -> User:
+    return User(email=Email(address=f"{uuid4().hex}@example.com"), password_hash=PASSWORD_HASH)
+
+
+def legacy_engine(url: str):
+    # The configuration infrastructure/database.py used before DatabaseSettings existed
+    return create_engine(url, connect_args={"check_same_thread": False})
+
+
+def run(engine, seconds: float, readers: int, writers: int, seed_users: int) -> dict:
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    seed = [make_user() for _ in range(seed_users)]
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        uow.users.add_many(seed)
+    ids = [user.id for user in seed]
+
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def reader() -> None:
+        done = errors = 0
+        while time.perf_counter() < deadline:
+            try:
+                with SqlAlchemyUnitOfWork(session_factory) as uow:
+                    uow.users.find_by_id(random.choice(ids))
+                done += 1
+            except OperationalError:
+                errors += 1
+        with lock:
+            counts["reads"] += done
+            counts["errors"] += errors
+
+    def writer() -> None:
+        done = errors = 0
+        while time.perf_counter() < deadline:
+            try:
+                with SqlAlchemyUnitOfWork(session_factory) as uow:
+                    uow.users.add(make_user())
+                done += 1
+            except OperationalError:
+                errors += 1
+        with lock:
+            counts["writes"] += done
+            counts["errors"] += errors
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+    return {key: value / seconds if key != "errors" else value for key, value in counts.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seed-users", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        legacy_url = f"sqlite:///{Path(directory) / 'legacy.db'}"
+        tuned_url = f"sqlite:///{Path(directory) / 'tuned.db'}"
+        results = {
+            "default engine": run(legacy_engine(legacy_url), args.seconds, args.readers, args.writers, args.seed_users),
+            "DatabaseSettings": run(
+                create_db_engine(DatabaseSettings(database_url=tuned_url)),
+                args.seconds, args.readers, args.writers, args.seed_users,
+            ),
+        }
+
+    print(f"{'configuration':<18}{'reads/s':>12}{'writes/s':>12}{'errors':>10}")
+    for name, result in results.items():
+        print(f"{name:<18}{result['reads']:>12.0f}{result['writes']:>12.0f}{result['errors']:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Micro-benchmark: per-token cost of AuthService.generate_jwt_token vs generate_jwt_tokens.
+
+Run with:
+    python tests/performance/bench_jwt_tokens.py --users 10000
+"""
+import argparse
+import time
+from uuid import uuid4
+
+from your_domain.domain.entities.user import User
+from your_domain.domain.services.auth_service import AuthService, JWTSettings
+from your_domain.domain.value_objects.email import Email
+from your_domain.domain.value_objects.password_hash import PasswordHash
+
+
+def make_users(count: int) -> list:
+    # Only the id is signed, so skip BCrypt and build the users directly.
+    password_hash = PasswordHash(hashed_password=b"unused")
+    return [
+        User(id=uuid4(), email=Email(address=f"user{i}@example.com"), password_hash=password_hash)
+        for i in range(count)
+    ]
+
+
+def best_of(repeats: int, func) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    service = AuthService(JWTSettings(jwt_secret="benchmark-secret-benchmark-secret-0123"))
+    users = make_users(args.users)
+
+    single = best_of(args.repeats, lambda: [service.generate_jwt_token(user) for user in users])
+    batch = best_of(args.repeats, lambda: service.generate_jwt_tokens(users))
+
+    print(f"tokens per run:       {args.users}")
+    print(f"generate_jwt_token:   {single / args.users * 1e6:8.2f} us/token")
+    print(f"generate_jwt_tokens:  {batch / args.users * 1e6:8.2f} us/token")
+    print(f"speedup:              {single / batch:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Benchmark suite: every user use case and the main repository reads, against the
+in-memory repository and a SQLite database, at several dataset sizes.
+
+Each scenario reports ops/sec and p50/p99 latency. Results are compared with a
+JSON baseline and the run exits with status 1 if any scenario is slower than the
+baseline by more than the threshold. Pass --update-baseline to record a new one;
+baselines are machine specific, so record them on the machine that compares.
+
+Run with:
+    python tests/performance/bench_use_cases.py --sizes 1000 10000 --iterations 200
+    python tests/performance/bench_use_cases.py --update-baseline
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from sqlalchemy.orm import sessionmaker
+
+from your_domain.application.uow import AbstractUnitOfWork
+from your_domain.application.use_cases.authenticate_user import AuthenticateUser, AuthenticateUserInput
+from your_domain.application.use_cases.delete_user import DeleteUser, DeleteUserInput
+from your_domain.application.use_cases.register_user import RegisterUser, RegisterUserInput
+from your_domain.application.use_cases.update_user_profile import UpdateUserProfile, UpdateUserProfileInput
+from your_domain.domain.entities.user import User
+from your_domain.domain.value_objects.email import Email
+from your_domain.domain.value_objects.password_hash import PasswordHash, PasswordHashingSettings, configure_hashing_pool
+from your_domain.infrastructure.database import DatabaseSettings, create_db_engine
+from your_domain.infrastructure.orm import Base
+from your_domain.infrastructure.repositories.in_memory_user_mgmt import InMemoryUnitOfWork
+from your_domain.infrastructure.uow import SqlAlchemyUnitOfWork
+
+PASSWORD = "correct horse battery staple"
+DEFAULT_BASELINE = Path(__file__).with_name("baseline_use_cases.json")
+
+
+class StaticTokens:
+    # Token signing is measured separately by bench_jwt_tokens.py
+    def generate_jwt_token(self, user: User) -> str:
+        return "token"
+
+
+def memory_backend(directory: Path, size: int) -> AbstractUnitOfWork:
+    return InMemoryUnitOfWork()
+
+
+def sqlite_backend(directory: Path, size: int) -> AbstractUnitOfWork:
+    engine = create_db_engine(DatabaseSettings(database_url=f"sqlite:///{directory / f'users-{size}.db'}"))
+    Base.metadata.create_all(engine)
+    return SqlAlchemyUnitOfWork(sessionmaker(autocommit=False, autoflush=False, bind=engine))
+
+
+BACKENDS: Dict[str, Callable[[Path, int], AbstractUnitOfWork]] = {"memory": memory_backend, "sqlite": sqlite_backend}
+
+
+def seed(uow: AbstractUnitOfWork, size: int) -> List[User]:
+    password_hash = PasswordHash.create(PASSWORD)
+    users = [User(email=Email.from_string(f"user{i}@example.com"), password_hash=password_hash) for i in range(size)]
+    with uow:
+        uow.users.add_many(users)
+    return users
+
+
+def scenarios(uow: AbstractUnitOfWork, users: List[User]) -> Dict[str, Callable[[int], object]]:
+    register, authenticate = RegisterUser(uow), AuthenticateUser(uow, StaticTokens())
+    update, delete = UpdateUserProfile(uow), DeleteUser(uow)
+
+    def find_by_id(i: int) -> object:
+        with uow:
+            user = uow.users.find_by_id(users[i % len(users)].id)
+        assert user is not None, "find_by_id missed a seeded user"
+        return user
+
+    def find_by_email(i: int) -> object:
+        with uow:
+            user = uow.users.find_by_email(users[i % len(users)].email)
+        assert user is not None, "find_by_email missed a seeded user"
+        return user
+
+    # Run in order: reads first, while every seeded user still has its original email,
+    # then the scenarios that change data
+    return {
+        "repository.find_by_id": find_by_id,
+        "repository.find_by_email": find_by_email,
+        "authenticate": lambda i: authenticate.execute(
+            AuthenticateUserInput(email=f"user{i % len(users)}@example.com", plain_text_password=PASSWORD)
+        ),
+        "register": lambda i: register.execute(
+            RegisterUserInput(email=f"new{i}@example.com", plain_text_password=PASSWORD)
+        ),
+        "update_profile": lambda i: update.execute(
+            UpdateUserProfileInput(user_id=users[i % len(users)].id, new_email=f"renamed{i}@example.com")
+        ),
+        # Soft-deletes users from the end of the list, away from the ones renamed above
+        "delete": lambda i: delete.execute(DeleteUserInput(user_id=users[-1 - i % len(users)].id)),
+    }
+
+
+def measure(operation: Callable[[int], object], iterations: int) -> Dict[str, float]:
+    latencies = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        operation(i)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return {
+        "ops_per_sec": iterations / sum(latencies),
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+def run(sizes: List[int], iterations: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for backend, make_uow in BACKENDS.items():
+            for size in sizes:
+                uow = make_uow(Path(directory), size)
+                users = seed(uow, size)
+                for name, operation in scenarios(uow, users).items():
+                    results[f"{backend}/{size}/{name}"] = measure(operation, min(iterations, size))
+    return results
+
+
+def regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+    min_p99_delta_ms: float,
+) -> List[str]:
+    found = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        if result["ops_per_sec"] < previous["ops_per_sec"] * (1 - threshold):
+            found.append(f"{key}: {result['ops_per_sec']:.0f} ops/s vs baseline {previous['ops_per_sec']:.0f}")
+        # Sub-millisecond tails are mostly scheduler noise; only flag changes above an absolute floor
+        slower = result["p99_ms"] > previous["p99_ms"] * (1 + threshold)
+        if slower and result["p99_ms"] - previous["p99_ms"] > min_p99_delta_ms:
+            found.append(f"{key}: p99 {result['p99_ms']:.2f} ms vs baseline {previous['p99_ms']:.2f}")
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--bcrypt-rounds", type=int, default=4, help="cost factor used for hashes created during the run"
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed fractional regression")
+    parser.add_argument("--min-p99-delta-ms", type=float, default=0.5, help="ignore p99 increases smaller than this")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    # Production cost (12 rounds) would make every hashing scenario measure BCrypt alone
+    configure_hashing_pool(PasswordHashingSettings(bcrypt_rounds=args.bcrypt_rounds))
+
+    results = run(args.sizes, args.iterations)
+    print(f"{'scenario':<40}{'ops/s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+    for key, result in results.items():
+        print(f"{key:<40}{result['ops_per_sec']:>12.0f}{result['p50_ms']:>10.3f}{result['p99_ms']:>10.3f}")
+
+    if args.update_baseline or not args.baseline.exists():
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True))
+        print(f"Baseline written to {args.baseline}")
+        return
+    found = regressions(results, json.loads(args.baseline.read_text()), args.threshold, args.min_p99_delta_ms)
+    if found:
+        print(f"Regressions beyond {args.threshold:.0%}:")
+        for line in found:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import hashlib
+import time
+from uuid import uuid4
+
+import jwt
+
+from your_domain.domain.entities.user import User
+from your_domain.domain.services import auth_service
+from your_domain.domain.services.auth_service import AuthService, JWTSettings
+from your_domain.domain.value_objects.email import Email
+from your_domain.domain.value_objects.password_hash import PasswordHash
+
+SECRET = "test-secret-test-secret-test-secret-0123"
+
+
+def make_users(count: int) -> list:
+    # Only the id is signed, so skip BCrypt
+    password_hash = PasswordHash(hashed_password=b"unused")
+    return [
+        User(id=uuid4(), email=Email(address=f"user{i}@example.com"), password_hash=password_hash)
+        for i in range(count)
+    ]
+
+
+def test_batch_tokens_match_jwt_encode_byte_for_byte():
+    for algorithm in ("HS256", "HS384", "HS512"):
+        service = AuthService(JWTSettings(jwt_secret=SECRET, jwt_algorithm=algorithm))
+        users = make_users(3)
+
+        tokens = service.generate_jwt_tokens(users)
+
+        for user, token in zip(users, tokens):
+            claims = jwt.decode(token, SECRET, algorithms=[algorithm])
+            assert claims["user_id"] == str(user.id)
+            assert jwt.get_unverified_header(token) == {"alg": algorithm, "typ": "JWT"}
+            expected = jwt.encode(
+                {"user_id": claims["user_id"], "exp": claims["exp"], "iat": claims["iat"]}, SECRET, algorithm=algorithm
+            )
+            assert token == expected
+
+
+def test_batch_tokens_decode_like_single_tokens():
+    service = AuthService(JWTSettings(jwt_secret=SECRET))
+    user = make_users(1)[0]
+
+    single = service.decode_token(service.generate_jwt_token(user))
+    batch = service.decode_token(service.generate_jwt_tokens([user])[0])
+
+    assert single.keys() == batch.keys() == {"user_id", "exp", "iat"}
+    assert batch["user_id"] == single["user_id"]
+    assert batch["exp"] - batch["iat"] == single["exp"] - single["iat"]
+
+
+def test_decode_serves_repeated_tokens_from_the_claims_cache(monkeypatch):
+    service = AuthService(JWTSettings(jwt_secret=SECRET))
+    token = service.generate_jwt_token(make_users(1)[0])
+    decode = jwt.decode
+    calls = []
+    monkeypatch.setattr(jwt, "decode", lambda *args, **kwargs: calls.append(1) or decode(*args, **kwargs))
+
+    first = service.decode_token(token)
+    first["user_id"] = "mutated by the caller"
+    second = service.decode_token(token)
+
+    assert len(calls) == 1
+    assert second["user_id"] != "mutated by the caller"
+
+
+def test_cached_claims_expire_with_the_token(monkeypatch):
+    service = AuthService(JWTSettings(jwt_secret=SECRET))
+    token = service.generate_jwt_token(make_users(1)[0])
+    expires_at = service.decode_token(token)["exp"]
+
+    monkeypatch.setattr(auth_service.time, "time", lambda: expires_at + 1)
+
+    assert service._claims_cache.get(hashlib.sha256(token.encode("utf-8")).digest()) is None
+
+
+def test_invalid_tokens_are_never_cached():
+    service = AuthService(JWTSettings(jwt_secret=SECRET))
+    user = make_users(1)[0]
+    token = service.generate_jwt_token(user)
+    assert service.decode_token(token) is not None
+
+    header, payload, signature = token.split(".")
+    tampered = ".".join((header, payload, signature[:-2] + ("AA" if signature[-2:] != "AA" else "BB")))
+    expired = jwt.encode({"user_id": str(user.id), "exp": int(time.time()) - 10}, SECRET, algorithm="HS256")
+    forged = jwt.encode(
+        {"user_id": str(user.id), "exp": int(time.time()) + 60}, "another-secret-another-secret-012", algorithm="HS256"
+    )
+
+    for bad in (tampered, expired, forged):
+        assert service.decode_token(bad) is None
+        assert service.decode_token(bad) is None
+    assert len(service._claims_cache._entries) == 1
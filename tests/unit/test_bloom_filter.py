@@ -0,0 +1,28 @@
+import pytest
+
+from your_domain.infrastructure.bloom_filter import BloomFilter
+
+
+def test_added_items_are_always_reported():
+    bloom = BloomFilter(capacity=1_000)
+    items = [f"user{i}@example.com" for i in range(1_000)]
+    bloom.update(items)
+
+    assert all(item in bloom for item in items)
+    assert bloom.count == 1_000
+
+
+def test_false_positive_rate_stays_near_the_target_at_capacity():
+    bloom = BloomFilter(capacity=5_000, false_positive_rate=0.01)
+    bloom.update(f"user{i}@example.com" for i in range(5_000))
+
+    false_positives = sum(bloom.might_contain(f"other{i}@example.com") for i in range(20_000))
+
+    assert false_positives / 20_000 < 0.02
+
+
+def test_rejects_invalid_sizing():
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=0)
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=10, false_positive_rate=1.0)
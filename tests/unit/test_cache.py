@@ -0,0 +1,61 @@
+from your_domain.infrastructure import cache as cache_module
+from your_domain.infrastructure.cache import TTLCache
+from your_domain.infrastructure.repositories.cached_user_mgmt import UserCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = TTLCache(default_ttl=10.0)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=60.0)
+
+    now[0] += 9.0
+    assert cache.get("a") == 1
+    now[0] += 1.0
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+    assert (cache.stats.hits, cache.stats.misses) == (3, 1)
+
+
+def test_user_cache_serves_copies_by_id_and_email(make_user):
+    users = UserCache()
+    user = make_user("alice@example.com")
+    users.put(user)
+
+    cached = users.get_by_id(user.id)
+    assert cached == user and cached is not user
+    assert users.get_by_email(user.email).id == user.id
+
+    users.invalidate(user.id)
+    assert users.get_by_id(user.id) is None
+    assert users.get_by_email(user.email) is None
+
+
+def test_user_cache_drops_a_read_that_raced_an_invalidation(make_user):
+    users = UserCache()
+    user = make_user("alice@example.com")
+    versions = users.versions(user_ids=[user.id])
+
+    # Another unit of work commits a change between the read and the put
+    users.invalidate(user.id, str(user.email.address))
+    users.put(user, versions)
+
+    assert users.get_by_id(user.id) is None
+    assert users.get_by_email(user.email) is None
+
+    users.put(user, users.versions(user_ids=[user.id]))
+    assert users.get_by_id(user.id) == user
@@ -0,0 +1,19 @@
+import pytest
+from pydantic import ValidationError
+
+from your_domain.domain.value_objects.email import Email
+
+
+def test_from_string_returns_one_canonical_instance_per_address():
+    first = Email.from_string("Alice@Example.COM")
+
+    assert Email.from_string("Alice@example.com") is first
+    assert str(first) == "Alice@example.com"
+    assert first == Email(address="Alice@example.com")
+    assert Email.from_string("alice@example.com") != first
+
+
+def test_from_string_rejects_invalid_addresses_every_time():
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            Email.from_string("not-an-email")
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+
+import pytest
+
+from your_domain.domain.value_objects.password_hash import (
+    HashingPoolSaturatedError,
+    PasswordHash,
+    PasswordHashingPool,
+    PasswordHashingSettings,
+    configure_hashing_pool,
+)
+
+
+@pytest.fixture(autouse=True)
+def cheap_hashing_pool():
+    configure_hashing_pool(PasswordHashingSettings(bcrypt_rounds=4, hashing_max_workers=2))
+    yield
+    configure_hashing_pool(PasswordHashingSettings())
+
+
+def test_async_hashes_verify_like_sync_ones():
+    async def scenario():
+        created = await PasswordHash.create_async("secret")
+        return created, await created.verify_async("secret"), await created.verify_async("wrong")
+
+    created, right, wrong = asyncio.run(scenario())
+
+    assert (right, wrong) == (True, False)
+    assert created.verify("secret")
+    assert PasswordHash.create("secret").verify("secret")
+
+
+def test_the_pool_works_across_event_loops():
+    pool = PasswordHashingPool(PasswordHashingSettings(hashing_max_workers=1, hashing_max_pending=1))
+
+    async def contended():
+        # Two jobs for one slot make the second wait, which binds asyncio primitives to the loop
+        return await asyncio.gather(pool.run(sum, [1, 2]), pool.run(sum, [3, 4]))
+
+    try:
+        # Each asyncio.run() creates a new loop; the pool must not stay bound to the first one
+        for _ in range(2):
+            assert asyncio.run(contended()) == [3, 7]
+    finally:
+        pool.shutdown()
+
+
+def test_saturated_pool_raises_after_the_queue_timeout():
+    pool = PasswordHashingPool(
+        PasswordHashingSettings(hashing_max_workers=1, hashing_max_pending=1, hashing_queue_timeout_seconds=0.05)
+    )
+    release = threading.Event()
+
+    async def scenario():
+        blocked = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.01)
+        try:
+            with pytest.raises(HashingPoolSaturatedError):
+                await pool.run(lambda: None)
+        finally:
+            release.set()
+        await blocked
+        # The slot is free again once the blocking job has finished
+        await pool.run(lambda: None)
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        pool.shutdown()